@@ -0,0 +1,376 @@
+"""
+Batch Module - Generate many reports, one process per ledger
+
+LEARNING OBJECTIVES:
+- Fanning work out to several processes (concurrent.futures)
+- Choosing a unit of work that is worth sending to another process
+- Measuring where time goes (per-period timings)
+
+HOW IT WORKS:
+A batch is a list of data directories and a list of periods. Each data
+directory is one job, run in its own process: it loads the ledger once
+(with lazy indexes - reports only need the rollup cube and date index),
+builds every report, and writes one file per period and output format.
+Only the small timing results travel back to the main process.
+
+Loading a ledger is the expensive part and a report read from the
+rollup cube is cheap, so the periods of one directory are never split
+across processes (each would load the whole ledger again). The
+parallelism comes from processing several directories at once: a
+batch over a single directory runs in one process, however many
+workers are allowed.
+
+A job that fails (e.g. its ledger cannot be loaded) is recorded as a
+failed result for each of its periods; the other jobs still run.
+
+USAGE:
+    results = run_batch(['data'], month_periods(2026), 'reports',
+                        formats=('text', 'json'))
+    print_batch_summary(results)
+
+    python batch.py --year 2026 --format text json --out reports data
+"""
+
+import os
+import sys
+import time
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from file_handler import FileHandler
+from transaction import TransactionManager
+from reports import ReportGenerator
+from renderers import get_renderer
+from table import Screen, Table, TEXT, COUNT
+
+
+def month_periods(year):
+    """
+    The twelve monthly periods of a year
+
+    Returns:
+        list: [('monthly', year, 1), ..., ('monthly', year, 12)]
+    """
+    return [('monthly', year, month) for month in range(1, 13)]
+
+
+def parse_period(text):
+    """
+    Parse a period written as text
+
+    FORMATS:
+    - "2026-02"  -> ('monthly', 2026, 2)
+    - "2026-Q1"  -> ('quarterly', 2026, 1)
+    - "2026"     -> ('yearly', 2026)
+
+    Args:
+        text (str): Period text
+
+    Returns:
+        tuple: Period tuple
+    """
+    text = text.strip().upper()
+    try:
+        if '-Q' in text:
+            year, quarter = text.split('-Q')
+            period = ('quarterly', int(year), int(quarter))
+            valid = 1 <= period[2] <= 4
+        elif '-' in text:
+            year, month = text.split('-')
+            period = ('monthly', int(year), int(month))
+            valid = 1 <= period[2] <= 12
+        else:
+            period = ('yearly', int(text))
+            valid = True
+    except ValueError:
+        valid = False
+    if not valid:
+        raise ValueError(f"Invalid period '{text}'. Use YYYY-MM, YYYY-QN or YYYY")
+    return period
+
+
+def period_label(period):
+    """Short label of a period, also used as the output file name"""
+    if period[0] == 'monthly':
+        return f"{period[1]}-{period[2]:02d}"
+    if period[0] == 'quarterly':
+        return f"{period[1]}-Q{period[2]}"
+    return str(period[1])
+
+
+def build_period_report(report_generator, period):
+    """
+    Build the report of one period
+
+    Args:
+        report_generator (ReportGenerator): Generator to use
+        period (tuple): Period tuple (see parse_period)
+
+    Returns:
+        Report: Built report
+    """
+    if period[0] == 'monthly':
+        return report_generator.build_monthly_report(period[2], period[1])
+    if period[0] == 'quarterly':
+        return report_generator.build_quarterly_report(period[2], period[1])
+    if period[0] == 'yearly':
+        return report_generator.build_yearly_report(period[1])
+    raise ValueError(f"Unknown period type '{period[0]}'")
+
+
+class PeriodResult:
+    """
+    Outcome of one period of one data directory
+
+    ATTRIBUTES:
+    - data_dir: Ledger the report was built from
+    - ledger: Name of its output sub-directory (see ledger_names)
+    - period: Period tuple
+    - files: Paths of the written files
+    - build_seconds: Time spent building the report
+    - write_seconds: Time spent rendering and writing all formats
+    - error: Error message, or None on success
+    """
+
+    def __init__(self, data_dir, period, files=None, build_seconds=0.0,
+                 write_seconds=0.0, error=None, ledger=None):
+        """Initialize a period result"""
+        self.data_dir = data_dir
+        self.ledger = ledger or os.path.basename(os.path.normpath(os.path.abspath(data_dir)))
+        self.period = period
+        self.files = files or []
+        self.build_seconds = build_seconds
+        self.write_seconds = write_seconds
+        self.error = error
+
+    @property
+    def seconds(self):
+        """Total time of this period"""
+        return self.build_seconds + self.write_seconds
+
+
+def ledger_names(data_dirs):
+    """
+    Output sub-directory name for each data directory
+
+    The name is the directory's own name (".../household/data" -> "data").
+    Directories that share a name get a short hash of their full path
+    added ("data-3f2a9c1e"), so their reports never overwrite each other.
+
+    Args:
+        data_dirs (list): Data directories
+
+    Returns:
+        dict: {data_dir: name}
+    """
+    paths = {data_dir: os.path.normpath(os.path.abspath(data_dir)) for data_dir in data_dirs}
+    base_names = {}
+    for path in set(paths.values()):
+        base_names.setdefault(os.path.basename(path), []).append(path)
+
+    names = {}
+    for data_dir, path in paths.items():
+        name = os.path.basename(path)
+        if len(base_names[name]) > 1:
+            name += '-' + hashlib.sha1(path.encode('utf-8')).hexdigest()[:8]
+        names[data_dir] = name
+    return names
+
+
+def _run_job(data_dir, ledger, periods, output_dir, formats):
+    """
+    Build and write the reports of one data directory (runs in a worker process)
+
+    STEP 1: Load the ledger once
+    STEP 2: Build each period's report, then render and write each format
+
+    Args:
+        data_dir (str): Data directory
+        ledger (str): Output sub-directory name (see ledger_names)
+        periods (list): Period tuples
+        output_dir (str): Directory for the generated files
+        formats (tuple): Renderer names
+
+    Returns:
+        tuple: (load_seconds, list of PeriodResult)
+    """
+    # STEP 1: Load
+    started = time.perf_counter()
+    transaction_manager = TransactionManager(FileHandler(data_dir))
+    transaction_manager.load_transactions(lazy_indexes=True)
+    report_generator = ReportGenerator(transaction_manager, cache_size=0)
+    load_seconds = time.perf_counter() - started
+
+    target_dir = os.path.join(output_dir, ledger)
+    os.makedirs(target_dir, exist_ok=True)
+    renderers = [get_renderer(name) for name in formats]
+
+    # STEP 2: Build and write
+    results = []
+    for period in periods:
+        result = PeriodResult(data_dir, period, ledger=ledger)
+        try:
+            started = time.perf_counter()
+            report = build_period_report(report_generator, period)
+            result.build_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            for renderer in renderers:
+                path = os.path.join(target_dir,
+                                    f"{period_label(period)}.{renderer.extension}")
+                with open(path, 'w', encoding='utf-8', newline='') as f:
+                    renderer.write(report, f)
+                result.files.append(path)
+            result.write_seconds = time.perf_counter() - started
+        except (ValueError, OSError) as e:
+            result.error = str(e)
+        results.append(result)
+    return load_seconds, results
+
+
+def _failed_job(data_dir, ledger, periods, error):
+    """
+    Outcome of a job that raised instead of returning
+
+    Returns:
+        tuple: (None - nothing was loaded, a failed PeriodResult per period)
+    """
+    message = f"{type(error).__name__}: {error}"
+    return None, [PeriodResult(data_dir, period, error=message, ledger=ledger)
+                  for period in periods]
+
+
+def run_batch(data_dirs, periods, output_dir, formats=('text',), workers=None):
+    """
+    Generate reports for every period of every data directory
+
+    STEP 1: Validate formats; one job per data directory
+    STEP 2: Run the jobs (in a process pool when workers > 1)
+    STEP 3: Collect the results in a stable order
+
+    Output files are written to <output_dir>/<ledger name>/<period>.<ext>,
+    e.g. reports/data/2026-02.json (see ledger_names).
+
+    Args:
+        data_dirs (list): Data directories (one ledger each)
+        periods (list): Period tuples (see parse_period)
+        output_dir (str): Directory for the generated files
+        formats (iterable): Renderer names ('text', 'json', 'csv', 'html')
+        workers (int): Number of processes (default: CPU count, 1 = no pool;
+            never more than one per data directory)
+
+    Returns:
+        tuple: (list of PeriodResult, {data_dir: load seconds} for the
+            directories that loaded)
+    """
+    # STEP 1: Jobs
+    formats = tuple(formats)
+    for name in formats:
+        get_renderer(name)
+    periods = list(dict.fromkeys(periods))
+    data_dirs = list(dict.fromkeys(data_dirs))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    names = ledger_names(data_dirs)
+    jobs = [(data_dir, names[data_dir]) for data_dir in data_dirs] if periods else []
+
+    # STEP 2: Run (a job that raises becomes failed results, not a failed batch)
+    outcomes = []
+    if workers <= 1 or len(jobs) <= 1:
+        for data_dir, ledger in jobs:
+            try:
+                outcome = _run_job(data_dir, ledger, periods, output_dir, formats)
+            except Exception as e:
+                outcome = _failed_job(data_dir, ledger, periods, e)
+            outcomes.append((data_dir, outcome))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures = {pool.submit(_run_job, data_dir, ledger, periods, output_dir, formats):
+                       (data_dir, ledger) for data_dir, ledger in jobs}
+            for future in as_completed(futures):
+                data_dir, ledger = futures[future]
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    outcome = _failed_job(data_dir, ledger, periods, e)
+                outcomes.append((data_dir, outcome))
+
+    # STEP 3: Collect
+    load_seconds = {}
+    results = []
+    for data_dir, (seconds, job_results) in outcomes:
+        if seconds is not None:
+            load_seconds[data_dir] = seconds
+        results.extend(job_results)
+    dir_order = {data_dir: i for i, data_dir in enumerate(data_dirs)}
+    period_order = {period: i for i, period in enumerate(periods)}
+    results.sort(key=lambda r: (dir_order[r.data_dir], period_order[r.period]))
+    return results, load_seconds
+
+
+SUMMARY_TABLE = Table([('Ledger', TEXT), ('Period', TEXT, 10), ('Build ms', COUNT, 10),
+                       ('Write ms', COUNT, 10), ('Files', COUNT, 6), ('Error', TEXT)],
+                      max_width=60, gap=1)
+
+
+def print_batch_summary(results, load_seconds=None):
+    """
+    Print per-period timings and totals (one write for the whole summary)
+
+    Args:
+        results (list): PeriodResult objects from run_batch
+        load_seconds (dict): Load time per data directory (optional)
+    """
+    screen = Screen(70)
+    screen.line().header("BATCH REPORTS")
+    screen.table(SUMMARY_TABLE, [
+        [result.ledger, period_label(result.period),
+         f"{result.build_seconds * 1000:.1f}", f"{result.write_seconds * 1000:.1f}",
+         len(result.files), result.error or '']
+        for result in results])
+    screen.rule()
+    if load_seconds:
+        names = ledger_names(list(load_seconds))
+        screen.lines(f"Load {names[data_dir]}: {seconds * 1000:.1f} ms"
+                     for data_dir, seconds in load_seconds.items())
+    failed = sum(1 for result in results if result.error)
+    files = sum(len(result.files) for result in results)
+    screen.line(f"Periods: {len(results)}  Files: {files}  Failed: {failed}")
+    screen.rule("=")
+    screen.flush()
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(
+        description="Generate reports for many periods (one process per data directory)")
+    parser.add_argument('data_dirs', nargs='*', default=['data'],
+                        help="Data directories (default: data)")
+    parser.add_argument('--year', type=int, help="All twelve months of this year")
+    parser.add_argument('--period', action='append', default=[],
+                        help="Period as YYYY-MM, YYYY-QN or YYYY (repeatable)")
+    parser.add_argument('--format', nargs='+', default=['text'],
+                        help="Output formats: text, json, csv, html")
+    parser.add_argument('--out', default='reports', help="Output directory")
+    parser.add_argument('--workers', type=int, help="Number of processes")
+    args = parser.parse_args(argv)
+
+    try:
+        periods = [parse_period(text) for text in args.period]
+        if args.year:
+            periods.extend(month_periods(args.year))
+        if not periods:
+            parser.error("Give --year or at least one --period")
+        results, load_seconds = run_batch(args.data_dirs, periods, args.out,
+                                          args.format, args.workers)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    print_batch_summary(results, load_seconds)
+    return 1 if any(result.error for result in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+Cash Flow Module - Daily net flow with fast running balances
+
+LEARNING OBJECTIVES:
+- Prefix sums: "total up to day X" as a single lookup
+- Fenwick trees (binary indexed trees): prefix sums that stay fast
+  while values keep changing
+- Growing an array in both directions with amortized doubling
+
+HOW IT WORKS:
+Every day gets one slot holding its net flow in cents (income minus
+expenses). A plain prefix-sum array would answer "balance on day X"
+in O(1) but every insert would have to update all later days. A
+Fenwick tree stores partial sums so that both an update and a prefix
+sum touch only about log2(days) slots - 15 slots for 80 years of days.
+
+    balance_as_of(X)       = prefix(X)
+    net_between(A, B)      = prefix(B) - prefix(A - 1)
+    running balance series = one prefix sum, then a walk over the days
+
+Transactions may arrive in any date order. When a date falls outside
+the covered days the array is doubled (forwards or backwards) and the
+tree is rebuilt in one linear pass.
+"""
+
+from datetime import date
+
+from rollup import to_cents
+
+
+_INITIAL_DAYS = 64
+
+
+def _signed_cents(transaction):
+    """Net effect of a transaction in cents (expenses are negative)"""
+    cents = to_cents(transaction.amount)
+    return cents if transaction.type == 'income' else -cents
+
+
+class CashFlowSeries:
+    """
+    Daily net cash flow backed by a Fenwick tree
+
+    STRUCTURE:
+    - _base: Day ordinal of slot 0
+    - _daily: Net cents of each day (slot i = day _base + i)
+    - _tree: Fenwick tree over _daily (1-based, _tree[0] unused)
+    """
+
+    def __init__(self):
+        """Initialize an empty series"""
+        self.clear()
+
+    def clear(self):
+        """Remove every value"""
+        self._base = None
+        self._daily = []
+        self._tree = [0]
+        self._total = 0
+
+    def _build(self):
+        """Rebuild the Fenwick tree from the daily values in O(days)"""
+        tree = [0] + self._daily
+        size = len(self._daily)
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _ensure(self, ordinal):
+        """
+        Make sure a day ordinal has a slot
+
+        STEP 1: First value - start a small window around it
+        STEP 2: Before the window - double backwards
+        STEP 3: After the window - double forwards
+        """
+        # STEP 1: Empty
+        if self._base is None:
+            self._base = ordinal
+            self._daily = [0] * _INITIAL_DAYS
+            self._tree = [0] * (_INITIAL_DAYS + 1)
+            return
+
+        size = len(self._daily)
+        # STEP 2: Grow backwards
+        if ordinal < self._base:
+            extra = max(size, self._base - ordinal)
+            self._daily = [0] * extra + self._daily
+            self._base -= extra
+            self._build()
+        # STEP 3: Grow forwards
+        elif ordinal >= self._base + size:
+            extra = max(size, ordinal - self._base - size + 1)
+            self._daily.extend([0] * extra)
+            self._build()
+
+    def _update(self, ordinal, cents):
+        """Add cents to one day"""
+        self._ensure(ordinal)
+        slot = ordinal - self._base
+        self._daily[slot] += cents
+        self._total += cents
+        tree = self._tree
+        size = len(self._daily)
+        i = slot + 1
+        while i <= size:
+            tree[i] += cents
+            i += i & -i
+
+    def _prefix(self, ordinal):
+        """Net cents of every day up to and including a day ordinal"""
+        if self._base is None or ordinal < self._base:
+            return 0
+        size = len(self._daily)
+        i = min(ordinal - self._base + 1, size)
+        if i == size:
+            return self._total
+        tree = self._tree
+        cents = 0
+        while i > 0:
+            cents += tree[i]
+            i -= i & -i
+        return cents
+
+    def add(self, transaction):
+        """Add a transaction's amount to its day"""
+        self._update(transaction.date.toordinal(), _signed_cents(transaction))
+
+    def remove(self, transaction):
+        """Remove a transaction's amount from its day"""
+        self._update(transaction.date.toordinal(), -_signed_cents(transaction))
+
+    def rebuild(self, transactions):
+        """
+        Rebuild from scratch in one pass
+
+        Args:
+            transactions (list): All transactions
+        """
+        self.clear()
+        if not transactions:
+            return
+        ordinals = [t.date.toordinal() for t in transactions]
+        self._base = min(ordinals)
+        self._daily = [0] * (max(ordinals) - self._base + 1)
+        for ordinal, transaction in zip(ordinals, transactions):
+            cents = _signed_cents(transaction)
+            self._daily[ordinal - self._base] += cents
+            self._total += cents
+        self._build()
+
+    @property
+    def total(self):
+        """Net of all transactions (the current balance)"""
+        return self._total / 100
+
+    def balance_as_of(self, day):
+        """
+        Balance at the end of a day
+
+        Args:
+            day (datetime.date): Day (inclusive)
+
+        Returns:
+            float: Income minus expenses up to and including that day
+        """
+        return self._prefix(day.toordinal()) / 100
+
+    def net_between(self, start_date, end_date):
+        """
+        Net flow over a date range
+
+        Args:
+            start_date (datetime.date): First day (inclusive)
+            end_date (datetime.date): Last day (inclusive)
+
+        Returns:
+            float: Income minus expenses in the range
+        """
+        if start_date > end_date:
+            return 0.0
+        return (self._prefix(end_date.toordinal())
+                - self._prefix(start_date.toordinal() - 1)) / 100
+
+    def daily_net(self, day):
+        """Net flow of a single day"""
+        if self._base is None:
+            return 0.0
+        slot = day.toordinal() - self._base
+        if 0 <= slot < len(self._daily):
+            return self._daily[slot] / 100
+        return 0.0
+
+    def running_balance(self, start_date, end_date, step_days=1):
+        """
+        Cash-flow series for charts
+
+        One prefix sum finds the opening balance; after that each step
+        only adds the days it covers.
+
+        Args:
+            start_date (datetime.date): First day
+            end_date (datetime.date): Last day
+            step_days (int): Days per point (1 = daily, 7 = weekly)
+
+        Yields:
+            tuple: (last day of the step, net flow of the step, balance at its end)
+        """
+        if step_days < 1:
+            raise ValueError("Step must be at least one day")
+        first = start_date.toordinal()
+        last = end_date.toordinal()
+        balance = self._prefix(first - 1)
+        base = self._base if self._base is not None else 0
+        daily = self._daily
+        size = len(daily)
+
+        for step_start in range(first, last + 1, step_days):
+            step_end = min(step_start + step_days - 1, last)
+            low = max(step_start - base, 0)
+            high = min(step_end - base + 1, size)
+            net = sum(daily[low:high]) if low < high else 0
+            balance += net
+            yield date.fromordinal(step_end), net / 100, balance / 100
@@ -5,6 +5,7 @@ LEARNING OBJECTIVES:
 - Managing predefined categories
 - File I/O for category data
 - Data validation
+- Dirty tracking: save only when something changed
 """
 
 
@@ -15,6 +16,10 @@ class CategoryManager:
     DEFAULT CATEGORIES:
     - Income: Salary, Business, Freelance, Investment, Other
     - Expense: Food, Transport, Bills, Entertainment, Shopping, Healthcare, Education, Other
+    
+    SAVING:
+    add_category() only marks the categories as changed (`version`);
+    save_categories() writes them once and does nothing when clean.
     """
     
     def __init__(self, file_handler):
@@ -25,26 +30,47 @@ class CategoryManager:
             'expense': ['Food', 'Transport', 'Bills', 'Entertainment', 'Shopping', 
                        'Healthcare', 'Education', 'Housing', 'Personal', 'Other']
         }
+        self.version = 0
+        self.saved_version = 0
     
     def get_categories(self, category_type):
         """Get list of categories for a type"""
         return self.categories.get(category_type, [])
     
     def add_category(self, category_type, category_name):
-        """Add a new category"""
+        """Add a new category (saved by the next save_categories())"""
         if category_type in self.categories:
             if category_name not in self.categories[category_type]:
                 self.categories[category_type].append(category_name)
-                self.save_categories()
+                self.version += 1
                 return True
         return False
     
+    @property
+    def is_dirty(self):
+        """True when there are changes that have not been saved"""
+        return self.version != self.saved_version
+    
     def save_categories(self):
-        """Save categories to JSON file"""
-        self.file_handler.save_categories(self.categories)
+        """
+        Save categories to JSON file (no-op when nothing changed)
+        
+        Returns:
+            bool: True if the file was written
+        """
+        if not self.is_dirty:
+            return False
+        if not self.file_handler.save_categories(self.categories):
+            return False
+        self.saved_version = self.version
+        return True
     
     def load_categories(self):
         """Load categories from JSON file"""
         loaded_categories = self.file_handler.load_categories()
         if loaded_categories:
             self.categories = loaded_categories
+            self.saved_version = self.version
+        else:
+            # Nothing usable on disk - the defaults still need saving
+            self.version += 1
@@ -0,0 +1,447 @@
+"""
+CLI Module - Non-interactive command line for scripts and cron jobs
+
+LEARNING OBJECTIVES:
+- argparse sub-commands (like "git add", "git log")
+- Exit status codes so scripts can detect failures
+- Machine-readable output (--format json)
+
+COMMANDS:
+    python cli.py add expense 12.50 Food --description "Lunch" --date 2026-02-16
+    python cli.py import bank.csv --skip-duplicates
+    python cli.py export - --start 2026-01-01 --format json
+    python cli.py report 2026-02 --format html > february.html
+    python cli.py balance --as-of 2026-01-31
+    python cli.py query --type expense --category Food --sort amount --desc --limit 10
+    python cli.py compact --keep-backups 2
+
+EXIT CODES:
+    0  success
+    1  the command failed (invalid data, duplicate, file error, ...)
+    2  invalid command line (reported by argparse)
+
+Each command only loads what it needs: nothing reads recurring rules or
+merchant tables, and only "add" reads the category list. The ledger is
+loaded with lazy indexes (see TransactionManager.load_transactions), so
+"balance" and "report" work from the rollup cube and date index and
+never build the search, duplicate or distribution indexes.
+"""
+
+import os
+import csv
+import sys
+import json
+import argparse
+from datetime import datetime
+
+from file_handler import FileHandler
+from transaction import Transaction, TransactionManager
+from category import CategoryManager
+from reports import ReportGenerator
+from renderers import RENDERERS, get_renderer
+from query import SORT_FIELDS
+from batch import parse_period, build_period_report
+
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+
+
+class CommandError(Exception):
+    """A command failed; the message is shown to the user"""
+
+
+def parse_date(text):
+    """argparse type for YYYY-MM-DD dates"""
+    try:
+        return datetime.strptime(text, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{text}' (use YYYY-MM-DD)") from None
+
+
+def _load_manager(args):
+    """Create a TransactionManager and load the ledger (indexes built on first use)"""
+    transaction_manager = TransactionManager(FileHandler(args.data_dir))
+    transaction_manager.load_transactions(lazy_indexes=True)
+    return transaction_manager
+
+
+def _emit(args, data, text_lines):
+    """
+    Print a result as JSON or as plain text
+
+    Args:
+        args: Parsed arguments (uses args.format)
+        data: JSON-serializable result
+        text_lines (iterable): Lines for text output
+    """
+    if args.format == 'json':
+        sys.stdout.write(json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+    else:
+        sys.stdout.write("".join(line + "\n" for line in text_lines))
+
+
+def _transaction_line(trans):
+    """One transaction as a text line"""
+    return (f"{trans.date}  {trans.type:<8} {trans.amount:>12,.2f}  "
+            f"{trans.category:<15} {trans.description}")
+
+
+def _read_rows(path):
+    """
+    Read transaction rows from a CSV or JSON file
+
+    CSV files use the export header (Date, Type, Amount, Category,
+    Description; case-insensitive). JSON files hold a list of
+    transaction dictionaries or {"transactions": [...]}.
+
+    Returns:
+        list: (row number, dictionary) tuples
+    """
+    if path.lower().endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get('transactions', [])
+        return list(enumerate(data, 1))
+
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        return [(number, {key.strip().lower(): value for key, value in row.items() if key})
+                for number, row in enumerate(reader, 2)]
+
+
+def _row_to_transaction(row):
+    """
+    Build a Transaction from an imported row
+
+    Raises:
+        ValueError: When a field is missing or invalid
+    """
+    try:
+        trans_type = str(row['type']).strip().lower()
+        amount = float(row['amount'])
+        category = str(row['category']).strip()
+        date = datetime.strptime(str(row['date']).strip(), "%Y-%m-%d").date()
+    except KeyError as e:
+        raise ValueError(f"missing field {e}") from None
+    description = str(row.get('description') or '').strip() or f"{trans_type.capitalize()} - {category}"
+    if not category:
+        raise ValueError("empty category")
+    return Transaction(trans_type, amount, category, description, date)
+
+
+# ----------------------------------------------------------------------
+# Commands
+# ----------------------------------------------------------------------
+
+def cmd_add(args):
+    """Add one transaction"""
+    file_handler = FileHandler(args.data_dir)
+    category_manager = CategoryManager(file_handler)
+    category_manager.load_categories()
+    if args.category not in category_manager.get_categories(args.type):
+        if not args.create_category:
+            raise CommandError(
+                f"Unknown {args.type} category '{args.category}'. Known: "
+                f"{', '.join(category_manager.get_categories(args.type))} "
+                f"(use --create-category to add it)")
+        category_manager.add_category(args.type, args.category)
+
+    transaction_manager = TransactionManager(file_handler)
+    transaction_manager.load_transactions(lazy_indexes=True)
+    transaction = Transaction(args.type, args.amount, args.category,
+                              args.description or f"{args.type.capitalize()} - {args.category}",
+                              args.date or datetime.now().date())
+    duplicates = transaction_manager.find_duplicates(transaction)
+    if duplicates and not args.allow_duplicate:
+        raise CommandError(f"Looks like an existing transaction: {duplicates[0]} "
+                           f"(use --allow-duplicate to add it anyway)")
+    transaction_manager.add_transaction(transaction)
+    if transaction_manager.is_dirty:
+        raise CommandError("Could not save the transaction")
+    category_manager.save_categories()
+
+    _emit(args, transaction.to_dict(), [f"Added {transaction}"])
+    return EXIT_OK
+
+
+def cmd_import(args):
+    """Import transactions from a CSV or JSON file (all or nothing)"""
+    try:
+        rows = _read_rows(args.file)
+    except (OSError, json.JSONDecodeError, csv.Error) as e:
+        raise CommandError(f"Cannot read {args.file}: {e}") from None
+
+    # STEP 1: Validate every row before changing anything
+    transactions = []
+    errors = []
+    for number, row in rows:
+        try:
+            transactions.append(_row_to_transaction(row))
+        except (ValueError, TypeError) as e:
+            errors.append(f"row {number}: {e}")
+    if errors and not args.skip_invalid:
+        for error in errors[:20]:
+            print(f"Error: {error}", file=sys.stderr)
+        raise CommandError(f"{len(errors)} invalid row(s); nothing imported "
+                           f"(use --skip-invalid to import the rest)")
+
+    # STEP 2: Add in one batch (one save)
+    transaction_manager = _load_manager(args)
+    if args.skip_duplicates:
+        transactions, duplicates = transaction_manager.split_duplicates(transactions)
+    else:
+        duplicates = []
+    added = 0 if args.dry_run else transaction_manager.add_transactions(transactions)
+    if transaction_manager.is_dirty:
+        raise CommandError("Could not save the imported transactions")
+
+    result = {
+        'file': args.file,
+        'rows': len(rows),
+        'added': added,
+        'would_add': len(transactions) if args.dry_run else None,
+        'duplicates_skipped': len(duplicates),
+        'invalid_skipped': len(errors)
+    }
+    lines = [f"Rows read: {len(rows)}",
+             f"{'Would add' if args.dry_run else 'Added'}: "
+             f"{len(transactions) if args.dry_run else added}",
+             f"Duplicates skipped: {len(duplicates)}",
+             f"Invalid rows skipped: {len(errors)}"]
+    _emit(args, result, lines)
+    return EXIT_OK
+
+
+def _filtered_query(transaction_manager, args):
+    """Apply the shared filter options to a query"""
+    query = transaction_manager.query()
+    if args.type:
+        query = query.of_type(args.type)
+    if args.category:
+        query = query.in_categories(*args.category)
+    if args.start or args.end:
+        query = query.between(args.start, args.end)
+    return query
+
+
+def cmd_export(args):
+    """Export transactions (oldest first) to CSV or JSON"""
+    transaction_manager = _load_manager(args)
+    transactions = _filtered_query(transaction_manager, args).order_by('date').all()
+    as_json = args.file.lower().endswith('.json') or (args.file == '-' and args.format == 'json')
+
+    def write(stream):
+        if as_json:
+            json.dump({'transactions': [t.to_dict() for t in transactions]},
+                      stream, indent=2, ensure_ascii=False)
+            stream.write("\n")
+        else:
+            writer = csv.writer(stream)
+            writer.writerow(['Date', 'Type', 'Amount', 'Category', 'Description'])
+            writer.writerows([t.date, t.type, t.amount, t.category, t.description]
+                             for t in transactions)
+
+    if args.file == '-':
+        write(sys.stdout)
+    else:
+        try:
+            with open(args.file, 'w', newline='', encoding='utf-8') as f:
+                write(f)
+        except OSError as e:
+            raise CommandError(f"Cannot write {args.file}: {e}") from None
+        print(f"Exported {len(transactions)} transaction(s) to {args.file}", file=sys.stderr)
+    return EXIT_OK
+
+
+def cmd_report(args):
+    """Print a report in any renderer format"""
+    if args.period and (args.start or args.end):
+        raise CommandError("Give either a period or --start/--end, not both")
+    transaction_manager = _load_manager(args)
+    report_generator = ReportGenerator(transaction_manager, cache_size=0)
+
+    if args.start or args.end:
+        if not (args.start and args.end):
+            raise CommandError("--start and --end must be given together")
+        if args.categories:
+            report = report_generator.build_category_summary(args.start, args.end)
+        else:
+            report = report_generator.build_date_range_report(args.start, args.end)
+    elif args.period:
+        report = build_period_report(report_generator, parse_period(args.period))
+    else:
+        report = report_generator.build_history_report()
+
+    get_renderer(args.format).write(report, sys.stdout)
+    return EXIT_OK
+
+
+def cmd_balance(args):
+    """Print income, expenses and balance (optionally as of a date)"""
+    transaction_manager = _load_manager(args)
+    # Rollup totals only - no per-day cash-flow index needed
+    if args.as_of:
+        summary = transaction_manager.summarize_range(None, args.as_of)
+        income = sum(total for total, _ in summary['income'].values())
+        expense = sum(total for total, _ in summary['expense'].values())
+    else:
+        income, expense = transaction_manager.get_totals()
+    balance = income - expense
+
+    data = {'as_of': str(args.as_of) if args.as_of else None,
+            'income': round(income, 2), 'expense': round(expense, 2),
+            'balance': round(balance, 2)}
+    _emit(args, data, [f"{'Total Income:':<16} {income:>14,.2f}",
+                       f"{'Total Expenses:':<16} {expense:>14,.2f}",
+                       f"{'Net Balance:':<16} {balance:>14,.2f}"])
+    return EXIT_OK
+
+
+def cmd_query(args):
+    """List transactions matching filters"""
+    transaction_manager = _load_manager(args)
+    query = _filtered_query(transaction_manager, args)
+    if args.min is not None or args.max is not None:
+        query = query.amount_between(args.min, args.max)
+    if args.search:
+        query = query.search(args.search)
+    query = query.order_by(args.sort, reverse=args.desc)
+    if args.limit is not None:
+        query = query.limit(args.limit)
+
+    if args.explain:
+        print(query.explain())
+        return EXIT_OK
+
+    transactions = query.all()
+    lines = [_transaction_line(t) for t in transactions]
+    lines.append(f"{len(transactions)} transaction(s)")
+    _emit(args, [t.to_dict() for t in transactions], lines)
+    return EXIT_OK
+
+
+def cmd_compact(args):
+    """Rewrite the ledger in date order, fold in the journal and prune old backups"""
+    transaction_manager = _load_manager(args)
+    if not transaction_manager.compact():
+        raise CommandError("Could not rewrite the ledger")
+    removed = transaction_manager.file_handler.prune_backups(args.keep_backups)
+
+    data = {'transactions': len(transaction_manager.transactions),
+            'backups_removed': removed}
+    _emit(args, data, [f"Rewrote {len(transaction_manager.transactions)} transaction(s) in date order",
+                       f"Removed {removed} old backup(s)"])
+    return EXIT_OK
+
+
+# ----------------------------------------------------------------------
+# Argument parsing
+# ----------------------------------------------------------------------
+
+def _add_common(parser, formats=('text', 'json')):
+    """Options shared by every command"""
+    parser.add_argument('--data-dir', default='data', help="Data directory (default: data)")
+    parser.add_argument('--format', choices=formats, default='text', help="Output format")
+
+
+def _add_filters(parser):
+    """Filter options shared by export and query"""
+    parser.add_argument('--type', choices=('income', 'expense'))
+    parser.add_argument('--category', action='append', help="Category (repeatable)")
+    parser.add_argument('--start', type=parse_date, help="First date (YYYY-MM-DD)")
+    parser.add_argument('--end', type=parse_date, help="Last date (YYYY-MM-DD)")
+
+
+def build_parser():
+    """
+    Create the argument parser
+
+    Returns:
+        argparse.ArgumentParser: Parser with one sub-command per operation
+    """
+    parser = argparse.ArgumentParser(prog='cli.py',
+                                     description="Personal Finance Tracker - command line")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help="Add one transaction")
+    add.add_argument('type', choices=('income', 'expense'))
+    add.add_argument('amount', type=float)
+    add.add_argument('category')
+    add.add_argument('--description', default='')
+    add.add_argument('--date', type=parse_date, help="YYYY-MM-DD (default: today)")
+    add.add_argument('--allow-duplicate', action='store_true')
+    add.add_argument('--create-category', action='store_true')
+    _add_common(add)
+    add.set_defaults(handler=cmd_add)
+
+    imp = commands.add_parser('import', help="Import a CSV or JSON file")
+    imp.add_argument('file')
+    imp.add_argument('--skip-duplicates', action='store_true')
+    imp.add_argument('--skip-invalid', action='store_true')
+    imp.add_argument('--dry-run', action='store_true')
+    _add_common(imp)
+    imp.set_defaults(handler=cmd_import)
+
+    export = commands.add_parser('export', help="Export transactions to CSV or JSON")
+    export.add_argument('file', help="Output file (.csv or .json), or - for stdout")
+    _add_filters(export)
+    _add_common(export)
+    export.set_defaults(handler=cmd_export)
+
+    report = commands.add_parser('report', help="Print a report")
+    report.add_argument('period', nargs='?',
+                        help="YYYY-MM, YYYY-QN or YYYY (default: history by year)")
+    report.add_argument('--start', type=parse_date)
+    report.add_argument('--end', type=parse_date)
+    report.add_argument('--categories', action='store_true',
+                        help="Category summary for --start/--end")
+    _add_common(report, tuple(RENDERERS))
+    report.set_defaults(handler=cmd_report)
+
+    balance = commands.add_parser('balance', help="Show the balance")
+    balance.add_argument('--as-of', type=parse_date)
+    _add_common(balance)
+    balance.set_defaults(handler=cmd_balance)
+
+    query = commands.add_parser('query', help="List matching transactions")
+    _add_filters(query)
+    query.add_argument('--min', type=float, help="Minimum amount")
+    query.add_argument('--max', type=float, help="Maximum amount")
+    query.add_argument('--search', help="Word search in descriptions")
+    query.add_argument('--sort', choices=SORT_FIELDS, default='date')
+    query.add_argument('--desc', action='store_true', help="Sort descending")
+    query.add_argument('--limit', type=int)
+    query.add_argument('--explain', action='store_true', help="Show the query plan")
+    _add_common(query)
+    query.set_defaults(handler=cmd_query)
+
+    compact = commands.add_parser('compact', help="Rewrite the ledger, fold in the journal, prune backups")
+    compact.add_argument('--keep-backups', type=int, default=5)
+    _add_common(compact)
+    compact.set_defaults(handler=cmd_compact)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Run one command
+
+    Returns:
+        int: Exit status
+    """
+    args = build_parser().parse_args(argv)
+    if not os.path.isdir(args.data_dir) and args.command != 'add':
+        print(f"Error: data directory '{args.data_dir}' does not exist", file=sys.stderr)
+        return EXIT_ERROR
+    try:
+        return args.handler(args)
+    except (CommandError, ValueError, TypeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Duplicates Module - Hash-based duplicate detection
+
+LEARNING OBJECTIVES:
+- Fingerprints: reducing a record to the fields that identify it
+- Hash lookups (dict) instead of scanning every record
+- Handling "almost the same day" with a small date window
+
+HOW IT WORKS:
+Each transaction is reduced to a fingerprint, by default
+(type, amount in cents, normalized description). The index maps
+(fingerprint, day) to the transactions with that fingerprint on that
+day. Checking a new transaction looks up its own day plus `date_window`
+days on either side - a handful of dictionary lookups, no matter how
+many transactions exist.
+"""
+
+from fuzzy import normalize_description
+
+
+def default_fingerprint(transaction):
+    """
+    Fields that make two transactions "the same"
+
+    Args:
+        transaction (Transaction): Transaction to fingerprint
+
+    Returns:
+        tuple: (type, amount in cents, normalized description)
+    """
+    return (transaction.type,
+            round(transaction.amount * 100),
+            normalize_description(transaction.description))
+
+
+class DuplicateIndex:
+    """
+    Finds transactions with the same fingerprint on (nearly) the same day
+
+    STRUCTURE:
+    {
+        (fingerprint, date_ordinal): {transaction_key: transaction, ...},
+        ...
+    }
+    """
+
+    def __init__(self, fingerprint=None, date_window=0):
+        """
+        Initialize an empty duplicate index
+
+        Args:
+            fingerprint: Function returning a hashable fingerprint
+                (default: default_fingerprint)
+            date_window (int): Also match transactions this many days
+                before or after (0 = same day only)
+        """
+        if date_window < 0:
+            raise ValueError("Date window must not be negative")
+        self.fingerprint = fingerprint or default_fingerprint
+        self.date_window = date_window
+        self._buckets = {}
+
+    def _bucket_key(self, transaction):
+        """Fingerprint and day of a transaction"""
+        return self.fingerprint(transaction), transaction.date.toordinal()
+
+    def add(self, transaction):
+        """Add a transaction to the index"""
+        bucket_key = self._bucket_key(transaction)
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            bucket = self._buckets[bucket_key] = {}
+        bucket[transaction.key] = transaction
+
+    def remove(self, transaction):
+        """Remove a transaction from the index"""
+        bucket_key = self._bucket_key(transaction)
+        bucket = self._buckets.get(bucket_key)
+        if bucket is not None:
+            bucket.pop(transaction.key, None)
+            if not bucket:
+                del self._buckets[bucket_key]
+
+    def clear(self):
+        """Remove every entry"""
+        self._buckets = {}
+
+    def find(self, transaction):
+        """
+        Find indexed transactions that look like duplicates
+
+        Args:
+            transaction (Transaction): Transaction to check (it does not
+                need to be in the index; if it is, it is not reported)
+
+        Returns:
+            list: Matching transactions (empty when unique)
+        """
+        fingerprint = self.fingerprint(transaction)
+        day = transaction.date.toordinal()
+        matches = []
+        for offset in range(-self.date_window, self.date_window + 1):
+            bucket = self._buckets.get((fingerprint, day + offset))
+            if bucket:
+                matches.extend(t for key, t in bucket.items()
+                               if key != transaction.key)
+        return matches
@@ -25,7 +25,12 @@ class FileHandler:
     
     FILES:
     - data/transactions.json: Transaction data in JSON format
+    - data/transactions.journal: Changes since the last full save
+      (one JSON object per line, folded into transactions.json on the
+      next full save)
     - data/categories.json: Category data in JSON format
+    - data/merchants.json: Optional merchant normalization table
+    - data/recurring.json: Recurring transaction rules
     - data/backup/: Backup directory for data files
     
     JSON STRUCTURE:
@@ -71,8 +76,13 @@ class FileHandler:
         # STEP 1: Set up file paths
         self.data_dir = data_dir
         self.transactions_file = os.path.join(data_dir, 'transactions.json')
+        self.journal_file = os.path.join(data_dir, 'transactions.journal')
         self.categories_file = os.path.join(data_dir, 'categories.json')
+        self.merchants_file = os.path.join(data_dir, 'merchants.json')
+        self.recurring_file = os.path.join(data_dir, 'recurring.json')
         self.backup_dir = os.path.join(data_dir, 'backup')
+        self.journal_entries = 0
+        self.last_write = {}
         
         # STEP 2: Create data directory if it doesn't exist
         if not os.path.exists(data_dir):
@@ -112,17 +122,30 @@ class FileHandler:
         """
         Save data to JSON file with pretty formatting
         
+        The data is written to a temporary file first, which then
+        replaces the old file in one step: a failed write (full disk,
+        bad data) leaves the old file as it was.
+        
         Args:
             filepath: Path to JSON file
             data: Data to save (dict or list)
+            
+        Returns:
+            bool: True if the file was written
         """
+        temp_path = filepath + '.tmp'
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(temp_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, filepath)
+            return True
         except IOError as e:
             print(f"Error saving JSON file {filepath}: {e}")
-        except json.JSONEncodeError as e:
+        except (TypeError, ValueError) as e:
             print(f"Error encoding JSON data: {e}")
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+        return False
     
     def _load_json(self, filepath):
         """
@@ -158,6 +181,10 @@ class FileHandler:
         
         Args:
             transactions_list: List of Transaction objects
+            
+        Returns:
+            bool: True if the file was written (the journal is only
+                cleared then)
         """
         # STEP 1: Convert to dictionaries
         transactions_data = [t.to_dict() for t in transactions_list]
@@ -175,21 +202,135 @@ class FileHandler:
         self._backup_file(self.transactions_file)
         
         # STEP 4: Save
-        self._save_json(self.transactions_file, data)
+        if not self._save_json(self.transactions_file, data):
+            return False
+        self._remember_write(self.transactions_file)
+        
+        # STEP 5: The journal is part of the file now
+        self.clear_journal()
+        return True
     
     def load_transactions(self):
         """
-        Load transactions from JSON file
+        Load transactions from JSON file and replay the journal
         
         Returns:
             list: List of transaction dictionaries
         """
         data = self._load_json(self.transactions_file)
+        transactions = [] if data is None else data.get('transactions', [])
         
-        if data is None:
-            return []
+        entries = self.load_journal()
+        self.journal_entries = len(entries)
+        if not entries:
+            return transactions
+        
+        # Replay by ID: later entries win, deletes drop the record
+        records = {trans.get('id'): trans for trans in transactions}
+        for entry in entries:
+            op = entry.get('op')
+            trans = entry.get('transaction')
+            if op == 'add' and isinstance(trans, dict) and isinstance(trans.get('id'), str):
+                records[trans['id']] = trans
+            elif op == 'delete' and isinstance(entry.get('id'), str):
+                records.pop(entry['id'], None)
+            else:
+                print(f"Warning: Skipping invalid journal entry: {str(entry)[:60]}")
+        return list(records.values())
+    
+    def append_journal(self, entries):
+        """
+        Append record changes to the journal (no rewrite, no backup)
+        
+        A failed append is cut back to the previous end of the file,
+        so no half-written line is left behind.
         
-        return data.get('transactions', [])
+        Args:
+            entries (list): {"op": "add", "transaction": {...}} or
+                {"op": "delete", "id": "..."} dictionaries
+                
+        Returns:
+            bool: True if the entries were written
+        """
+        text = ''.join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+        try:
+            with open(self.journal_file, 'a', encoding='utf-8') as f:
+                start = f.tell()
+                try:
+                    f.write(text)
+                    f.flush()
+                except IOError:
+                    f.truncate(start)
+                    raise
+        except IOError as e:
+            print(f"Error writing journal {self.journal_file}: {e}")
+            return False
+        self.journal_entries += len(entries)
+        self._remember_write(self.journal_file)
+        return True
+    
+    def load_journal(self):
+        """
+        Read the journal
+        
+        Returns:
+            list: Journal entries in write order (an unreadable line,
+                e.g. one cut short by a crash, is skipped)
+        """
+        return self.read_journal()[0]
+    
+    def read_journal(self, offset=0):
+        """
+        Read journal entries from a byte offset on
+        
+        Only complete lines are read; a line that is still being
+        written is left for the next call.
+        
+        Args:
+            offset (int): Byte position to start at (0 = whole journal)
+            
+        Returns:
+            tuple: (entries, byte offset after the last complete line)
+        """
+        if not os.path.exists(self.journal_file):
+            return [], 0
+        
+        with open(self.journal_file, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        end = data.rfind(b'\n') + 1
+        
+        entries = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                entry = None
+            if not isinstance(entry, dict):
+                print(f"Warning: Skipping unreadable journal line: {line.strip()[:60]}")
+                continue
+            entries.append(entry)
+        return entries, offset + end
+    
+    def clear_journal(self):
+        """Remove the journal (after its entries were saved in full)"""
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self.journal_entries = 0
+        self.last_write[self.journal_file] = None
+    
+    def _remember_write(self, filepath):
+        """
+        Note size and modification time of a file this handler just
+        wrote, so a watcher can tell its own writes from other programs'
+        """
+        try:
+            stat = os.stat(filepath)
+            self.last_write[filepath] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            self.last_write.pop(filepath, None)
     
     def save_categories(self, categories_dict):
         """
@@ -197,6 +338,9 @@ class FileHandler:
         
         Args:
             categories_dict: Dictionary with 'income' and 'expense' keys
+            
+        Returns:
+            bool: True if the file was written
         """
         # Add metadata
         data = categories_dict.copy()
@@ -208,7 +352,7 @@ class FileHandler:
         self._backup_file(self.categories_file)
         
         # Save
-        self._save_json(self.categories_file, data)
+        return self._save_json(self.categories_file, data)
     
     def load_categories(self):
         """
@@ -226,6 +370,64 @@ class FileHandler:
         categories = {k: v for k, v in data.items() if k != 'metadata'}
         return categories
     
+    def save_recurring(self, rules_list):
+        """
+        Save recurring rules to JSON file
+        
+        Args:
+            rules_list: List of rule dictionaries
+        """
+        data = {
+            "rules": rules_list,
+            "metadata": {
+                "last_updated": datetime.now().isoformat(),
+                "total_rules": len(rules_list)
+            }
+        }
+        self._backup_file(self.recurring_file)
+        self._save_json(self.recurring_file, data)
+    
+    def load_recurring(self):
+        """
+        Load recurring rules from JSON file
+        
+        Returns:
+            list: List of rule dictionaries (empty if the file is missing)
+        """
+        data = self._load_json(self.recurring_file)
+        
+        if data is None:
+            return []
+        
+        return data.get('rules', [])
+    
+    def load_merchants(self):
+        """
+        Load the merchant normalization table (optional file)
+        
+        Returns:
+            dict: {merchant: [aliases]}, empty if the file is missing
+        """
+        data = self._load_json(self.merchants_file)
+        
+        if data is None:
+            return {}
+        
+        return {k: v for k, v in data.items() if k != 'metadata'}
+    
+    def save_merchants(self, merchants_dict):
+        """
+        Save the merchant normalization table
+        
+        Args:
+            merchants_dict: {merchant: [aliases]}
+        """
+        data = dict(merchants_dict)
+        data['metadata'] = {
+            "last_updated": datetime.now().isoformat()
+        }
+        self._save_json(self.merchants_file, data)
+    
     def _backup_file(self, filepath):
         """
         Create a backup of the file with timestamp
@@ -254,6 +456,22 @@ class FileHandler:
         except Exception as e:
             print(f"Warning: Could not create backup: {e}")
     
+    def prune_backups(self, keep_count=5):
+        """
+        Keep only the newest backups of every data file
+        
+        Args:
+            keep_count (int): Backups to keep per file (0 removes all)
+            
+        Returns:
+            int: Number of backup files removed
+        """
+        before = len(os.listdir(self.backup_dir))
+        for filepath in (self.transactions_file, self.categories_file,
+                         self.merchants_file, self.recurring_file):
+            self._cleanup_old_backups(os.path.basename(filepath), keep_count)
+        return before - len(os.listdir(self.backup_dir))
+    
     def _cleanup_old_backups(self, filename, keep_count=5):
         """
         Keep only the most recent backups
@@ -0,0 +1,296 @@
+"""
+Forecast Module - Spending trends and simple projections
+
+LEARNING OBJECTIVES:
+- Working on monthly totals instead of individual transactions
+- Moving averages and least-squares trend lines
+- Seasonality: "December is always expensive"
+- Compact numeric storage with the array module
+
+HOW IT WORKS:
+1. One pass over the rollup cube builds a series of monthly totals for
+   every category (array('d') per category, months as columns).
+2. Each category's history starts at its first month with data;
+   months before it are left out instead of counting as zero spending
+   (which would show a rising trend that does not exist). The
+   trend-line sums that depend only on time are computed once per
+   history length and shared, so fitting hundreds of categories costs
+   one short loop per category.
+3. A forecast is the trend line (plus a per-calendar-month adjustment
+   for the seasonal method) extended into the coming months.
+
+METHODS:
+- 'average':  mean of the last `window` months
+- 'linear':   least-squares straight line through the history
+- 'seasonal': linear trend + average deviation of each calendar month
+              (needs two full years of a category's history, otherwise
+              'linear' for that category)
+
+Forecasts are estimates; negative values are clipped to zero.
+"""
+
+from array import array
+from datetime import date
+
+from utils import add_months, iter_months, month_bounds
+
+
+METHODS = ('average', 'linear', 'seasonal')
+
+
+def monthly_matrix(rollup, months, trans_type='expense'):
+    """
+    Monthly totals per category, read from the rollup cube
+
+    Args:
+        rollup (RollupCube): Pre-aggregated totals
+        months (list): (year, month) tuples, oldest first
+        trans_type (str): 'income' or 'expense'
+
+    Returns:
+        dict: {category: array('d') of totals, one value per month}
+    """
+    matrix = {}
+    width = len(months)
+    for position, (year, month) in enumerate(months):
+        for (cell_type, category), (cents, _) in rollup.month_cells(year, month).items():
+            if cell_type != trans_type:
+                continue
+            row = matrix.get(category)
+            if row is None:
+                row = matrix[category] = array('d', bytes(8 * width))
+            row[position] = cents / 100
+    return matrix
+
+
+def moving_average(values, window):
+    """
+    Trailing moving average
+
+    Args:
+        values (sequence): Monthly values
+        window (int): Number of months per average
+
+    Returns:
+        list: One average per month from the window-th month on
+    """
+    if window < 1:
+        raise ValueError("Window must be at least 1")
+    averages = []
+    running = 0.0
+    for i, value in enumerate(values):
+        running += value
+        if i >= window:
+            running -= values[i - window]
+        if i >= window - 1:
+            averages.append(running / window)
+    return averages
+
+
+class TrendModel:
+    """
+    Least-squares line through evenly spaced points (x = 0, 1, 2, ...)
+
+    The x-only sums are computed once per history length and shared by
+    every series fitted with the same model.
+    """
+
+    def __init__(self, length):
+        """
+        Prepare the shared sums
+
+        Args:
+            length (int): Number of points in each series
+        """
+        if length < 1:
+            raise ValueError("Need at least one month of history")
+        self.length = length
+        self.x_mean = (length - 1) / 2
+        self.x_var_sum = sum((x - self.x_mean) ** 2 for x in range(length))
+
+    def fit(self, values):
+        """
+        Fit a line to one series
+
+        Returns:
+            tuple: (slope, intercept)
+        """
+        y_mean = sum(values) / self.length
+        if self.x_var_sum == 0:
+            return 0.0, y_mean
+        covariance = 0.0
+        x = -self.x_mean
+        for value in values:
+            covariance += x * value
+            x += 1
+        slope = covariance / self.x_var_sum
+        return slope, y_mean - slope * self.x_mean
+
+
+def seasonal_indexes(values, slope, intercept, first_month, season=12):
+    """
+    Average deviation from the trend for each calendar month
+
+    Args:
+        values (sequence): Monthly values
+        slope (float): Trend slope
+        intercept (float): Trend intercept
+        first_month (int): Calendar month (1-12) of values[0]
+        season (int): Months per season
+
+    Returns:
+        list: 12 adjustments, index 0 = January
+    """
+    sums = [0.0] * season
+    counts = [0] * season
+    for x, value in enumerate(values):
+        slot = (first_month - 1 + x) % season
+        sums[slot] += value - (intercept + slope * x)
+        counts[slot] += 1
+    return [sums[i] / counts[i] if counts[i] else 0.0 for i in range(season)]
+
+
+class Forecaster:
+    """
+    Forecasts monthly income and expenses per category
+
+    USAGE:
+        forecaster = Forecaster(transaction_manager)
+        forecaster.forecast_categories(horizon=3, method='seasonal')
+        forecaster.project_month_end_balance()
+    """
+
+    def __init__(self, transaction_manager, history_months=24):
+        """
+        Initialize forecaster
+
+        Args:
+            transaction_manager: TransactionManager to read from
+            history_months (int): Complete months used for fitting
+        """
+        if history_months < 1:
+            raise ValueError("History must be at least one month")
+        self.transaction_manager = transaction_manager
+        self.history_months = history_months
+
+    def history(self, end_year, end_month):
+        """
+        The history window ending with a given month
+
+        Returns:
+            list: (year, month) tuples, oldest first
+        """
+        first = add_months(end_year, end_month, -(self.history_months - 1))
+        return list(iter_months(first, (end_year, end_month)))
+
+    def forecast_categories(self, horizon=3, method='linear', trans_type='expense',
+                            end_year=None, end_month=None, window=3):
+        """
+        Forecast the coming months for every category at once
+
+        STEP 1: Build the monthly matrix from the rollup cube
+        STEP 2: Fit every category from its first month with data
+                (trend sums shared per history length)
+        STEP 3: Extend each fit `horizon` months past the history
+
+        Args:
+            horizon (int): Months to forecast
+            method (str): 'average', 'linear' or 'seasonal'
+            trans_type (str): 'income' or 'expense'
+            end_year (int): Last month of history (default: last complete month)
+            end_month (int): See end_year
+            window (int): Months averaged by the 'average' method
+
+        Returns:
+            dict: {
+                'months': [(year, month), ...] forecast months,
+                'categories': {category: [value per forecast month]}
+            }
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown method '{method}'. Choose from: {', '.join(METHODS)}")
+        if end_year is None or end_month is None:
+            today = date.today()
+            end_year, end_month = add_months(today.year, today.month, -1)
+
+        # STEP 1: Monthly matrix
+        months = self.history(end_year, end_month)
+        matrix = monthly_matrix(self.transaction_manager.rollup, months, trans_type)
+        future = [add_months(end_year, end_month, step) for step in range(1, horizon + 1)]
+
+        # STEP 2 & 3: Fit and extend
+        models = {}
+        forecasts = {}
+        for category, row in matrix.items():
+            first = next((position for position, value in enumerate(row) if value), None)
+            if first is None:
+                # Every month rounded to 0 cents - nothing to fit
+                forecasts[category] = [0.0] * horizon
+                continue
+            values = row[first:]
+            length = len(values)
+            if method == 'average':
+                recent = values[-window:]
+                level = sum(recent) / len(recent)
+                predicted = [level] * horizon
+            else:
+                model = models.get(length)
+                if model is None:
+                    model = models[length] = TrendModel(length)
+                slope, intercept = model.fit(values)
+                predicted = [intercept + slope * (length - 1 + step)
+                             for step in range(1, horizon + 1)]
+                if method == 'seasonal' and length >= 24:
+                    indexes = seasonal_indexes(values, slope, intercept, months[first][1])
+                    predicted = [value + indexes[month - 1]
+                                 for value, (_, month) in zip(predicted, future)]
+            forecasts[category] = [max(value, 0.0) for value in predicted]
+
+        return {'months': future, 'categories': forecasts}
+
+    def project_month_end_balance(self, today=None, method='linear'):
+        """
+        Projected balance at the end of the current month
+
+        STEP 1: Balance as of today (cash-flow series)
+        STEP 2: Forecast this month's income and expenses per category
+        STEP 3: Add what is still expected (forecast minus already booked)
+
+        Args:
+            today (datetime.date): Reference day (default: today)
+            method (str): Forecast method
+
+        Returns:
+            dict: balance_today, expected_income, expected_expense,
+                  projected_balance and month_end
+        """
+        if today is None:
+            today = date.today()
+        manager = self.transaction_manager
+        _, month_end = month_bounds(today.month, today.year)
+        end_year, end_month = add_months(today.year, today.month, -1)
+
+        # STEP 1: Balance today
+        balance_today = manager.get_balance_as_of(today)
+
+        # STEP 2 & 3: Expected remainder per type
+        booked = manager.rollup.summarize([(today.year, today.month)])
+        expected = {}
+        for trans_type in ('income', 'expense'):
+            forecast = self.forecast_categories(1, method, trans_type, end_year, end_month)
+            remaining = 0.0
+            for category, values in forecast['categories'].items():
+                already = booked[trans_type].get(category, (0.0, 0))[0]
+                remaining += max(values[0] - already, 0.0)
+            expected[trans_type] = remaining
+
+        # Transactions already dated after today are part of the month end
+        booked_later = manager.get_net_between(date.fromordinal(today.toordinal() + 1), month_end)
+        projected = balance_today + booked_later + expected['income'] - expected['expense']
+        return {
+            'balance_today': balance_today,
+            'expected_income': expected['income'],
+            'expected_expense': expected['expense'],
+            'projected_balance': projected,
+            'month_end': month_end
+        }
@@ -0,0 +1,470 @@
+"""
+Fuzzy Module - Trigram similarity and merchant normalization
+
+LEARNING OBJECTIVES:
+- Breaking strings into character trigrams
+- Similarity scores (Jaccard index) for approximate matching
+- Using an index to avoid comparing every pair of strings
+- Prefix filtering: finding candidates through rare trigrams only
+- Greedy clustering
+
+WHAT IS A TRIGRAM?
+"uber" is padded to "  uber " and split into overlapping
+three-letter pieces: "  u", " ub", "ube", "ber", "er ".
+Two strings that share most of their trigrams are probably
+the same text with a typo or some extra noise.
+
+SIMILARITY:
+    shared / (trigrams_a + trigrams_b - shared)     (0.0 - 1.0)
+"""
+
+import math
+import re
+from collections import Counter
+
+
+NOISE_PATTERN = re.compile(r"[^a-z]+")
+
+
+def normalize_description(text):
+    """
+    Reduce a description to lowercase letters and single spaces
+
+    Digits and punctuation are treated as noise:
+    "Amazon.com*2X4Y" -> "amazon com x y"
+
+    Args:
+        text (str): Raw description
+
+    Returns:
+        str: Normalized description
+    """
+    return NOISE_PATTERN.sub(' ', text.lower()).strip()
+
+
+def trigrams(text):
+    """
+    Set of character trigrams of a normalized string
+
+    Args:
+        text (str): Normalized text
+
+    Returns:
+        set: Trigrams (empty for an empty string)
+    """
+    if not text:
+        return set()
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _prefix_size(size, threshold):
+    """
+    How many of a string's rarest trigrams must be looked at
+
+    A string with similarity >= threshold shares at least
+    threshold * size of the trigrams, so it shares one of ANY
+    size - ceil(threshold * size) + 1 of them.
+
+    Args:
+        size (int): Number of trigrams
+        threshold (float): Minimum similarity (0.0 - 1.0)
+
+    Returns:
+        int: Prefix length (all trigrams for a threshold of 0)
+    """
+    # The small epsilon keeps 0.3 * 10 from rounding up to 4
+    needed = max(1, math.ceil(threshold * size - 1e-9))
+    return size - needed + 1
+
+
+def _size_bounds(size, threshold):
+    """
+    Smallest and largest trigram count that can still reach threshold
+
+    Similarity can never exceed smaller / larger, so much shorter
+    or much longer strings are skipped without counting anything.
+
+    Returns:
+        tuple: (smallest, largest)
+    """
+    if threshold <= 0:
+        return 0, float('inf')
+    return threshold * size - 1e-9, size / threshold + 1e-9
+
+
+class TrigramIndex:
+    """
+    Finds strings similar to a query string
+
+    STRUCTURE:
+    - _grams: {trigram: set of strings containing it}
+    - _sizes: {string: number of trigrams}
+    - _refs: {string: how many times it was added}
+
+    HOW A LOOKUP WORKS:
+    Instead of comparing the query with every string, only the
+    strings that share one of the query's rarest trigrams are
+    visited, and strings much shorter or longer than the query are
+    skipped before they are scored (see lookup).
+    """
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._grams = {}
+        self._sizes = {}
+        self._refs = {}
+
+    def __len__(self):
+        """Number of distinct strings"""
+        return len(self._sizes)
+
+    def __contains__(self, text):
+        return text in self._sizes
+
+    def add(self, text):
+        """
+        Add a string (adding the same string again only counts it)
+
+        Args:
+            text (str): Normalized string
+        """
+        if text in self._refs:
+            self._refs[text] += 1
+            return
+        grams = trigrams(text)
+        self._refs[text] = 1
+        self._sizes[text] = len(grams)
+        for gram in grams:
+            self._grams.setdefault(gram, set()).add(text)
+
+    def remove(self, text):
+        """
+        Remove one reference to a string
+
+        Args:
+            text (str): Normalized string
+        """
+        refs = self._refs.get(text)
+        if refs is None:
+            return
+        if refs > 1:
+            self._refs[text] = refs - 1
+            return
+        del self._refs[text]
+        del self._sizes[text]
+        for gram in trigrams(text):
+            holders = self._grams.get(gram)
+            if holders is not None:
+                holders.discard(text)
+                if not holders:
+                    del self._grams[gram]
+
+    def lookup(self, text, limit=10, threshold=0.3):
+        """
+        Find the most similar strings
+
+        STEP 1: Sort the query's trigrams from rarest to most common
+        STEP 2: Collect candidates from the rarest ones only (prefix)
+        STEP 3: Drop candidates whose size rules them out
+        STEP 4: Count the remaining shared trigrams and score
+        STEP 5: Keep the best scores above the threshold
+
+        WHY ONLY THE RAREST TRIGRAMS?
+        Every match shares at least one trigram of a prefix of the
+        query (see _prefix_size), and the rarest ones have the fewest
+        holders. Common trigrams such as " th" are never used to find
+        candidates, only to score them.
+
+        Args:
+            text (str): Normalized query string
+            limit (int): Maximum number of results (None for all)
+            threshold (float): Minimum similarity (0.0 - 1.0)
+
+        Returns:
+            list: [(similarity, string), ...] best first
+        """
+        query_grams = trigrams(text)
+        if not query_grams:
+            return []
+        grams = self._grams
+
+        # STEP 1: Rarest first (trigrams nobody has cost nothing)
+        ordered = sorted(query_grams, key=lambda gram: len(grams.get(gram, ())))
+        query_size = len(ordered)
+
+        # STEP 2: Candidates from the prefix
+        prefix_size = _prefix_size(query_size, threshold)
+        shared = Counter()
+        for gram in ordered[:prefix_size]:
+            holders = grams.get(gram)
+            if holders:
+                shared.update(holders)
+
+        # STEP 3: Size bounds
+        smallest, largest = _size_bounds(query_size, threshold)
+
+        # STEP 4: Exact scores for the candidates left
+        rest = [grams.get(gram, ()) for gram in ordered[prefix_size:]]
+        sizes = self._sizes
+        scored = []
+        for candidate, common in shared.items():
+            size = sizes[candidate]
+            if size < smallest or size > largest:
+                continue
+            for holders in rest:
+                if candidate in holders:
+                    common += 1
+            score = common / (query_size + size - common)
+            if score >= threshold:
+                scored.append((score, candidate))
+
+        # STEP 5: Best first
+        scored.sort(key=lambda pair: (-pair[0], pair[1]))
+        return scored if limit is None else scored[:limit]
+
+    def best(self, text, threshold=0.3):
+        """
+        Most similar string, or None
+
+        Returns:
+            tuple: (similarity, string) or None
+        """
+        matches = self.lookup(text, limit=1, threshold=threshold)
+        return matches[0] if matches else None
+
+
+class _LeaderIndex:
+    """
+    Cluster leaders, indexed by their rarest trigrams only
+
+    TrigramIndex has to answer any query, so it indexes every
+    trigram. While clustering, all strings are known up front, so
+    trigram frequencies can be counted once and fixed. With one
+    rarest-first order for everybody, two strings with similarity
+    >= threshold always share a trigram from BOTH of their prefixes
+    (see _prefix_size). So leaders are indexed by their prefix and
+    queries probe theirs: common trigrams are never touched.
+
+    STRUCTURE:
+    - _holders: {trigram: {leader size: {position: [leaders]}}}
+      (position of the trigram in the leader's prefix)
+    - _grams: {leader: set of trigrams}
+
+    POSITION FILTER:
+    If a query and a leader share a trigram at position i of the
+    query's order and j of the leader's, and it is the first one they
+    share, they share at most min(query size - i, leader size - j)
+    trigrams. Grouping leaders by size and position lets whole groups
+    that can never reach the threshold be skipped.
+    """
+
+    def __init__(self, rank, threshold):
+        """
+        Args:
+            rank (dict): {trigram: position in the rarest-first order}
+            threshold (float): Minimum similarity (0.0 - 1.0)
+        """
+        self._rank = rank
+        self._threshold = threshold
+        self._holders = {}
+        self._grams = {}
+
+    def _prefix(self, grams):
+        """Rarest trigrams that must be looked at, rarest first"""
+        ordered = sorted(grams, key=self._rank.__getitem__)
+        return ordered[:_prefix_size(len(ordered), self._threshold)]
+
+    def add(self, text, grams):
+        """
+        Add a leader
+
+        Args:
+            text (str): Normalized string
+            grams (set): Its trigrams
+        """
+        self._grams[text] = grams
+        size = len(grams)
+        for position, gram in enumerate(self._prefix(grams)):
+            by_size = self._holders.setdefault(gram, {})
+            by_size.setdefault(size, {}).setdefault(position, []).append(text)
+
+    def best(self, grams):
+        """
+        Most similar leader (ties go to the smallest string, like
+        TrigramIndex.best)
+
+        STEP 1: Probe the prefix, skipping groups ruled out by
+                size or position
+        STEP 2: Score the leaders that are left
+
+        Args:
+            grams (set): Trigrams of the query
+
+        Returns:
+            str or None: Leader, None if none reaches the threshold
+        """
+        threshold = self._threshold
+        size = len(grams)
+        smallest, largest = _size_bounds(size, threshold)
+        # Shared trigrams needed: similarity >= threshold means
+        # shared >= threshold / (1 + threshold) * (size + other size)
+        ratio = threshold / (1 + threshold)
+
+        # STEP 1: Candidates
+        candidates = set()
+        for position, gram in enumerate(self._prefix(grams)):
+            remaining = size - position
+            for other, by_position in self._holders.get(gram, {}).items():
+                if not smallest <= other <= largest:
+                    continue
+                needed = ratio * (size + other) - 1e-9
+                if remaining < needed:
+                    continue
+                for other_position, leaders in by_position.items():
+                    if other - other_position >= needed:
+                        candidates.update(leaders)
+
+        # STEP 2: Exact scores
+        best_score, best_leader = threshold, None
+        for leader in candidates:
+            leader_grams = self._grams[leader]
+            common = len(grams & leader_grams)
+            score = common / (size + len(leader_grams) - common)
+            if score < best_score:
+                continue
+            if best_leader is None or score > best_score or leader < best_leader:
+                best_score, best_leader = score, leader
+        return best_leader
+
+
+def cluster_descriptions(descriptions, threshold=0.5):
+    """
+    Group similar descriptions together
+
+    STEP 1: Normalize and count distinct descriptions
+    STEP 2: Rank trigrams from rarest to most common
+    STEP 3: Visit descriptions from most to least common
+    STEP 4: Join the best existing cluster, or start a new one
+
+    Only distinct descriptions are compared, and each one only with
+    cluster leaders that share one of its rarest trigrams and have a
+    similar size (see _LeaderIndex). Descriptions that share a
+    merchant name still become candidates, so the work grows faster
+    than the number of descriptions - in the worst case (mostly
+    distinct descriptions with common words) it is still every
+    pair, just far fewer of them are scored.
+
+    Args:
+        descriptions (iterable or dict): Descriptions, or already
+            counted {description: count} pairs
+        threshold (float): Minimum similarity to join a cluster
+
+    Returns:
+        dict: {normalized description: cluster leader}
+    """
+    # STEP 1: Distinct descriptions with their frequency
+    counts = Counter()
+    if isinstance(descriptions, dict):
+        for text, count in descriptions.items():
+            counts[normalize_description(text)] += count
+    else:
+        for text in descriptions:
+            counts[normalize_description(text)] += 1
+    counts.pop('', None)
+
+    # STEP 2: One fixed rarest-first order of all trigrams
+    grams_of = {text: trigrams(text) for text in counts}
+    frequency = Counter()
+    for grams in grams_of.values():
+        frequency.update(grams)
+    ordered = sorted(frequency, key=lambda gram: (frequency[gram], gram))
+    rank = {gram: position for position, gram in enumerate(ordered)}
+
+    # STEP 3: Most common first, so leaders are the typical spelling
+    leaders = _LeaderIndex(rank, threshold)
+    assignment = {}
+    for text, _ in counts.most_common():
+        # STEP 4: Join or lead
+        grams = grams_of[text]
+        leader = leaders.best(grams)
+        if leader is None:
+            leaders.add(text, grams)
+            assignment[text] = text
+        else:
+            assignment[text] = leader
+    return assignment
+
+
+class MerchantNormalizer:
+    """
+    Maps noisy descriptions to a canonical merchant name
+
+    TABLE FORMAT (data/merchants.json):
+    {
+        "Amazon": ["amazon", "amzn", "amzn mktp"],
+        "Uber": ["uber", "uber trip"]
+    }
+
+    MATCHING ORDER:
+    1. The normalized description starts with an alias
+    2. Otherwise the most similar alias above the threshold
+    """
+
+    def __init__(self, table=None, threshold=0.5):
+        """
+        Initialize from a merchant table
+
+        Args:
+            table (dict): {merchant: [aliases]} (optional)
+            threshold (float): Minimum similarity for fuzzy matches
+        """
+        self.threshold = threshold
+        self.table = {}
+        self._alias_to_merchant = {}
+        self._aliases = TrigramIndex()
+        for merchant, aliases in (table or {}).items():
+            self.add_merchant(merchant, aliases)
+
+    def add_merchant(self, merchant, aliases):
+        """
+        Register a merchant and its aliases
+
+        Args:
+            merchant (str): Canonical merchant name
+            aliases (list): Alternative spellings
+        """
+        self.table.setdefault(merchant, [])
+        for alias in [merchant] + list(aliases):
+            normalized = normalize_description(alias)
+            if not normalized or normalized in self._alias_to_merchant:
+                continue
+            if alias != merchant:
+                self.table[merchant].append(alias)
+            self._alias_to_merchant[normalized] = merchant
+            self._aliases.add(normalized)
+
+    def normalize(self, description):
+        """
+        Canonical merchant for a description
+
+        Args:
+            description (str): Raw description
+
+        Returns:
+            str: Merchant name, or None when nothing matches
+        """
+        text = normalize_description(description)
+        if not text:
+            return None
+
+        # 1. Alias prefix (longest alias wins)
+        words = text.split()
+        for size in range(len(words), 0, -1):
+            merchant = self._alias_to_merchant.get(' '.join(words[:size]))
+            if merchant is not None:
+                return merchant
+
+        # 2. Fuzzy match
+        match = self._aliases.best(text, self.threshold)
+        return self._alias_to_merchant[match[1]] if match else None
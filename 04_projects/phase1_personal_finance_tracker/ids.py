@@ -0,0 +1,142 @@
+"""
+IDs Module - Time-ordered transaction identifiers
+
+LEARNING OBJECTIVES:
+- How UUIDs are laid out in bits
+- Why sortable IDs are useful (creation order for free)
+- Compact in-memory representations vs. text storage
+
+FORMAT (UUID version 7 layout, 128 bits):
+    48 bits  Unix timestamp in milliseconds
+     4 bits  version (7)
+    12 bits  counter for IDs created in the same millisecond
+     2 bits  variant (0b10)
+    62 bits  random
+
+In memory an ID is kept as a single Python int (the "key"). In files
+it is still written as the usual 36-character text form, e.g.
+"01890a5d-ac96-774b-bcce-b302099a8057", so older data keeps working.
+
+Older IDs that are not UUIDs (e.g. "sample-001") stay as strings.
+
+Transactions generated from other data, like recurring occurrences,
+get a derived ID instead (UUID version 5, see derived_transaction_id):
+the same rule and date always give the same ID, so generating them
+again can be recognised. Derived IDs are not time-ordered.
+"""
+
+import os
+import time
+import uuid
+from datetime import datetime
+
+
+_COUNTER_MAX = 0xFFF
+_DERIVED_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, 'transactions.finance-tracker.local')
+_last_ms = -1
+_last_counter = 0
+
+
+def new_transaction_id():
+    """
+    Generate a new time-ordered ID
+
+    STEP 1: Read the current time in milliseconds
+    STEP 2: Bump the counter for IDs created in the same millisecond
+    STEP 3: Pack timestamp, version, counter, variant and random bits
+
+    IDs generated by one process always increase, even when the
+    clock does not move between calls.
+
+    Returns:
+        int: 128-bit ID key
+    """
+    global _last_ms, _last_counter
+
+    # STEP 1: Current time (never go backwards)
+    now_ms = max(time.time_ns() // 1_000_000, _last_ms)
+
+    # STEP 2: Counter within the millisecond
+    if now_ms == _last_ms:
+        _last_counter += 1
+        if _last_counter > _COUNTER_MAX:
+            now_ms += 1
+            _last_counter = 0
+    else:
+        _last_counter = 0
+    _last_ms = now_ms
+
+    # STEP 3: Pack the bits
+    random_bits = int.from_bytes(os.urandom(8), 'big') & ((1 << 62) - 1)
+    return ((now_ms & ((1 << 48) - 1)) << 80
+            | 0x7 << 76
+            | _last_counter << 64
+            | 0b10 << 62
+            | random_bits)
+
+
+def derived_transaction_id(*parts):
+    """
+    Deterministic ID for a transaction generated from other data
+
+    Args:
+        *parts: Values that identify the transaction, e.g. a rule ID
+            and an occurrence date (joined as text)
+
+    Returns:
+        int: 128-bit ID key (the same parts give the same key)
+    """
+    return uuid.uuid5(_DERIVED_NAMESPACE, '|'.join(str(part) for part in parts)).int
+
+
+def format_transaction_id(key):
+    """
+    Convert an ID key to its text form
+
+    Args:
+        key (int or str): ID key
+
+    Returns:
+        str: Text ID as stored in files
+    """
+    if isinstance(key, int):
+        return str(uuid.UUID(int=key))
+    return key
+
+
+def transaction_key(text_id):
+    """
+    Convert a text ID to its compact key
+
+    Canonical UUID strings (any version) become ints; anything
+    else is kept as the original string.
+
+    Args:
+        text_id (str or int): ID as stored in files (or an existing key)
+
+    Returns:
+        int or str: ID key
+    """
+    if isinstance(text_id, int) or len(text_id) != 36:
+        return text_id
+    try:
+        value = uuid.UUID(text_id)
+    except ValueError:
+        return text_id
+    # Only convert when the text round-trips exactly (e.g. lowercase)
+    return value.int if str(value) == text_id else text_id
+
+
+def id_timestamp(key):
+    """
+    Creation time encoded in a time-ordered ID
+
+    Args:
+        key (int or str): ID key
+
+    Returns:
+        datetime: Creation time, or None for IDs without a timestamp
+    """
+    if not isinstance(key, int) or (key >> 76) & 0xF != 7:
+        return None
+    return datetime.fromtimestamp((key >> 80) / 1000)
@@ -0,0 +1,369 @@
+"""
+Indexes Module - In-memory index structures for transactions
+
+LEARNING OBJECTIVES:
+- Trading memory for faster lookups
+- Hash-based grouping with dictionaries
+- Sorted sequences and binary search (bisect)
+- Keeping derived data in sync with the source list
+
+The TransactionManager keeps its transactions in a plain list. The
+indexes below are maintained next to that list so filters can jump
+straight to the matching rows instead of scanning everything.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+
+
+# A merge touches every row; for a handful of new rows in a big index
+# inserting them one by one (a C-level list shift each) is cheaper
+MERGE_FACTOR = 32
+
+
+class KeyIndex:
+    """
+    Groups transactions by a key (e.g. type or category)
+
+    STRUCTURE:
+    {
+        key: {transaction_key: transaction, ...},
+        ...
+    }
+
+    Inner dictionaries keep insertion order and allow O(1) removal.
+    """
+
+    def __init__(self, key_func):
+        """
+        Initialize an empty key index
+
+        Args:
+            key_func: Function that returns the grouping key of a transaction
+        """
+        self.key_func = key_func
+        self._groups = {}
+
+    def add(self, transaction):
+        """Add a transaction to its group"""
+        key = self.key_func(transaction)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = {}
+        group[transaction.key] = transaction
+
+    def remove(self, transaction):
+        """Remove a transaction from its group"""
+        key = self.key_func(transaction)
+        group = self._groups.get(key)
+        if group is not None:
+            group.pop(transaction.key, None)
+            if not group:
+                del self._groups[key]
+
+    def clear(self):
+        """Remove every entry"""
+        self._groups = {}
+
+    def get(self, key):
+        """
+        Iterate over transactions with the given key
+
+        Args:
+            key: Grouping key
+
+        Returns:
+            iterator: Transactions in insertion order
+        """
+        return iter(self._groups.get(key, {}).values())
+
+    def count(self, key):
+        """Number of transactions with the given key"""
+        return len(self._groups.get(key, ()))
+
+    def keys(self):
+        """All keys that currently have transactions"""
+        return self._groups.keys()
+
+
+def _insert_pairs(keys, items, pairs):
+    """Insert (key, item) pairs into parallel sorted lists one at a time"""
+    for key, item in pairs:
+        pos = bisect_right(keys, key)
+        keys.insert(pos, key)
+        items.insert(pos, item)
+
+
+class DateIndex:
+    """
+    Keeps transactions ordered by date for range lookups
+
+    HOW IT WORKS:
+    - _keys holds sortable (date ordinal, sequence) tuples
+    - _items holds the transactions in the same order
+    - bisect finds range boundaries in O(log N)
+
+    The sequence number keeps the order stable for transactions
+    on the same day (earlier insertions come first).
+    """
+
+    def __init__(self):
+        """Initialize an empty date index"""
+        self._keys = []
+        self._items = []
+        self._key_of = {}
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def add(self, transaction):
+        """
+        Insert a transaction at its sorted position
+
+        Args:
+            transaction (Transaction): Transaction to index
+        """
+        key = (transaction.date.toordinal(), self._seq)
+        self._seq += 1
+
+        # Appending in date order is the common case - skip the search
+        if not self._keys or key >= self._keys[-1]:
+            self._keys.append(key)
+            self._items.append(transaction)
+        else:
+            pos = bisect_right(self._keys, key)
+            self._keys.insert(pos, key)
+            self._items.insert(pos, transaction)
+
+        self._key_of[transaction.key] = key
+
+    def add_many(self, transactions):
+        """
+        Insert several transactions with one merge
+
+        STEP 1: Build keys for the new transactions and sort them
+        STEP 2: Append when they all come after the existing rows
+        STEP 3: Otherwise insert a few rows one by one, or merge both
+                sorted runs in a single pass
+
+        Args:
+            transactions (list): Transactions to index
+        """
+        # STEP 1: Keys for the new rows (sequence keeps input order on ties)
+        new_pairs = []
+        for transaction in transactions:
+            key = (transaction.date.toordinal(), self._seq)
+            self._seq += 1
+            new_pairs.append((key, transaction))
+            self._key_of[transaction.key] = key
+        if not new_pairs:
+            return
+        new_pairs.sort(key=lambda pair: pair[0])
+
+        # STEP 2: Fast path - nothing to merge
+        if not self._keys or new_pairs[0][0] >= self._keys[-1]:
+            self._keys.extend(pair[0] for pair in new_pairs)
+            self._items.extend(pair[1] for pair in new_pairs)
+            return
+        if len(new_pairs) * MERGE_FACTOR < len(self._keys):
+            _insert_pairs(self._keys, self._items, new_pairs)
+            return
+
+        # STEP 3: Merge the two sorted runs
+        merged = list(heapq.merge(zip(self._keys, self._items), new_pairs,
+                                  key=lambda pair: pair[0]))
+        self._keys = [pair[0] for pair in merged]
+        self._items = [pair[1] for pair in merged]
+
+    def remove(self, transaction):
+        """
+        Remove a transaction from the index
+
+        Args:
+            transaction (Transaction): Transaction to remove
+        """
+        key = self._key_of.pop(transaction.key, None)
+        if key is None:
+            return
+        pos = bisect_left(self._keys, key)
+        del self._keys[pos]
+        del self._items[pos]
+
+    def rebuild(self, transactions):
+        """
+        Rebuild the whole index with a single sort
+
+        Args:
+            transactions (list): All transactions in insertion order
+        """
+        self._keys = []
+        self._items = []
+        self._key_of = {}
+
+        # sorted() is stable, so same-day transactions keep list order
+        ordered = sorted(enumerate(transactions),
+                         key=lambda pair: pair[1].date.toordinal())
+        for seq, transaction in ordered:
+            key = (transaction.date.toordinal(), seq)
+            self._keys.append(key)
+            self._items.append(transaction)
+            self._key_of[transaction.key] = key
+        self._seq = len(transactions)
+
+    def _bounds(self, start_date=None, end_date=None):
+        """
+        Find the slice positions for an inclusive date range
+
+        Args:
+            start_date (datetime.date): First date, or None for no lower bound
+            end_date (datetime.date): Last date, or None for no upper bound
+
+        Returns:
+            tuple: (start_position, end_position)
+        """
+        lo = 0 if start_date is None else bisect_left(
+            self._keys, (start_date.toordinal(),))
+        hi = len(self._keys) if end_date is None else bisect_left(
+            self._keys, (end_date.toordinal() + 1,))
+        return lo, max(lo, hi)
+
+    def bounds(self, start_date=None, end_date=None):
+        """Positions of an inclusive date range in iteration order (start, end)"""
+        return self._bounds(start_date, end_date)
+
+    def count_between(self, start_date=None, end_date=None):
+        """Number of transactions within an inclusive date range"""
+        lo, hi = self._bounds(start_date, end_date)
+        return hi - lo
+
+    def iter_between(self, start_date=None, end_date=None, reverse=False):
+        """
+        Iterate over transactions in an inclusive date range
+
+        Args:
+            start_date (datetime.date): First date, or None for no lower bound
+            end_date (datetime.date): Last date, or None for no upper bound
+            reverse (bool): Yield newest first
+
+        Yields:
+            Transaction: Transactions in date order
+        """
+        lo, hi = self._bounds(start_date, end_date)
+        items = self._items
+        if reverse:
+            for pos in range(hi - 1, lo - 1, -1):
+                yield items[pos]
+        else:
+            for pos in range(lo, hi):
+                yield items[pos]
+
+
+class AmountIndex:
+    """
+    Keeps transactions ordered by amount for amount-range lookups
+
+    Same layout as DateIndex: sorted (amount, sequence) keys next to
+    the transactions, and bisect to find the range boundaries.
+    """
+
+    def __init__(self):
+        """Initialize an empty amount index"""
+        self._keys = []
+        self._items = []
+        self._key_of = {}
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, transaction):
+        """Insert a transaction at its sorted position"""
+        key = (transaction.amount, self._seq)
+        self._seq += 1
+        pos = bisect_right(self._keys, key)
+        self._keys.insert(pos, key)
+        self._items.insert(pos, transaction)
+        self._key_of[transaction.key] = key
+
+    def add_many(self, transactions):
+        """
+        Insert several transactions with one sort and one merge
+
+        Args:
+            transactions (list): Transactions to index
+        """
+        new_pairs = []
+        for transaction in transactions:
+            key = (transaction.amount, self._seq)
+            self._seq += 1
+            new_pairs.append((key, transaction))
+            self._key_of[transaction.key] = key
+        if not new_pairs:
+            return
+        new_pairs.sort(key=lambda pair: pair[0])
+        if len(new_pairs) * MERGE_FACTOR < len(self._keys):
+            _insert_pairs(self._keys, self._items, new_pairs)
+            return
+        merged = list(heapq.merge(zip(self._keys, self._items), new_pairs,
+                                  key=lambda pair: pair[0]))
+        self._keys = [pair[0] for pair in merged]
+        self._items = [pair[1] for pair in merged]
+
+    def remove(self, transaction):
+        """Remove a transaction from the index"""
+        key = self._key_of.pop(transaction.key, None)
+        if key is None:
+            return
+        pos = bisect_left(self._keys, key)
+        del self._keys[pos]
+        del self._items[pos]
+
+    def rebuild(self, transactions):
+        """
+        Rebuild the whole index with a single sort
+
+        Args:
+            transactions (list): All transactions in insertion order
+        """
+        self._keys = []
+        self._items = []
+        self._key_of = {}
+        self._seq = 0
+        self.add_many(transactions)
+
+    def _bounds(self, minimum=None, maximum=None):
+        """Slice positions for an inclusive amount range"""
+        lo = 0 if minimum is None else bisect_left(self._keys, (minimum,))
+        hi = len(self._keys) if maximum is None else bisect_right(
+            self._keys, (maximum, float('inf')))
+        return lo, max(lo, hi)
+
+    def count_between(self, minimum=None, maximum=None):
+        """Number of transactions within an inclusive amount range"""
+        lo, hi = self._bounds(minimum, maximum)
+        return hi - lo
+
+    def iter_between(self, minimum=None, maximum=None, reverse=False):
+        """
+        Iterate over transactions in an inclusive amount range
+
+        Args:
+            minimum (float): Smallest amount, or None for no lower bound
+            maximum (float): Largest amount, or None for no upper bound
+            reverse (bool): Yield the largest amounts first
+
+        Yields:
+            Transaction: Transactions in amount order
+        """
+        lo, hi = self._bounds(minimum, maximum)
+        items = self._items
+        if reverse:
+            for pos in range(hi - 1, lo - 1, -1):
+                yield items[pos]
+        else:
+            for pos in range(lo, hi):
+                yield items[pos]
@@ -0,0 +1,301 @@
+"""
+Ledgers Module - Host many ledgers in one process
+
+LEARNING OBJECTIVES:
+- Lazy loading: open a ledger on first use, not at start-up
+- LRU eviction under a memory budget
+- Fine-grained locking: one lock per ledger instead of one for all
+- Estimating memory use from object counts
+
+HOW IT WORKS:
+Every ledger (household, client, ...) is a data directory with its own
+FileHandler. The host keeps an entry per ledger name:
+
+- use(name) waits only for that ledger's lock, opens (loads) the ledger
+  if it is not in memory, and hands it out. Work on different ledgers
+  runs in parallel; the host-wide lock only guards the table of entries
+  and is never held while loading, saving or running user code.
+- After each use the host adds up the estimated size of the open
+  ledgers. While it is over the memory budget, the least recently used
+  idle ledger is saved (a no-op when clean) and dropped from memory.
+  It is loaded again the next time it is used.
+- A ledger whose save fails is never dropped: it stays in memory with
+  its changes, is skipped by eviction until it is used again, and is
+  listed under 'unsaved' in stats() and by close_all().
+
+USAGE:
+    host = LedgerHost('clients', memory_budget=512 * 1024 * 1024)
+    with host.use('smith-household') as ledger:
+        ledger.transaction_manager.add_transaction(transaction)
+        report = ledger.report_generator.build_monthly_report(2, 2026)
+    host.close_all()
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from file_handler import FileHandler
+from transaction import TransactionManager
+from category import CategoryManager
+from reports import ReportGenerator
+
+
+# Measured with tracemalloc: a loaded transaction with all its indexes
+# and aggregates takes about 1.5 KB; a ledger has some fixed overhead
+BYTES_PER_TRANSACTION = 1536
+BYTES_PER_LEDGER = 64 * 1024
+
+
+def estimate_ledger_bytes(ledger):
+    """
+    Rough memory use of an open ledger
+
+    Args:
+        ledger (Ledger): Open ledger
+
+    Returns:
+        int: Estimated bytes
+    """
+    return BYTES_PER_LEDGER + BYTES_PER_TRANSACTION * len(ledger.transaction_manager.transactions)
+
+
+class Ledger:
+    """
+    One open ledger: its managers and report generator
+
+    ATTRIBUTES:
+    - name: Ledger name
+    - file_handler, transaction_manager, category_manager, report_generator
+    """
+
+    def __init__(self, name, data_dir):
+        """
+        Open (load) a ledger
+
+        Args:
+            name (str): Ledger name
+            data_dir (str): Its data directory
+        """
+        self.name = name
+        self.file_handler = FileHandler(data_dir)
+        self.transaction_manager = TransactionManager(self.file_handler)
+        self.transaction_manager.load_transactions()
+        self.category_manager = CategoryManager(self.file_handler)
+        self.category_manager.load_categories()
+        self.report_generator = ReportGenerator(self.transaction_manager)
+
+    @property
+    def is_dirty(self):
+        """True when transactions or categories have unsaved changes"""
+        return self.transaction_manager.is_dirty or self.category_manager.is_dirty
+
+    def save(self):
+        """
+        Save unsaved changes (no I/O when clean)
+
+        Returns:
+            bool: True if anything was written
+        """
+        saved = self.transaction_manager.save_transactions()
+        return self.category_manager.save_categories() or saved
+
+    def save_or_keep(self):
+        """
+        Save before unloading
+
+        Returns:
+            bool: True if nothing is left unsaved (safe to unload)
+        """
+        self.save()
+        return not self.is_dirty
+
+
+class _Entry:
+    """Host bookkeeping for one ledger name (exists even while unloaded)"""
+
+    def __init__(self, name, data_dir):
+        self.name = name
+        self.data_dir = data_dir
+        self.lock = threading.Lock()
+        self.ledger = None
+        self.save_failed = False
+        self.users = 0
+        self.size = 0
+        self.last_used = 0.0
+
+
+class LedgerHost:
+    """
+    Opens, shares and evicts ledgers
+
+    Ledger names map to sub-directories of `root`; register() can
+    point a name anywhere else.
+    """
+
+    def __init__(self, root='ledgers', memory_budget=256 * 1024 * 1024,
+                 estimate=estimate_ledger_bytes):
+        """
+        Initialize host (nothing is loaded yet)
+
+        Args:
+            root (str): Directory holding one sub-directory per ledger
+            memory_budget (int): Estimated bytes of open ledgers to keep
+            estimate: Function(ledger) -> estimated bytes
+        """
+        self.root = root
+        self.memory_budget = memory_budget
+        self.estimate = estimate
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    def register(self, name, data_dir):
+        """
+        Use a specific data directory for a ledger name
+
+        Args:
+            name (str): Ledger name
+            data_dir (str): Data directory
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                self._entries[name] = _Entry(name, data_dir)
+            elif entry.ledger is not None and entry.data_dir != data_dir:
+                raise ValueError(f"Ledger '{name}' is already open from {entry.data_dir}")
+            else:
+                entry.data_dir = data_dir
+
+    def _entry(self, name):
+        """Find or create the entry of a name (host lock held by caller)"""
+        entry = self._entries.get(name)
+        if entry is None:
+            if not name or name in ('.', '..') or os.sep in name or (os.altsep and os.altsep in name):
+                raise ValueError(f"Invalid ledger name '{name}'")
+            entry = self._entries[name] = _Entry(name, os.path.join(self.root, name))
+        self._entries.move_to_end(name)
+        return entry
+
+    @contextmanager
+    def use(self, name):
+        """
+        Use a ledger exclusively for the duration of a with-block
+
+        STEP 1: Find the entry and register as a user (host lock, brief)
+        STEP 2: Take the ledger's own lock; load it if needed
+        STEP 3: Hand it out, then record its new size
+        STEP 4: Evict idle ledgers if over the memory budget
+
+        Args:
+            name (str): Ledger name
+
+        Yields:
+            Ledger: The open ledger
+        """
+        # STEP 1: Entry
+        with self._lock:
+            entry = self._entry(name)
+            entry.users += 1
+        try:
+            # STEP 2 & 3: Ledger lock, load, use
+            with entry.lock:
+                entry.save_failed = False
+                if entry.ledger is None:
+                    entry.ledger = Ledger(name, entry.data_dir)
+                    with self._lock:
+                        self.loads += 1
+                try:
+                    yield entry.ledger
+                finally:
+                    entry.size = self.estimate(entry.ledger)
+        finally:
+            with self._lock:
+                entry.users -= 1
+                entry.last_used = time.monotonic()
+
+        # STEP 4: Budget
+        self.evict()
+
+    def evict(self):
+        """
+        Unload least recently used idle ledgers until within budget
+
+        Ledgers in use (or waited for) are skipped, and so are ledgers
+        whose save failed: they stay in memory (with a warning) until
+        they are used again.
+
+        Returns:
+            int: Number of ledgers unloaded
+        """
+        with self._lock:
+            open_entries = [e for e in self._entries.values() if e.ledger is not None]
+            total = sum(e.size for e in open_entries)
+        unloaded = 0
+        for entry in open_entries:
+            if total <= self.memory_budget:
+                break
+            if not entry.lock.acquire(blocking=False):
+                continue
+            try:
+                with self._lock:
+                    if entry.users or entry.ledger is None or entry.save_failed:
+                        continue
+                if not entry.ledger.save_or_keep():
+                    entry.save_failed = True
+                    print(f"Warning: could not save ledger '{entry.name}'; keeping it in memory")
+                    continue
+                entry.ledger = None
+                total -= entry.size
+                entry.size = 0
+                unloaded += 1
+            finally:
+                entry.lock.release()
+        if unloaded:
+            with self._lock:
+                self.evictions += unloaded
+        return unloaded
+
+    def close_all(self):
+        """
+        Save and unload every ledger (waits for ledgers in use)
+
+        Returns:
+            list: Names of ledgers that could not be saved; they stay
+                open with their changes
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+        unsaved = []
+        for entry in entries:
+            with entry.lock:
+                if entry.ledger is None:
+                    continue
+                if not entry.ledger.save_or_keep():
+                    entry.save_failed = True
+                    unsaved.append(entry.name)
+                    continue
+                entry.ledger = None
+                entry.size = 0
+        return unsaved
+
+    def stats(self):
+        """
+        Current state of every known ledger
+
+        Returns:
+            dict: open (list of names, least recently used first),
+                  unsaved (open ledgers whose last save failed),
+                  estimated_bytes, memory_budget, loads, evictions
+        """
+        with self._lock:
+            open_entries = [e for e in self._entries.values() if e.ledger is not None]
+            return {'open': [e.name for e in open_entries],
+                    'unsaved': [e.name for e in open_entries if e.save_failed],
+                    'estimated_bytes': sum(e.size for e in open_entries),
+                    'memory_budget': self.memory_budget,
+                    'loads': self.loads,
+                    'evictions': self.evictions}
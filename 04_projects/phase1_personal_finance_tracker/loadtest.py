@@ -0,0 +1,191 @@
+"""
+Load Test - Measure the API server (server.py)
+
+LEARNING OBJECTIVES:
+- Generating concurrent load with asyncio
+- Throughput (requests per second) versus latency
+- Why percentiles (p50, p99) say more than an average
+
+HOW IT WORKS:
+Each of `connections` clients opens one keep-alive connection and sends
+requests back to back until the shared request budget is used up. The
+time of every request is recorded; at the end the totals, requests per
+second and latency percentiles are printed per endpoint and overall.
+
+USAGE:
+    python server.py --data-dir data &
+    python loadtest.py --connections 32 --requests 5000
+    python loadtest.py --write-ratio 0.1          # 10% POST /transactions
+
+Writes add real transactions to the ledger; point the server at a copy
+of your data when testing them.
+"""
+
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from datetime import date, timedelta
+
+
+READ_PATHS = [
+    '/balance',
+    '/transactions?limit=20',
+    '/transactions?type=expense&sort=amount&desc=1&limit=10',
+    '/categories/summary?start={month_start}&end={today}',
+    '/reports/{month}',
+]
+
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile
+
+    Args:
+        sorted_values (list): Values in ascending order
+        fraction (float): 0.5 for the median, 0.99 for p99, ...
+
+    Returns:
+        float: The percentile (0.0 for no values)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(fraction * len(sorted_values) + 0.5))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _paths():
+    """Read paths with today's dates filled in"""
+    today = date.today()
+    values = {'today': today.isoformat(),
+              'month_start': today.replace(day=1).isoformat(),
+              'month': today.strftime("%Y-%m")}
+    return [path.format(**values) for path in READ_PATHS]
+
+
+def _write_body(rng):
+    """A random expense for POST /transactions"""
+    day = date.today() - timedelta(days=rng.randint(0, 365))
+    return json.dumps({'type': 'expense', 'amount': round(rng.uniform(1, 200), 2),
+                       'category': rng.choice(['Food', 'Transport', 'Shopping']),
+                       'description': f"load test {rng.getrandbits(48):x}",
+                       'date': day.isoformat()}).encode('utf-8')
+
+
+async def _request(reader, writer, method, path, host, body=b''):
+    """
+    Send one request on an open connection and read the response
+
+    Returns:
+        int: HTTP status
+    """
+    head = (f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+            f"Content-Length: {len(body)}\r\n")
+    if body:
+        head += "Content-Type: application/json\r\n"
+    writer.write((head + "\r\n").encode('latin-1') + body)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def _client(host, port, budget, paths, write_ratio, rng, samples):
+    """One connection sending requests until the budget is used up"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while budget[0] > 0:
+            budget[0] -= 1
+            if rng.random() < write_ratio:
+                name, method, path, body = 'POST /transactions', 'POST', '/transactions', _write_body(rng)
+            else:
+                path = rng.choice(paths)
+                name, method, body = 'GET ' + path.split('?')[0], 'GET', b''
+            started = time.perf_counter()
+            status = await _request(reader, writer, method, path, host, body)
+            samples.append((name, time.perf_counter() - started, status))
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, connections=16, requests=2000, write_ratio=0.0, seed=1):
+    """
+    Run a load test
+
+    Args:
+        host (str): Server host
+        port (int): Server port
+        connections (int): Concurrent keep-alive connections
+        requests (int): Total requests over all connections
+        write_ratio (float): Share of POST /transactions requests (0.0 - 1.0)
+        seed (int): Random seed (repeatable request mix)
+
+    Returns:
+        tuple: (list of (endpoint, seconds, status), elapsed seconds)
+    """
+    budget = [requests]
+    samples = []
+    paths = _paths()
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, budget, paths, write_ratio, random.Random(seed + i), samples)
+        for i in range(connections)))
+    return samples, time.perf_counter() - started
+
+
+def print_summary(samples, elapsed):
+    """Print throughput and latency percentiles per endpoint and overall"""
+    groups = {}
+    for name, seconds, status in samples:
+        groups.setdefault(name, []).append((seconds, status))
+
+    print(f"\n{'Endpoint':<28} {'Requests':>8} {'Errors':>6} "
+          f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    print("-" * 80)
+    rows = sorted(groups.items()) + [('ALL', [(s, st) for _, s, st in samples])]
+    for name, values in rows:
+        latencies = sorted(seconds * 1000 for seconds, _ in values)
+        errors = sum(1 for _, status in values if status >= 400)
+        print(f"{name:<28} {len(values):>8} {errors:>6} "
+              f"{percentile(latencies, 0.5):>8.2f} {percentile(latencies, 0.9):>8.2f} "
+              f"{percentile(latencies, 0.99):>8.2f} {latencies[-1] if latencies else 0:>8.2f}")
+    print("-" * 80)
+    print(f"{len(samples)} requests in {elapsed:.2f} s = "
+          f"{len(samples) / elapsed if elapsed else 0:,.0f} requests/second")
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Load test for server.py")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--connections', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--write-ratio', type=float, default=0.0,
+                        help="Share of requests that add a transaction (default 0)")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    try:
+        samples, elapsed = asyncio.run(run_load(args.host, args.port, args.connections,
+                                                args.requests, args.write_ratio, args.seed))
+    except OSError as e:
+        print(f"Cannot reach the server at {args.host}:{args.port}: {e}", file=sys.stderr)
+        return 1
+    print_summary(samples, elapsed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
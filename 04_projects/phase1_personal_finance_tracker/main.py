@@ -16,9 +16,13 @@ import sys
 from datetime import datetime
 from transaction import Transaction, TransactionManager
 from category import CategoryManager
+from recurring import RecurringManager
 from reports import ReportGenerator
+from pager import TransactionPager, text_filter, all_of
 from file_handler import FileHandler
+from watcher import LedgerWatcher
 from utils import clear_screen, print_header, get_valid_input, format_currency
+from table import Screen, Table, show, TEXT, CURRENCY
 
 
 def display_menu():
@@ -31,22 +35,57 @@ def display_menu():
     STEP 4: Show current balance
     """
     clear_screen()
-    print_header("PERSONAL FINANCE TRACKER")
-    
-    print("\n📊 MAIN MENU")
-    print("=" * 60)
-    print("1.  💰 Add Income")
-    print("2.  💸 Add Expense")
-    print("3.  📋 View All Transactions")
-    print("4.  🔍 Filter Transactions")
-    print("5.  📈 Monthly Report")
-    print("6.  📊 Category Summary")
-    print("7.  💵 View Balance")
-    print("8.  🗑️  Delete Transaction")
-    print("9.  📁 Export to CSV")
-    print("10. ⚙️  Manage Categories")
-    print("0.  🚪 Exit")
-    print("=" * 60)
+    screen = Screen(60)
+    screen.header("PERSONAL FINANCE TRACKER")
+    
+    screen.line("\n📊 MAIN MENU")
+    screen.rule("=")
+    screen.lines([
+        "1.  💰 Add Income",
+        "2.  💸 Add Expense",
+        "3.  📋 View All Transactions",
+        "4.  🔍 Filter Transactions",
+        "5.  📈 Monthly Report",
+        "6.  📊 Category Summary",
+        "7.  💵 View Balance",
+        "8.  🗑️  Delete Transaction",
+        "9.  📁 Export to CSV",
+        "10. ⚙️  Manage Categories",
+        "0.  🚪 Exit"
+    ])
+    screen.rule("=")
+    screen.flush()
+
+
+def confirm_not_duplicate(transaction_manager, transaction):
+    """
+    Warn about possible duplicates and ask whether to add anyway
+    
+    Args:
+        transaction_manager: TransactionManager to check against
+        transaction: New transaction (not yet added)
+        
+    Returns:
+        bool: True if the transaction should be added
+    """
+    duplicates = transaction_manager.find_duplicates(transaction)
+    if not duplicates:
+        return True
+    
+    screen = Screen()
+    screen.line(f"\n⚠️  This looks like {len(duplicates)} existing transaction(s):")
+    screen.lines(f"   {trans}" for trans in duplicates[:3])
+    screen.flush()
+    answer = input("Add it anyway? (y/n): ").strip().lower()
+    return answer == 'y'
+
+
+def show_categories(categories):
+    """Show a numbered category list (one write)"""
+    screen = Screen()
+    screen.line("\nCategories:")
+    screen.lines(f"{idx}. {cat}" for idx, cat in enumerate(categories, 1))
+    screen.flush()
 
 
 def add_income(transaction_manager, category_manager):
@@ -59,28 +98,24 @@ def add_income(transaction_manager, category_manager):
     STEP 4: Add to transaction manager
     STEP 5: Save to file
     """
-    print("\n" + "=" * 60)
-    print("💰 ADD INCOME".center(60))
-    print("=" * 60)
+    Screen(60).line().header("💰 ADD INCOME").flush()
     
     try:
         # STEP 1: Get amount
         amount = float(input("\nAmount: $"))
         if amount <= 0:
-            print("❌ Amount must be positive!")
+            show("❌ Amount must be positive!")
             return
         
         # STEP 2: Select category
         categories = category_manager.get_categories('income')
-        print("\nCategories:")
-        for idx, cat in enumerate(categories, 1):
-            print(f"{idx}. {cat}")
+        show_categories(categories)
         
         cat_choice = int(input("\nSelect category (number): "))
         if 1 <= cat_choice <= len(categories):
             category = categories[cat_choice - 1]
         else:
-            print("❌ Invalid category!")
+            show("❌ Invalid category!")
             return
         
         # STEP 3: Get description
@@ -97,13 +132,17 @@ def add_income(transaction_manager, category_manager):
         
         # STEP 5: Create and add transaction
         transaction = Transaction('income', amount, category, description, date)
+        if not confirm_not_duplicate(transaction_manager, transaction):
+            show("\n↩️  Transaction not added.")
+            input("\nPress Enter to continue...")
+            return
         transaction_manager.add_transaction(transaction)
         
-        print(f"\n✅ Income of {format_currency(amount)} added successfully!")
+        show(f"\n✅ Income of {format_currency(amount)} added successfully!")
         input("\nPress Enter to continue...")
         
     except ValueError:
-        print("❌ Invalid input! Please try again.")
+        show("❌ Invalid input! Please try again.")
         input("\nPress Enter to continue...")
 
 
@@ -117,27 +156,23 @@ def add_expense(transaction_manager, category_manager):
     STEP 4: Add to transaction manager
     STEP 5: Save to file
     """
-    print("\n" + "=" * 60)
-    print("💸 ADD EXPENSE".center(60))
-    print("=" * 60)
+    Screen(60).line().header("💸 ADD EXPENSE").flush()
     
     try:
         # Similar to add_income but for expenses
         amount = float(input("\nAmount: $"))
         if amount <= 0:
-            print("❌ Amount must be positive!")
+            show("❌ Amount must be positive!")
             return
         
         categories = category_manager.get_categories('expense')
-        print("\nCategories:")
-        for idx, cat in enumerate(categories, 1):
-            print(f"{idx}. {cat}")
+        show_categories(categories)
         
         cat_choice = int(input("\nSelect category (number): "))
         if 1 <= cat_choice <= len(categories):
             category = categories[cat_choice - 1]
         else:
-            print("❌ Invalid category!")
+            show("❌ Invalid category!")
             return
         
         description = input("Description: ").strip()
@@ -151,48 +186,177 @@ def add_expense(transaction_manager, category_manager):
             date = datetime.now().date()
         
         transaction = Transaction('expense', amount, category, description, date)
+        if not confirm_not_duplicate(transaction_manager, transaction):
+            show("\n↩️  Transaction not added.")
+            input("\nPress Enter to continue...")
+            return
         transaction_manager.add_transaction(transaction)
         
-        print(f"\n✅ Expense of {format_currency(amount)} added successfully!")
+        show(f"\n✅ Expense of {format_currency(amount)} added successfully!")
         input("\nPress Enter to continue...")
         
     except ValueError:
-        print("❌ Invalid input! Please try again.")
+        show("❌ Invalid input! Please try again.")
         input("\nPress Enter to continue...")
 
 
-def view_transactions(transaction_manager):
+# Fixed widths keep the columns still while paging
+TRANSACTION_TABLE = Table([('Date', TEXT, 10), ('Type', TEXT, 8),
+                           ('Amount', CURRENCY, 12), ('Category', TEXT, 15),
+                           ('Description', TEXT, 27)])
+
+
+def add_transaction_table(screen, transactions):
     """
-    Display all transactions
+    Add a table of transactions to a screen
     
-    STEP 1: Get all transactions
-    STEP 2: Sort by date
-    STEP 3: Display in tabular format
+    Args:
+        screen (Screen): Screen to add to
+        transactions (list): Transactions to show (one page)
     """
-    print("\n" + "=" * 80)
-    print("📋 ALL TRANSACTIONS".center(80))
-    print("=" * 80)
-    
-    transactions = transaction_manager.get_all_transactions()
+    screen.table(TRANSACTION_TABLE, [
+        [str(trans.date), trans.type.capitalize(), trans.amount,
+         trans.category, trans.description]
+        for trans in transactions])
+
+
+def view_transactions(transaction_manager, page_size=20):
+    """
+    Display transactions one page at a time
     
+    STEP 1: Get a snapshot (already date-ordered, no sorting needed)
+    STEP 2: Page through it (see browse_transactions)
+    """
+    # STEP 1: Snapshot
+    transactions = transaction_manager.snapshot()
     if not transactions:
-        print("\n📝 No transactions yet. Add your first transaction!")
-    else:
-        # STEP: Display header
-        print(f"\n{'Date':<12} {'Type':<10} {'Amount':<12} {'Category':<15} {'Description':<30}")
-        print("-" * 80)
+        show("\n📝 No transactions yet. Add your first transaction!")
+        input("\nPress Enter to continue...")
+        return
+    
+    # STEP 2: Page
+    browse_transactions(TransactionPager(transactions.sorted_by_date, page_size),
+                        "📋 ALL TRANSACTIONS")
+
+
+def browse_transactions(pager, title, summary_lines=()):
+    """
+    Show a pager one page at a time until the user quits
+    
+    STEP 1: Show the summary lines and only the current page
+    STEP 2: Let the user page, jump to a date or filter as they go
+    
+    COMMANDS:
+    - Enter / n: next page        - p: previous page
+    - j YYYY-MM-DD: jump to date  - /text: filter (/ alone clears)
+    - q: back to the menu
+    
+    Args:
+        pager (TransactionPager): Rows to show
+        title (str): Screen title
+        summary_lines (list): Lines shown above the rows
+    """
+    base_filter = pager.predicate
+    filter_text = ""
+    message = ""
+    
+    while True:
+        # STEP 1: Current page
+        clear_screen()
+        screen = Screen(80)
+        screen.header(title)
+        screen.lines(summary_lines)
+        screen.line()
+        rows = pager.page()
+        add_transaction_table(screen, rows)
+        if not rows:
+            screen.line("(no matching transactions)")
+        screen.rule()
         
-        # STEP: Display each transaction
-        for trans in sorted(transactions, key=lambda x: x.date, reverse=True):
-            type_icon = "💰" if trans.type == 'income' else "💸"
-            print(f"{trans.date} {type_icon} {trans.type.capitalize():<8} "
-                  f"{format_currency(trans.amount):<12} {trans.category:<15} "
-                  f"{trans.description[:30]:<30}")
+        status = f"Rows from #{pager.position + 1} of {pager.total}"
+        if filter_text:
+            status += f" | filter: '{filter_text}'"
+        screen.line(status)
+        if message:
+            screen.line(message)
+            message = ""
+        screen.flush()
         
-        print("-" * 80)
-        print(f"Total transactions: {len(transactions)}")
+        # STEP 2: Navigation
+        command = input("\n[Enter/n] next  [p] prev  [j DATE] jump  [/text] filter  [q] quit: ").strip()
+        if command in ("", "n"):
+            if not pager.next_page():
+                message = "ℹ️  No more transactions."
+        elif command == "p":
+            if not pager.previous_page():
+                message = "ℹ️  Already at the first page."
+        elif command.startswith("j"):
+            try:
+                day = datetime.strptime(command[1:].strip(), "%Y-%m-%d").date()
+                pager.jump_to_date(day)
+            except ValueError:
+                message = "❌ Use: j YYYY-MM-DD"
+        elif command.startswith("/"):
+            filter_text = command[1:].strip()
+            pager.set_filter(all_of(base_filter, text_filter(filter_text) if filter_text else None))
+        elif command == "q":
+            return
+        else:
+            message = "❌ Unknown command."
+
+
+def filter_transactions(transaction_manager, page_size=20):
+    """
+    Filter transactions and page through the results
     
-    input("\nPress Enter to continue...")
+    STEP 1: Ask for the filters (Enter skips one)
+    STEP 2: Build an indexed query (see query.py)
+    STEP 3: Show count and totals first, then page the rows
+    """
+    Screen(60).line().header("🔍 FILTER TRANSACTIONS").flush()
+    
+    try:
+        # STEP 1: Filters
+        show("\nPress Enter to skip a filter.")
+        trans_type = input("Type (income/expense): ").strip().lower() or None
+        categories = [c.strip() for c in input("Categories (comma-separated): ").split(",")
+                      if c.strip()]
+        start_input = input("Start date (YYYY-MM-DD): ").strip()
+        end_input = input("End date (YYYY-MM-DD): ").strip()
+        min_input = input("Minimum amount: ").strip()
+        max_input = input("Maximum amount: ").strip()
+        words = input("Description words (e.g. coffee OR tea, uber*): ").strip()
+        
+        # STEP 2: Query
+        query = (transaction_manager.query()
+                 .of_type(trans_type)
+                 .in_categories(*categories)
+                 .between(datetime.strptime(start_input, "%Y-%m-%d").date() if start_input else None,
+                          datetime.strptime(end_input, "%Y-%m-%d").date() if end_input else None)
+                 .amount_between(float(min_input) if min_input else None,
+                                 float(max_input) if max_input else None)
+                 .search(words))
+        
+        # STEP 3: Totals, then rows
+        (count, total_income, total_expense), rows, predicate = query.page_source()
+        if not count:
+            show("\n📭 No transactions match these filters.")
+            input("\nPress Enter to continue...")
+            return
+        pager = TransactionPager(rows, page_size)
+        pager.set_filter(predicate)
+        
+    except ValueError as e:
+        show(f"❌ Invalid input! {e}")
+        input("\nPress Enter to continue...")
+        return
+    
+    summary_lines = [
+        f"Matches: {count:,}",
+        f"Income: {format_currency(total_income)}   Expenses: {format_currency(total_expense)}"
+        f"   Net: {format_currency(total_income - total_expense)}",
+    ]
+    browse_transactions(pager, "🔍 FILTERED TRANSACTIONS", summary_lines)
 
 
 def view_balance(transaction_manager):
@@ -204,31 +368,31 @@ def view_balance(transaction_manager):
     STEP 3: Calculate net balance
     STEP 4: Display summary
     """
-    print("\n" + "=" * 60)
-    print("💵 CURRENT BALANCE".center(60))
-    print("=" * 60)
+    Screen(60).line().header("💵 CURRENT BALANCE").flush()
     
     total_income, total_expense = transaction_manager.get_totals()
     balance = total_income - total_expense
     
-    print(f"\n{'Total Income:':<20} {format_currency(total_income):>15}")
-    print(f"{'Total Expenses:':<20} {format_currency(total_expense):>15}")
-    print("-" * 60)
-    print(f"{'Net Balance:':<20} {format_currency(balance):>15}")
+    screen = Screen(60)
+    screen.line(f"\n{'Total Income:':<20} {format_currency(total_income):>15}")
+    screen.line(f"{'Total Expenses:':<20} {format_currency(total_expense):>15}")
+    screen.rule()
+    screen.line(f"{'Net Balance:':<20} {format_currency(balance):>15}")
     
     # Visual indicator
     if balance > 0:
-        print("\n✅ You're in the positive! Great job! 🎉")
+        screen.line("\n✅ You're in the positive! Great job! 🎉")
     elif balance < 0:
-        print("\n⚠️ You're spending more than earning! Watch out! 💸")
+        screen.line("\n⚠️ You're spending more than earning! Watch out! 💸")
     else:
-        print("\n💼 Breaking even!")
+        screen.line("\n💼 Breaking even!")
     
-    print("=" * 60)
+    screen.rule("=")
+    screen.flush()
     input("\nPress Enter to continue...")
 
 
-def monthly_report(transaction_manager):
+def monthly_report(report_generator):
     """
     Generate monthly financial report
     
@@ -238,23 +402,48 @@ def monthly_report(transaction_manager):
     STEP 4: Show category breakdown
     STEP 5: Display visual chart
     """
-    print("\n" + "=" * 60)
-    print("📈 MONTHLY REPORT".center(60))
-    print("=" * 60)
+    Screen(60).line().header("📈 MONTHLY REPORT").flush()
     
     try:
         month = int(input("\nMonth (1-12): "))
         year = int(input("Year (e.g., 2026): "))
         
         if not (1 <= month <= 12):
-            print("❌ Invalid month!")
+            show("❌ Invalid month!")
             return
         
-        report_gen = ReportGenerator(transaction_manager)
-        report_gen.generate_monthly_report(month, year)
+        report_generator.generate_monthly_report(month, year)
         
     except ValueError:
-        print("❌ Invalid input!")
+        show("❌ Invalid input!")
+    
+    input("\nPress Enter to continue...")
+
+
+def category_summary(report_generator):
+    """
+    Show totals, counts, share and month-over-month change per category
+    
+    STEP 1: Get the date range (defaults: this month so far)
+    STEP 2: Build the summary from the pre-aggregated totals
+    STEP 3: Display it
+    """
+    Screen(60).line().header("📊 CATEGORY SUMMARY").flush()
+    
+    try:
+        # STEP 1: Date range
+        today = datetime.now().date()
+        start_input = input("\nStart date (YYYY-MM-DD) or press Enter for the 1st of this month: ").strip()
+        end_input = input("End date (YYYY-MM-DD) or press Enter for today: ").strip()
+        start_date = (datetime.strptime(start_input, "%Y-%m-%d").date()
+                      if start_input else today.replace(day=1))
+        end_date = datetime.strptime(end_input, "%Y-%m-%d").date() if end_input else today
+        
+        # STEP 2 & 3: Build and display
+        report_generator.print_report(report_generator.build_category_summary(start_date, end_date))
+        
+    except ValueError as e:
+        show(f"❌ Invalid input! {e}")
     
     input("\nPress Enter to continue...")
 
@@ -272,21 +461,38 @@ def main():
     - Transaction Manager: Handles all transaction operations
     - Category Manager: Manages income/expense categories
     - File Handler: Handles data persistence
+    - Recurring Manager: Adds due recurring transactions on start-up
     - Report Generator: Creates financial reports
     """
     # STEP 1: Initialize components
     file_handler = FileHandler()
     category_manager = CategoryManager(file_handler)
     transaction_manager = TransactionManager(file_handler)
+    recurring_manager = RecurringManager(file_handler, transaction_manager)
+    report_generator = ReportGenerator(transaction_manager)
     
     # STEP 2: Load existing data
     transaction_manager.load_transactions()
     category_manager.load_categories()
+    recurring_manager.load_rules()
+    
+    # Add recurring transactions that became due since the last run
+    added = recurring_manager.commit_due()
+    if added:
+        show(f"\n🔁 Added {added} recurring transaction(s).")
+        input("\nPress Enter to continue...")
+    
+    # Pick up changes other programs make to the data files
+    watcher = LedgerWatcher(transaction_manager)
     
     # STEP 3: Main application loop
     while True:
         display_menu()
         
+        added, removed = watcher.poll()
+        if added or removed:
+            show(f"\n🔄 Data file changed elsewhere: {added} transaction(s) added, {removed} removed.")
+        
         choice = input("\nEnter your choice: ").strip()
         
         if choice == "1":
@@ -296,38 +502,39 @@ def main():
         elif choice == "3":
             view_transactions(transaction_manager)
         elif choice == "4":
-            # Filter transactions (to be implemented)
-            print("\n🔍 Filter feature coming soon!")
-            input("\nPress Enter to continue...")
+            filter_transactions(transaction_manager)
         elif choice == "5":
-            monthly_report(transaction_manager)
+            monthly_report(report_generator)
         elif choice == "6":
-            # Category summary (to be implemented)
-            print("\n📊 Category summary coming soon!")
-            input("\nPress Enter to continue...")
+            category_summary(report_generator)
         elif choice == "7":
             view_balance(transaction_manager)
         elif choice == "8":
             # Delete transaction (to be implemented)
-            print("\n🗑️ Delete feature coming soon!")
+            show("\n🗑️ Delete feature coming soon!")
             input("\nPress Enter to continue...")
         elif choice == "9":
             # Export to CSV (to be implemented)
-            print("\n📁 Export feature coming soon!")
+            show("\n📁 Export feature coming soon!")
             input("\nPress Enter to continue...")
         elif choice == "10":
             # Manage categories (to be implemented)
-            print("\n⚙️ Category management coming soon!")
+            show("\n⚙️ Category management coming soon!")
             input("\nPress Enter to continue...")
         elif choice == "0":
             # STEP 4: Save data before exit
-            transaction_manager.save_transactions()
-            category_manager.save_categories()
-            print("\n👋 Thank you for using Personal Finance Tracker!")
-            print("💾 Data saved successfully. Goodbye!\n")
+            # (no-ops when nothing changed, so a read-only session writes nothing)
+            saved = transaction_manager.save_transactions()
+            saved = category_manager.save_categories() or saved
+            if transaction_manager.is_dirty or category_manager.is_dirty:
+                show("\n❌ Your changes could not be saved (see the error above).")
+                if input("Exit anyway and lose them? (y/n): ").strip().lower() != 'y':
+                    continue
+            show("\n👋 Thank you for using Personal Finance Tracker!")
+            show("💾 Data saved successfully. Goodbye!\n" if saved else "Goodbye!\n")
             sys.exit(0)
         else:
-            print("\n❌ Invalid choice! Please select a valid option.")
+            show("\n❌ Invalid choice! Please select a valid option.")
             input("\nPress Enter to continue...")
 
 
@@ -341,9 +548,9 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print("\n\n👋 Application interrupted. Goodbye!")
+        show("\n\n👋 Application interrupted. Goodbye!")
         sys.exit(0)
     except Exception as e:
-        print(f"\n❌ An unexpected error occurred: {e}")
-        print("Please report this issue.")
+        show(f"\n❌ An unexpected error occurred: {e}")
+        show("Please report this issue.")
         sys.exit(1)
@@ -0,0 +1,220 @@
+"""
+Pager Module - Page through transactions one screen at a time
+
+LEARNING OBJECTIVES:
+- Lazy evaluation: only fetch what is shown
+- Binary search to jump to a position (jump to date)
+- Filtering while scanning instead of filtering everything up front
+
+HOW IT WORKS:
+The pager reads a sequence that is already sorted by date (a ledger
+snapshot), so it never sorts. A page is produced by scanning forward
+from the current position until `page_size` rows pass the filter.
+Without a filter that is exactly `page_size` rows; with a filter the
+scan stops as soon as the page is full. Going back scans backwards the
+same way, and jumping to a date is a binary search.
+
+The first screen therefore costs the same for 100 or 1,000,000 rows.
+"""
+
+
+class TransactionPager:
+    """
+    Pages over date-ordered transactions
+
+    USAGE:
+        pager = TransactionPager(manager.snapshot().sorted_by_date)
+        rows = pager.page()
+        pager.next_page()
+        pager.jump_to_date(date(2026, 1, 1))
+        pager.set_filter(lambda t: 'coffee' in t.description.lower())
+    """
+
+    def __init__(self, transactions, page_size=20, newest_first=True):
+        """
+        Initialize pager
+
+        Args:
+            transactions (sequence): Transactions sorted by date, oldest
+                first (must support len() and indexing)
+            page_size (int): Rows per page
+            newest_first (bool): Show the newest transactions first
+        """
+        if page_size < 1:
+            raise ValueError("Page size must be at least 1")
+        self.transactions = transactions
+        self.page_size = page_size
+        self.newest_first = newest_first
+        self.predicate = None
+        self.position = 0
+        self._rows = None
+        self._next_position = 0
+
+    @property
+    def total(self):
+        """Number of transactions (before filtering)"""
+        return len(self.transactions)
+
+    def _at(self, position):
+        """Transaction at a position in display order"""
+        if self.newest_first:
+            return self.transactions[len(self.transactions) - 1 - position]
+        return self.transactions[position]
+
+    def _accepts(self, transaction):
+        """True when a transaction passes the filter"""
+        return self.predicate is None or self.predicate(transaction)
+
+    def _scan_forward(self, position):
+        """
+        Collect up to page_size matching rows starting at a position
+
+        Returns:
+            tuple: (rows, position after the last scanned row)
+        """
+        rows = []
+        total = self.total
+        while position < total and len(rows) < self.page_size:
+            transaction = self._at(position)
+            if self._accepts(transaction):
+                rows.append(transaction)
+            position += 1
+        return rows, position
+
+    def page(self):
+        """
+        Rows of the current page (fetched once, then reused)
+
+        Returns:
+            list: Up to page_size transactions
+        """
+        if self._rows is None:
+            self._rows, self._next_position = self._scan_forward(self.position)
+        return self._rows
+
+    @property
+    def has_previous(self):
+        """True when there are rows before the current page"""
+        return self.position > 0
+
+    @property
+    def has_next(self):
+        """True when rows after the current page have not been scanned yet"""
+        self.page()
+        return self._next_position < self.total
+
+    def next_page(self):
+        """
+        Move to the next page
+
+        Returns:
+            bool: False when there are no more matching rows
+        """
+        self.page()
+        rows, after = self._scan_forward(self._next_position)
+        if not rows:
+            self._next_position = self.total
+            return False
+        self.position = self._next_position
+        self._rows = rows
+        self._next_position = after
+        return True
+
+    def previous_page(self):
+        """
+        Move to the previous page (scans backwards)
+
+        Returns:
+            bool: False when already at the start
+        """
+        position = self.position - 1
+        found = 0
+        start = None
+        while position >= 0 and found < self.page_size:
+            if self._accepts(self._at(position)):
+                found += 1
+                start = position
+            position -= 1
+        if start is None:
+            return False
+        self.position = start
+        self._rows = None
+        return True
+
+    def first_page(self):
+        """Move to the first page"""
+        self.position = 0
+        self._rows = None
+
+    def jump_to_date(self, day):
+        """
+        Move to the first row on a date (or the nearest one after it in
+        display order)
+
+        Args:
+            day (datetime.date): Date to jump to
+        """
+        # Binary search in the oldest-first sequence
+        target = day.toordinal()
+        transactions = self.transactions
+        lo, hi = 0, len(transactions)
+        if self.newest_first:
+            # First row after the day; everything before it is on or before the day
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if transactions[mid].date.toordinal() <= target:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            self.position = len(transactions) - lo
+        else:
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if transactions[mid].date.toordinal() < target:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            self.position = lo
+        self._rows = None
+
+    def set_filter(self, predicate):
+        """
+        Filter rows while scanning and go back to the first page
+
+        Args:
+            predicate: Function(transaction) -> bool, or None to clear
+        """
+        self.predicate = predicate
+        self.first_page()
+
+
+def text_filter(text):
+    """
+    Filter matching text in the description or category (case-insensitive)
+
+    Args:
+        text (str): Text to look for
+
+    Returns:
+        function: Predicate for TransactionPager.set_filter
+    """
+    needle = text.lower()
+    return lambda t: needle in t.description.lower() or needle in t.category.lower()
+
+
+def all_of(*predicates):
+    """
+    Combine filters; a row must pass all of them
+
+    Args:
+        *predicates: Predicates, None entries are ignored
+
+    Returns:
+        function: Combined predicate, or None when there is nothing to check
+    """
+    checks = [p for p in predicates if p is not None]
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    return lambda t: all(check(t) for check in checks)
@@ -0,0 +1,476 @@
+"""
+Query Module - Lazy, chainable transaction queries
+
+LEARNING OBJECTIVES:
+- Builder pattern (method chaining)
+- Lazy evaluation with generators
+- Choosing an access path (a tiny query planner)
+- Streaming aggregation without intermediate lists
+
+USAGE:
+    query = (manager.query()
+             .of_type('expense')
+             .in_categories('Food', 'Transport')
+             .between(date(2026, 1, 1), date(2026, 3, 31))
+             .order_by('amount', reverse=True)
+             .limit(10))
+
+    for trans in query:          # Nothing runs until iteration
+        print(trans)
+
+    print(query.count(), query.total())
+
+    manager.query().search('amazon OR uber*')    # Uses the word index
+"""
+
+import heapq
+from collections import defaultdict
+
+
+SORT_FIELDS = ('date', 'amount', 'category', 'type', 'description')
+
+# Conditions each access path already guarantees for the rows it returns
+_COVERED_BY = {
+    'scan': (),
+    'date': ('start_date', 'end_date'),
+    'amount': ('min_amount', 'max_amount'),
+    'type': ('type',),
+    'category': ('categories',),
+    'text': (),
+}
+
+
+class TransactionQuery:
+    """
+    Immutable description of a transaction filter
+
+    Every builder method returns a NEW query, so a base query can be
+    reused and refined without affecting other users of it.
+
+    PLANNING:
+    When the query runs, the planner estimates how many rows each
+    available index would return (type, category, date range, amount
+    range, words) and streams from the smallest one. Remaining conditions are checked
+    row by row as the rows flow through.
+    """
+
+    def __init__(self, manager):
+        """
+        Initialize an empty query (matches every transaction)
+
+        Args:
+            manager (TransactionManager): Source of transactions and indexes
+        """
+        self._manager = manager
+        self._type = None
+        self._categories = None
+        self._start_date = None
+        self._end_date = None
+        self._min_amount = None
+        self._max_amount = None
+        self._text = None
+        self._search = None
+        self._order_field = None
+        self._reverse = False
+        self._limit = None
+
+    def _clone(self, **changes):
+        """Copy this query and apply attribute changes"""
+        query = TransactionQuery.__new__(TransactionQuery)
+        query.__dict__.update(self.__dict__)
+        for name, value in changes.items():
+            setattr(query, '_' + name, value)
+        return query
+
+    # ------------------------------------------------------------------
+    # Builder methods
+    # ------------------------------------------------------------------
+
+    def of_type(self, trans_type):
+        """
+        Keep only 'income' or 'expense' transactions
+
+        Args:
+            trans_type (str): 'income', 'expense' or None for both
+        """
+        if trans_type not in (None, 'income', 'expense'):
+            raise ValueError("Transaction type must be 'income' or 'expense'")
+        return self._clone(type=trans_type)
+
+    def in_categories(self, *categories):
+        """
+        Keep only transactions in any of the given categories
+
+        Args:
+            *categories (str): Category names (none means all categories)
+        """
+        return self._clone(categories=frozenset(categories) or None)
+
+    def between(self, start_date=None, end_date=None):
+        """
+        Keep only transactions in an inclusive date range
+
+        Args:
+            start_date (datetime.date): First date, or None for no lower bound
+            end_date (datetime.date): Last date, or None for no upper bound
+        """
+        return self._clone(start_date=start_date, end_date=end_date)
+
+    def amount_between(self, minimum=None, maximum=None):
+        """
+        Keep only transactions whose amount is in an inclusive range
+
+        Args:
+            minimum (float): Smallest amount, or None for no lower bound
+            maximum (float): Largest amount, or None for no upper bound
+        """
+        return self._clone(min_amount=minimum, max_amount=maximum)
+
+    def matching(self, text):
+        """
+        Keep only transactions whose description contains the text
+
+        Args:
+            text (str): Case-insensitive search text (empty means no filter)
+        """
+        text = text.strip().lower() if text else None
+        return self._clone(text=text or None)
+
+    def search(self, text):
+        """
+        Keep only transactions whose description matches a word search
+
+        Unlike matching(), this uses the word index, so it stays fast
+        on large ledgers. Supports AND, OR and prefix* terms (see search.py).
+
+        Args:
+            text (str): Search string (empty means no filter)
+        """
+        text = text.strip() if text else None
+        return self._clone(search=text or None)
+
+    def order_by(self, field='date', reverse=False):
+        """
+        Sort the results
+
+        Args:
+            field (str): One of SORT_FIELDS
+            reverse (bool): Sort descending
+        """
+        if field not in SORT_FIELDS:
+            raise ValueError(f"Cannot sort by '{field}'")
+        return self._clone(order_field=field, reverse=reverse)
+
+    def limit(self, count):
+        """
+        Return at most `count` results
+
+        Args:
+            count (int): Maximum number of results, or None for no limit
+        """
+        if count is not None and count < 0:
+            raise ValueError("Limit must not be negative")
+        return self._clone(limit=count)
+
+    # ------------------------------------------------------------------
+    # Planning and execution
+    # ------------------------------------------------------------------
+
+    def _plan(self):
+        """
+        Pick the most selective access path
+
+        STEP 1: Estimate result size for each usable index
+        STEP 2: Pick the smallest estimate
+        STEP 3: Return a description and a row source
+
+        Returns:
+            tuple: (index_name, estimated_rows, source_iterator, search_hits)
+        """
+        manager = self._manager
+        reverse_dates = self._order_field == 'date' and self._reverse
+        reverse_amounts = self._order_field == 'amount' and self._reverse
+
+        # Word search results are exact, so compute them up front
+        hits = None
+        if self._search is not None:
+            hits = manager.text_index.search(self._search)
+
+        # STEP 1: Collect candidates (a full scan is always possible)
+        candidates = [('scan', len(manager.transactions),
+                       lambda: iter(manager.transactions))]
+
+        if self._start_date is not None or self._end_date is not None \
+                or self._order_field == 'date':
+            size = manager.date_index.count_between(self._start_date, self._end_date)
+            candidates.append(('date', size, lambda: manager.date_index.iter_between(
+                self._start_date, self._end_date, reverse=reverse_dates)))
+
+        if self._min_amount is not None or self._max_amount is not None \
+                or self._order_field == 'amount':
+            size = manager.amount_index.count_between(self._min_amount, self._max_amount)
+            candidates.append(('amount', size, lambda: manager.amount_index.iter_between(
+                self._min_amount, self._max_amount, reverse=reverse_amounts)))
+
+        if self._type is not None:
+            size = manager.type_index.count(self._type)
+            candidates.append(('type', size,
+                               lambda: manager.type_index.get(self._type)))
+
+        if self._categories is not None:
+            size = sum(manager.category_index.count(c) for c in self._categories)
+            candidates.append(('category', size, self._iter_categories))
+
+        if hits is not None:
+            candidates.append(('text', len(hits), lambda: (
+                manager.id_index[key] for key in hits)))
+
+        # With a limit, an index in the sort order can stop early: it
+        # reads about limit / selectivity rows instead of all of them
+        if self._limit is not None and self._order_field in ('date', 'amount'):
+            others = [size for name, size, _ in candidates if name != self._order_field]
+            total = len(manager.transactions)
+            candidates = [
+                (name, min(size, self._limit * total // max(min(others), 1) + 1), source)
+                if name == self._order_field else (name, size, source)
+                for name, size, source in candidates]
+
+        # STEP 2: Smallest estimate wins; on a tie prefer the date index
+        # because it also delivers rows already sorted by date
+        preference = {'date': 0, 'text': 1, 'amount': 2, 'type': 3, 'category': 4, 'scan': 5}
+        name, size, source = min(candidates,
+                                 key=lambda c: (c[1], preference[c[0]]))
+
+        # STEP 3: Hand back a fresh iterator
+        return name, size, source(), hits
+
+    def _iter_categories(self):
+        """Chain the category index groups together"""
+        for category in self._categories:
+            yield from self._manager.category_index.get(category)
+
+    def _matches(self, trans, hits):
+        """Check every condition against one transaction"""
+        if self._type is not None and trans.type != self._type:
+            return False
+        if self._categories is not None and trans.category not in self._categories:
+            return False
+        if self._start_date is not None and trans.date < self._start_date:
+            return False
+        if self._end_date is not None and trans.date > self._end_date:
+            return False
+        if self._min_amount is not None and trans.amount < self._min_amount:
+            return False
+        if self._max_amount is not None and trans.amount > self._max_amount:
+            return False
+        if self._text is not None and self._text not in trans.description.lower():
+            return False
+        if hits is not None and trans.key not in hits:
+            return False
+        return True
+
+    def _residual(self, name, hits):
+        """
+        Row check for the conditions the access path does not guarantee
+
+        Rows from the date index are already in the date range, rows
+        from the text index already match the search, and so on; only
+        the other conditions are checked.
+
+        Returns:
+            function: Predicate, or None when every row qualifies
+        """
+        rest = self._clone(**{field: None for field in _COVERED_BY[name]})
+        if name == 'text':
+            hits = None
+        if rest._type is None and rest._categories is None \
+                and rest._start_date is None and rest._end_date is None \
+                and rest._min_amount is None and rest._max_amount is None \
+                and rest._text is None:
+            return None if hits is None else (lambda t: t.key in hits)
+        return lambda t: rest._matches(t, hits)
+
+    def _filtered(self):
+        """Stream matching rows from the chosen access path (unsorted, unlimited)"""
+        name, _, source, hits = self._plan()
+        check = self._residual(name, hits)
+        return name, (source if check is None else filter(check, source))
+
+    def __iter__(self):
+        """
+        Run the query lazily
+
+        Rows are streamed straight from the chosen index. Sorting is
+        skipped when the rows already arrive in the requested order
+        (date or amount index), and a bounded heap is used when only
+        the top `limit` rows are needed.
+        """
+        name, rows = self._filtered()
+        field = self._order_field
+
+        # Only the date and amount indexes hand out rows in sorted order
+        if field is None or (field == name and name in ('date', 'amount')):
+            ordered = rows
+        else:
+            key = _sort_key(field)
+            if self._limit is not None:
+                pick = heapq.nlargest if self._reverse else heapq.nsmallest
+                ordered = iter(pick(self._limit, rows, key=key))
+            else:
+                ordered = iter(sorted(rows, key=key, reverse=self._reverse))
+
+        if self._limit is None:
+            yield from ordered
+        else:
+            for position, trans in enumerate(ordered):
+                if position >= self._limit:
+                    break
+                yield trans
+
+    def explain(self):
+        """
+        Describe how the query would run
+
+        Returns:
+            str: Chosen index and its estimated row count
+        """
+        name, size, _, _ = self._plan()
+        return f"{name} index (~{size} candidate rows)"
+
+    # ------------------------------------------------------------------
+    # Results and aggregates
+    # ------------------------------------------------------------------
+
+    def all(self):
+        """Materialize the results as a list"""
+        return list(self)
+
+    def first(self):
+        """First result, or None when nothing matches"""
+        for trans in self.limit(1):
+            return trans
+        return None
+
+    def count(self):
+        """Number of matching transactions"""
+        return sum(1 for _ in self)
+
+    def total(self):
+        """Sum of matching amounts"""
+        return sum(t.amount for t in self)
+
+    def totals(self):
+        """
+        Income and expense totals in a single pass
+
+        Returns:
+            tuple: (total_income, total_expense)
+        """
+        income_total = 0.0
+        expense_total = 0.0
+        for trans in self:
+            if trans.type == 'income':
+                income_total += trans.amount
+            else:
+                expense_total += trans.amount
+        return income_total, expense_total
+
+    def summary(self):
+        """
+        Count, income total and expense total of the matching rows
+
+        STEP 1: Type, category and date filters only - answer from the
+                rollup cube (summarize_range), no rows are read
+        STEP 2: Otherwise stream the rows from the most selective index
+
+        Returns:
+            tuple: (count, total_income, total_expense)
+        """
+        # STEP 1: Pre-aggregated totals
+        if self._min_amount is None and self._max_amount is None \
+                and self._text is None and self._search is None:
+            grouped = self._manager.summarize_range(self._start_date, self._end_date)
+            count = 0
+            totals = {'income': 0.0, 'expense': 0.0}
+            for trans_type, categories in grouped.items():
+                if self._type is not None and trans_type != self._type:
+                    continue
+                for category, (total, category_count) in categories.items():
+                    if self._categories is None or category in self._categories:
+                        totals[trans_type] += total
+                        count += category_count
+            return count, totals['income'], totals['expense']
+
+        # STEP 2: Stream
+        count = 0
+        income_total = 0.0
+        expense_total = 0.0
+        for trans in self._filtered()[1]:
+            count += 1
+            if trans.type == 'income':
+                income_total += trans.amount
+            else:
+                expense_total += trans.amount
+        return count, income_total, expense_total
+
+    def page_source(self, materialize_limit=50000):
+        """
+        Count, totals and pager input for a results screen
+
+        A selective query (small index estimate) is run once: the rows
+        are collected, counted and summed in the same pass, then sorted
+        by date. A broad one takes its totals from summary() and pages
+        over the date-ordered snapshot (cut to the date range), checking
+        the remaining conditions while scanning - a page fills after a
+        few rows.
+
+        Args:
+            materialize_limit (int): Largest estimate that is run up front
+
+        Returns:
+            tuple: ((count, total_income, total_expense),
+                    rows sorted by date, predicate or None)
+        """
+        manager = self._manager
+        name, size, source, hits = self._plan()
+
+        # Selective: one pass
+        if size <= materialize_limit:
+            check = self._residual(name, hits)
+            rows = list(source if check is None else filter(check, source))
+            income_total = 0.0
+            expense_total = 0.0
+            for trans in rows:
+                if trans.type == 'income':
+                    income_total += trans.amount
+                else:
+                    expense_total += trans.amount
+            if name != 'date':
+                rows.sort(key=lambda t: t.date)
+            return (len(rows), income_total, expense_total), rows, None
+
+        # Broad: the snapshot is in date index order, so the index bounds apply
+        ordered = manager.snapshot().sorted_by_date
+        lo, hi = manager.date_index.bounds(self._start_date, self._end_date)
+        if (lo, hi) != (0, len(ordered)):
+            ordered = ordered[lo:hi]
+        return self.summary(), ordered, lambda t: self._matches(t, hits)
+
+    def totals_by_category(self):
+        """
+        Sum matching amounts per (type, category) in a single pass
+
+        Returns:
+            dict: {'income': {category: total}, 'expense': {category: total}}
+        """
+        grouped = {'income': defaultdict(float), 'expense': defaultdict(float)}
+        for trans in self:
+            grouped[trans.type][trans.category] += trans.amount
+        return {trans_type: dict(totals) for trans_type, totals in grouped.items()}
+
+
+def _sort_key(field):
+    """Build a sort key function for a field name"""
+    if field == 'description':
+        return lambda t: t.description.lower()
+    return lambda t: getattr(t, field)
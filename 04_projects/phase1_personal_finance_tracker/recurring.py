@@ -0,0 +1,366 @@
+"""
+Recurring Module - Recurring transaction rules
+
+LEARNING OBJECTIVES:
+- Date arithmetic (days, weeks, months)
+- Generators for lazy, possibly very long sequences
+- Separating rules (what repeats) from occurrences (when)
+
+EXAMPLES:
+- Salary on the 25th of every month
+- Gym membership every week
+- Bus pass every 30 days
+
+Rules are stored in data/recurring.json. Occurrences are never
+stored ahead of time: they are generated on demand for whatever date
+range is asked for, and past occurrences are turned into real
+transactions in one batch.
+
+An occurrence's transaction ID is derived from the rule ID and the
+date, so committing it twice is detected: if the app stops after the
+transactions were saved but before the rules were, the next run skips
+the ones already in the ledger instead of adding them again.
+"""
+
+import calendar
+import heapq
+from datetime import datetime, date, timedelta
+
+from ids import new_transaction_id, derived_transaction_id, format_transaction_id
+from transaction import Transaction
+from utils import add_months
+
+
+FREQUENCIES = ('daily', 'weekly', 'monthly')
+
+
+def _parse_date(value):
+    """Parse a YYYY-MM-DD string (None stays None)"""
+    return datetime.strptime(value, "%Y-%m-%d").date() if value else None
+
+
+class RecurringRule:
+    """
+    Describes a transaction that repeats on a schedule
+
+    ATTRIBUTES:
+    - id: Unique identifier
+    - type / amount / category / description: Transaction template
+    - frequency: 'daily', 'weekly' or 'monthly'
+    - interval: Repeat every N days/weeks/months
+    - day: Day of month for monthly rules (clamped to short months)
+    - start_date / end_date: Active period (end_date may be None)
+    - last_committed: Last date already added as a real transaction
+    """
+
+    def __init__(self, trans_type, amount, category, description,
+                 frequency, start_date, interval=1, day=None, end_date=None,
+                 rule_id=None):
+        """
+        Initialize a rule
+
+        Args:
+            trans_type (str): 'income' or 'expense'
+            amount (float): Amount of each occurrence
+            category (str): Category name
+            description (str): Description of each occurrence
+            frequency (str): 'daily', 'weekly' or 'monthly'
+            start_date (datetime.date): First possible occurrence
+            interval (int): Every N days/weeks/months
+            day (int): Day of month for monthly rules (default: start day)
+            end_date (datetime.date): Last possible occurrence, or None
+            rule_id (str): Existing rule ID (default: a new one)
+        """
+        if trans_type not in ['income', 'expense']:
+            raise ValueError("Transaction type must be 'income' or 'expense'")
+        if amount <= 0:
+            raise ValueError("Amount must be positive")
+        if frequency not in FREQUENCIES:
+            raise ValueError(f"Frequency must be one of {', '.join(FREQUENCIES)}")
+        if interval < 1:
+            raise ValueError("Interval must be at least 1")
+        if day is not None and not 1 <= day <= 31:
+            raise ValueError("Day must be between 1 and 31")
+
+        self.id = rule_id or format_transaction_id(new_transaction_id())
+        self.type = trans_type
+        self.amount = float(amount)
+        self.category = category
+        self.description = description
+        self.frequency = frequency
+        self.interval = interval
+        self.day = day if day is not None else start_date.day
+        self.start_date = start_date
+        self.end_date = end_date
+        self.last_committed = None
+
+    def occurrences(self, start_date, end_date):
+        """
+        Generate occurrence dates within an inclusive range
+
+        Dates are computed directly from the range start, so asking
+        for one month ten years ahead does not walk the years before it.
+
+        Args:
+            start_date (datetime.date): First date of interest
+            end_date (datetime.date): Last date of interest
+
+        Yields:
+            datetime.date: Occurrence dates in order
+        """
+        first = max(start_date, self.start_date)
+        last = end_date if self.end_date is None else min(end_date, self.end_date)
+        if first > last:
+            return
+
+        if self.frequency == 'monthly':
+            yield from self._monthly(first, last)
+            return
+
+        # Daily and weekly rules are a fixed step in days
+        step = self.interval * (7 if self.frequency == 'weekly' else 1)
+        offset = (first - self.start_date).days
+        current = self.start_date + timedelta(days=-(-offset // step) * step)
+        while current <= last:
+            yield current
+            current += timedelta(days=step)
+
+    def _monthly(self, first, last):
+        """Monthly occurrences between two dates (both already clipped)"""
+        months_since_start = ((first.year - self.start_date.year) * 12
+                              + first.month - self.start_date.month)
+        # Jump straight to the first month on the interval grid
+        skip = -(-months_since_start // self.interval) * self.interval
+        year, month = add_months(self.start_date.year, self.start_date.month, skip)
+
+        while True:
+            day = min(self.day, calendar.monthrange(year, month)[1])
+            current = date(year, month, day)
+            if current > last:
+                return
+            if current >= first:
+                yield current
+            year, month = add_months(year, month, self.interval)
+
+    def make_transaction(self, occurrence_date):
+        """
+        Create the transaction for one occurrence
+
+        Args:
+            occurrence_date (datetime.date): Occurrence date
+
+        Returns:
+            Transaction: New transaction, with the ID of this rule and
+                date (see derived_transaction_id)
+        """
+        transaction = Transaction(self.type, self.amount, self.category,
+                                  self.description, occurrence_date)
+        transaction.key = derived_transaction_id(self.id, occurrence_date)
+        return transaction
+
+    def to_dict(self):
+        """
+        Convert rule to dictionary
+
+        Returns:
+            dict: Rule data as dictionary
+        """
+        return {
+            'id': self.id,
+            'type': self.type,
+            'amount': self.amount,
+            'category': self.category,
+            'description': self.description,
+            'frequency': self.frequency,
+            'interval': self.interval,
+            'day': self.day,
+            'start_date': str(self.start_date),
+            'end_date': str(self.end_date) if self.end_date else None,
+            'last_committed': str(self.last_committed) if self.last_committed else None
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create a rule from a dictionary
+
+        Args:
+            data (dict): Rule data as saved by to_dict()
+
+        Returns:
+            RecurringRule: Restored rule
+        """
+        rule = cls(data['type'], data['amount'], data['category'],
+                   data['description'], data['frequency'],
+                   _parse_date(data['start_date']),
+                   interval=data.get('interval', 1),
+                   day=data.get('day'),
+                   end_date=_parse_date(data.get('end_date')),
+                   rule_id=data['id'])
+        rule.last_committed = _parse_date(data.get('last_committed'))
+        return rule
+
+    def __str__(self):
+        """String representation of rule"""
+        every = f"every {self.interval} " if self.interval > 1 else "every "
+        unit = {'daily': 'day', 'weekly': 'week', 'monthly': 'month'}[self.frequency]
+        if self.interval > 1:
+            unit += 's'
+        when = f" on day {self.day}" if self.frequency == 'monthly' else ""
+        return (f"{self.type.capitalize()}: ${self.amount:.2f} ({self.category}) - "
+                f"{self.description}, {every}{unit}{when}")
+
+
+def _tagged(rule, start_date, end_date):
+    """Yield (date, rule) pairs for one rule"""
+    for occurrence in rule.occurrences(start_date, end_date):
+        yield occurrence, rule
+
+
+class RecurringManager:
+    """
+    Manages recurring rules and turns due occurrences into transactions
+
+    RESPONSIBILITIES:
+    - Store rules (data/recurring.json)
+    - Commit past occurrences as real transactions (one save)
+    - Generate future occurrences lazily for forecasts
+    """
+
+    def __init__(self, file_handler, transaction_manager):
+        """
+        Initialize recurring manager
+
+        Args:
+            file_handler: FileHandler instance for data persistence
+            transaction_manager: TransactionManager receiving committed occurrences
+        """
+        self.file_handler = file_handler
+        self.transaction_manager = transaction_manager
+        self.rules = []
+
+    def add_rule(self, rule):
+        """
+        Add a new rule and save
+
+        Args:
+            rule (RecurringRule): Rule to add
+        """
+        if not isinstance(rule, RecurringRule):
+            raise TypeError("Must be a RecurringRule object")
+        self.rules.append(rule)
+        self.save_rules()
+
+    def delete_rule(self, rule_id):
+        """
+        Delete a rule by ID (already committed transactions stay)
+
+        Args:
+            rule_id (str): ID of rule to delete
+
+        Returns:
+            bool: True if deleted, False if not found
+        """
+        for i, rule in enumerate(self.rules):
+            if rule.id == rule_id:
+                self.rules.pop(i)
+                self.save_rules()
+                return True
+        return False
+
+    def occurrences(self, start_date, end_date):
+        """
+        Lazily generate (date, rule) pairs for all rules in date order
+
+        Only one pending date per rule is held in memory, so even
+        decades of daily rules can be streamed.
+
+        Args:
+            start_date (datetime.date): First date of interest
+            end_date (datetime.date): Last date of interest
+
+        Yields:
+            tuple: (occurrence_date, rule)
+        """
+        streams = [_tagged(rule, start_date, end_date) for rule in self.rules]
+        yield from heapq.merge(*streams, key=lambda pair: pair[0])
+
+    def forecast_totals(self, start_date, end_date):
+        """
+        Sum future income and expenses from recurring rules
+
+        Args:
+            start_date (datetime.date): First date of interest
+            end_date (datetime.date): Last date of interest
+
+        Returns:
+            tuple: (total_income, total_expense)
+        """
+        income_total = 0.0
+        expense_total = 0.0
+        for _, rule in self.occurrences(start_date, end_date):
+            if rule.type == 'income':
+                income_total += rule.amount
+            else:
+                expense_total += rule.amount
+        return income_total, expense_total
+
+    def commit_due(self, today=None):
+        """
+        Add every occurrence up to today as a real transaction
+
+        STEP 1: For each rule, generate dates after its last commit
+        STEP 2: Leave out occurrences already in the ledger
+        STEP 3: Add all new transactions in a single batch (one save)
+        STEP 4: Remember the last committed date and save the rules
+
+        Transactions are saved before the rules. If the rules are not
+        saved (the app stops in between), the next run generates the
+        same occurrences with the same IDs and STEP 2 skips them.
+
+        Args:
+            today (datetime.date): Commit up to this date (default: today)
+
+        Returns:
+            int: Number of transactions added
+        """
+        today = today or datetime.now().date()
+
+        # STEP 1: Collect due occurrences
+        due = []
+        for rule in self.rules:
+            since = (rule.last_committed + timedelta(days=1)
+                     if rule.last_committed else rule.start_date)
+            for occurrence in rule.occurrences(since, today):
+                due.append(rule.make_transaction(occurrence))
+            if since <= today:
+                rule.last_committed = today
+
+        if not due:
+            return 0
+
+        # STEP 2: Committed by a run that did not get to save the rules
+        id_index = self.transaction_manager.id_index
+        new_transactions = [t for t in due if t.key not in id_index]
+
+        # STEP 3: One batch, one save
+        if new_transactions:
+            self.transaction_manager.add_transactions(new_transactions)
+
+        # STEP 4: Persist progress
+        self.save_rules()
+        return len(new_transactions)
+
+    def save_rules(self):
+        """Save all rules to JSON file"""
+        self.file_handler.save_recurring([rule.to_dict() for rule in self.rules])
+
+    def load_rules(self):
+        """Load rules from JSON file"""
+        self.rules = []
+        for rule_dict in self.file_handler.load_recurring():
+            try:
+                self.rules.append(RecurringRule.from_dict(rule_dict))
+            except (ValueError, KeyError) as e:
+                print(f"Warning: Skipping invalid recurring rule: {rule_dict}")
+                print(f"Error: {e}")
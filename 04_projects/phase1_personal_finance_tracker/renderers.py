@@ -0,0 +1,238 @@
+"""
+Renderers Module - Turn Report objects into text, JSON, CSV or HTML
+
+LEARNING OBJECTIVES:
+- Separating data (what) from presentation (how)
+- Polymorphism: one interface, several output formats
+- Building output in memory (io.StringIO) and writing it once
+
+USAGE:
+    report = report_generator.build_monthly_report(2, 2026)
+    text = get_renderer('json').render(report)
+    get_renderer('text').write(report, sys.stdout)
+"""
+
+import io
+import csv
+import html
+import json
+
+from table import Table, TEXT, CURRENCY, PERCENT, COUNT
+
+
+class Renderer:
+    """
+    Base class for report renderers
+
+    Subclasses implement render(report) and return a string.
+    """
+
+    name = None
+    extension = None
+
+    def render(self, report):
+        """Render a report to a string"""
+        raise NotImplementedError
+
+    def write(self, report, stream):
+        """
+        Render a report and write it with a single call
+
+        Args:
+            report (Report): Report to render
+            stream: File-like object (e.g. sys.stdout or an open file)
+        """
+        stream.write(self.render(report))
+
+
+class TextRenderer(Renderer):
+    """Plain-text report for the terminal"""
+
+    name = 'text'
+    extension = 'txt'
+
+    def __init__(self, width=70):
+        """
+        Initialize text renderer
+
+        Args:
+            width (int): Line width
+        """
+        self.width = width
+
+    def _format_summary(self, value, kind):
+        """Format one summary value"""
+        if value is None:
+            return f"{'n/a':>13}"
+        if kind == CURRENCY:
+            return f"${value:>12,.2f}"
+        if kind == PERCENT:
+            return f"{value:>12.1f}%"
+        return f"{value:>13}"
+
+    def render(self, report):
+        """
+        Render a report as text
+
+        STEP 1: Title block
+        STEP 2: Summary lines
+        STEP 3: Sections
+        """
+        out = io.StringIO()
+        rule = "=" * self.width
+        thin_rule = "-" * self.width
+
+        # STEP 1: Title
+        out.write(f"\n{rule}\n{report.title.center(self.width)}\n{rule}\n")
+
+        if report.is_empty:
+            out.write(f"\n{report.empty_message or 'No data.'}\n")
+            return out.getvalue()
+
+        # STEP 2: Summary
+        if report.summary:
+            out.write("\n")
+            for item in report.summary:
+                if item is None:
+                    out.write(thin_rule + "\n")
+                    continue
+                label, value, kind = item
+                out.write(f"{label + ':':<20} {self._format_summary(value, kind)}\n")
+            out.write(rule + "\n")
+
+        # STEP 3: Sections
+        if report.sections:
+            if report.sections_title:
+                out.write(f"\n{report.sections_title}:\n{thin_rule}\n")
+            for section in report.sections:
+                out.write(f"\n{section.title}:\n")
+                table = Table(section.columns)
+                out.write(table.render(section.rows, indent="  "))
+            out.write(rule + "\n")
+
+        return out.getvalue()
+
+
+class JSONRenderer(Renderer):
+    """Machine-readable JSON"""
+
+    name = 'json'
+    extension = 'json'
+
+    def render(self, report):
+        """Render a report as JSON"""
+        return json.dumps(report.to_dict(), indent=2, ensure_ascii=False) + "\n"
+
+
+class CSVRenderer(Renderer):
+    """
+    CSV with one row per value
+
+    FORMAT:
+    summary,<label>,<value>
+    <section>,<column 1>,<column 2>,...      (header row per section)
+    <section>,<value 1>,<value 2>,...
+    """
+
+    name = 'csv'
+    extension = 'csv'
+
+    def render(self, report):
+        """Render a report as CSV"""
+        out = io.StringIO()
+        writer = csv.writer(out)
+
+        writer.writerow(['report', report.title])
+        for label, value, _ in report.summary_items():
+            writer.writerow(['summary', label, _plain(value)])
+        for section in report.sections:
+            writer.writerow([section.title] + [name for name, _ in section.columns])
+            for row in section.rows:
+                writer.writerow([section.title] + [_plain(value) for value in row])
+
+        return out.getvalue()
+
+
+class HTMLRenderer(Renderer):
+    """Stand-alone HTML page with one table per section"""
+
+    name = 'html'
+    extension = 'html'
+
+    def _format(self, value, kind):
+        """Format and escape one value"""
+        if value is None:
+            text = 'n/a'
+        elif kind == CURRENCY:
+            text = f"${value:,.2f}"
+        elif kind == PERCENT:
+            text = f"{value:.1f}%"
+        else:
+            text = str(value)
+        return html.escape(text)
+
+    def render(self, report):
+        """Render a report as HTML"""
+        out = io.StringIO()
+        title = html.escape(report.title)
+        out.write("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n")
+        out.write(f"<title>{title}</title>\n</head>\n<body>\n<h1>{title}</h1>\n")
+
+        if report.is_empty:
+            out.write(f"<p>{html.escape(report.empty_message or 'No data.')}</p>\n")
+        else:
+            if report.summary:
+                out.write("<table class=\"summary\">\n")
+                for label, value, kind in report.summary_items():
+                    out.write(f"<tr><th>{html.escape(label)}</th>"
+                              f"<td>{self._format(value, kind)}</td></tr>\n")
+                out.write("</table>\n")
+
+            if report.sections_title:
+                out.write(f"<h2>{html.escape(report.sections_title)}</h2>\n")
+            for section in report.sections:
+                out.write(f"<h3>{html.escape(section.title)}</h3>\n<table>\n<tr>")
+                out.write("".join(f"<th>{html.escape(name)}</th>"
+                                  for name, _ in section.columns))
+                out.write("</tr>\n")
+                kinds = [kind for _, kind in section.columns]
+                for row in section.rows:
+                    out.write("<tr>" + "".join(
+                        f"<td>{self._format(value, kind)}</td>"
+                        for value, kind in zip(row, kinds)) + "</tr>\n")
+                out.write("</table>\n")
+
+        out.write("</body>\n</html>\n")
+        return out.getvalue()
+
+
+RENDERERS = {
+    'text': TextRenderer,
+    'json': JSONRenderer,
+    'csv': CSVRenderer,
+    'html': HTMLRenderer
+}
+
+
+def get_renderer(name):
+    """
+    Create a renderer by format name
+
+    Args:
+        name (str): 'text', 'json', 'csv' or 'html'
+
+    Returns:
+        Renderer: New renderer instance
+    """
+    try:
+        return RENDERERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown report format '{name}'. "
+                         f"Choose from: {', '.join(RENDERERS)}") from None
+
+
+def _plain(value):
+    """Round floats for CSV output (missing values become empty cells)"""
+    if value is None:
+        return ''
+    return round(value, 2) if isinstance(value, float) else value
@@ -1,68 +1,737 @@
 """
 Reports Module - Financial report generation
+
+STEP-BY-STEP GUIDE:
+===================
+1. build_*_report() methods compute a Report object (data only)
+2. A renderer (see renderers.py) turns a Report into text, JSON, CSV or HTML
+3. generate_*_report() methods do both and print the text version
+
+All reports read the pre-aggregated rollup cube kept by the
+TransactionManager, so their cost depends on the number of months
+and categories, not on the number of transactions.
 """
 
-from collections import defaultdict
 import calendar
+from datetime import datetime
+from collections import OrderedDict
+
+from renderers import TextRenderer, TEXT, CURRENCY, PERCENT, COUNT
+from table import Screen
+from forecast import Forecaster
+from utils import add_months, iter_months
+
+
+class ReportSection:
+    """
+    One table of a report (e.g. the expense breakdown)
+    
+    ATTRIBUTES:
+    - title: Section heading
+    - columns: [(name, kind), ...] where kind is TEXT, CURRENCY, PERCENT or COUNT
+    - rows: [[value, ...], ...] in column order
+    """
+    
+    def __init__(self, title, columns, rows):
+        """Initialize a report section"""
+        self.title = title
+        self.columns = columns
+        self.rows = rows
+    
+    def to_dict(self):
+        """
+        Convert section to dictionary
+        
+        Returns:
+            dict: Title, column names and rows as {column: value} dictionaries
+        """
+        names = [name for name, _ in self.columns]
+        return {
+            'title': self.title,
+            'columns': names,
+            'rows': [dict(zip(names, row)) for row in self.rows]
+        }
+
+
+class Report:
+    """
+    Computed report data, independent of how it is displayed
+    
+    ATTRIBUTES:
+    - kind: Report type ('monthly', 'quarterly', 'yearly', ...)
+    - title: Report heading
+    - period: Dictionary describing the period (e.g. {'year': 2026, 'month': 2})
+    - summary: [(label, value, kind), ...]; None entries mark a separator line
+    - sections: List of ReportSection
+    - sections_title: Heading shown above the sections
+    - empty_message: Shown instead of the data when there is nothing to report
+    """
+    
+    def __init__(self, kind, title, period, summary=None, sections=None,
+                 sections_title=None, empty_message=None):
+        """Initialize a report"""
+        self.kind = kind
+        self.title = title
+        self.period = period
+        self.summary = summary or []
+        self.sections = sections or []
+        self.sections_title = sections_title
+        self.empty_message = empty_message
+    
+    @property
+    def is_empty(self):
+        """True when the report has no data"""
+        return not self.summary and not self.sections
+    
+    def summary_items(self):
+        """Summary entries without separators"""
+        return [item for item in self.summary if item is not None]
+    
+    def to_dict(self):
+        """
+        Convert report to dictionary (for JSON output)
+        
+        Returns:
+            dict: Report data
+        """
+        return {
+            'kind': self.kind,
+            'title': self.title,
+            'period': self.period,
+            'summary': {label: value for label, value, _ in self.summary_items()},
+            'sections': [section.to_dict() for section in self.sections]
+        }
 
 
 class ReportGenerator:
-    """Generates financial reports and summaries"""
+    """
+    Generates financial reports and summaries
+    
+    CACHING:
+    Built reports are kept in a small LRU cache. Each entry remembers
+    the version stamp of the months it covers (see
+    TransactionManager.months_version). A cached report is reused as
+    long as no transaction in those months was added or deleted, so
+    editing March does not throw away the cached January report.
+    Cached Report objects are shared - treat them as read-only.
+    """
     
-    def __init__(self, transaction_manager):
-        """Initialize with transaction manager"""
+    def __init__(self, transaction_manager, cache_size=64):
+        """
+        Initialize with transaction manager
+        
+        Args:
+            transaction_manager: TransactionManager to report on
+            cache_size (int): Maximum number of cached reports (0 disables caching)
+        """
         self.transaction_manager = transaction_manager
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    def _cached(self, cache_key, months, build):
+        """
+        Return a cached report, or build and cache it
+        
+        STEP 1: Compute the current version stamp of the months
+        STEP 2: Reuse the cached report if its stamp still matches
+        STEP 3: Otherwise build, store and evict the least recently used
+        
+        Args:
+            cache_key (tuple): Report type and parameters
+            months (list): (year, month) tuples the report reads
+            build: Function that builds the report
+        
+        Returns:
+            Report: Cached or freshly built report
+        """
+        # STEP 1: Current stamp
+        stamp = self.transaction_manager.months_version(months)
+        
+        # STEP 2: Cache hit?
+        entry = self._cache.get(cache_key)
+        if entry is not None and entry[0] == stamp:
+            self._cache.move_to_end(cache_key)
+            self.cache_hits += 1
+            return entry[1]
+        
+        # STEP 3: Build and store
+        self.cache_misses += 1
+        report = build()
+        if self.cache_size > 0:
+            self._cache[cache_key] = (stamp, report)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return report
+    
+    def clear_cache(self):
+        """Drop every cached report"""
+        self._cache.clear()
+    
+    # ------------------------------------------------------------------
+    # Builders (return Report objects)
+    # ------------------------------------------------------------------
+    
+    def build_monthly_report(self, month, year):
+        """Build monthly financial report"""
+        month_name = calendar.month_name[month]
+        return self._build_period_report(
+            'monthly', f"MONTHLY REPORT - {month_name} {year}",
+            {'year': year, 'month': month}, [(year, month)],
+            "No transactions for this month.")
+    
+    def build_quarterly_report(self, quarter, year):
+        """Build quarterly financial report (quarter 1-4)"""
+        if not 1 <= quarter <= 4:
+            raise ValueError("Quarter must be between 1 and 4")
+        first_month = (quarter - 1) * 3 + 1
+        months = [(year, m) for m in range(first_month, first_month + 3)]
+        return self._build_period_report(
+            'quarterly', f"QUARTERLY REPORT - Q{quarter} {year}",
+            {'year': year, 'quarter': quarter}, months,
+            "No transactions for this quarter.")
+    
+    def build_yearly_report(self, year):
+        """Build yearly financial report"""
+        months = [(year, m) for m in range(1, 13)]
+        return self._build_period_report(
+            'yearly', f"YEARLY REPORT - {year}", {'year': year}, months,
+            "No transactions for this year.")
+    
+    def build_date_range_report(self, start_date, end_date):
+        """
+        Build a report for any date range
+        
+        Whole months come straight from the rollup cube; only the
+        partial months at either end are read transaction by
+        transaction (see TransactionManager.summarize_range).
+        
+        Args:
+            start_date (datetime.date): First day (inclusive)
+            end_date (datetime.date): Last day (inclusive)
+        
+        Returns:
+            Report: Summary and category breakdown for the range
+        """
+        if start_date > end_date:
+            raise ValueError("Start date must not be after end date")
+        
+        all_months = list(iter_months((start_date.year, start_date.month),
+                                      (end_date.year, end_date.month)))
+        manager = self.transaction_manager
+        
+        def build():
+            summary = manager.summarize_range(start_date, end_date)
+            return self._breakdown_report(
+                'range', f"REPORT - {start_date} to {end_date}",
+                {'start_date': str(start_date), 'end_date': str(end_date)},
+                summary, "No transactions in this date range.")
+        
+        return self._cached(('range', start_date, end_date), all_months, build)
+    
+    def build_category_summary(self, start_date, end_date):
+        """
+        Per-category totals, counts, share and month-over-month change
+        
+        The change column compares the month of end_date with the month
+        before it (whole calendar months, read from the rollup cube).
+        
+        Args:
+            start_date (datetime.date): First day (inclusive)
+            end_date (datetime.date): Last day (inclusive)
+        
+        Returns:
+            Report: Summary plus one table per transaction type
+        """
+        if start_date > end_date:
+            raise ValueError("Start date must not be after end date")
+        
+        last_month = (end_date.year, end_date.month)
+        previous_month = add_months(end_date.year, end_date.month, -1)
+        all_months = list(iter_months(min((start_date.year, start_date.month), previous_month),
+                                      last_month))
+        manager = self.transaction_manager
+        
+        def build():
+            summary = manager.summarize_range(start_date, end_date)
+            report = Report('category_summary',
+                            f"CATEGORY SUMMARY - {start_date} to {end_date}",
+                            {'start_date': str(start_date), 'end_date': str(end_date)},
+                            sections_title="Categories",
+                            empty_message="No transactions in this date range.")
+            if not summary['income'] and not summary['expense']:
+                return report
+            
+            this_month = manager.rollup.summarize([last_month])
+            month_before = manager.rollup.summarize([previous_month])
+            
+            totals = {}
+            for trans_type, title_text in (('income', 'INCOME'), ('expense', 'EXPENSES')):
+                categories = summary[trans_type]
+                type_total = sum(total for total, _ in categories.values())
+                totals[trans_type] = type_total
+                if not categories:
+                    continue
+                rows = []
+                for cat, (amount, count) in sorted(categories.items(),
+                                                   key=lambda x: x[1][0], reverse=True):
+                    share = (amount / type_total * 100) if type_total > 0 else 0
+                    change = _percent_change(
+                        month_before[trans_type].get(cat, (0.0, 0))[0],
+                        this_month[trans_type].get(cat, (0.0, 0))[0])
+                    rows.append([cat, amount, share, count, change])
+                report.sections.append(ReportSection(
+                    title_text,
+                    [('Category', TEXT), ('Amount', CURRENCY), ('Share', PERCENT),
+                     ('Count', COUNT), ('MoM Change', PERCENT)],
+                    rows))
+            
+            report.summary = [
+                ('Total Income', totals['income'], CURRENCY),
+                ('Total Expenses', totals['expense'], CURRENCY),
+                None,
+                ('Net Balance', totals['income'] - totals['expense'], CURRENCY)
+            ]
+            return report
+        
+        return self._cached(('category_summary', start_date, end_date), all_months, build)
+    
+    def build_year_over_year_report(self, year):
+        """
+        Compare a year with the year before, month by month and by category
+        
+        Args:
+            year (int): Year to compare with year - 1
+        
+        Returns:
+            Report: Summary, monthly comparison and expense category comparison
+        """
+        previous = year - 1
+        months = [(y, m) for y in (previous, year) for m in range(1, 13)]
+        rollup = self.transaction_manager.rollup
+        
+        def build():
+            report = Report('year_over_year', f"YEAR OVER YEAR - {year} vs {previous}",
+                            {'year': year, 'previous_year': previous},
+                            empty_message="No transactions in either year.")
+            
+            # One pass over 24 months of pre-aggregated totals
+            rows = []
+            totals = {previous: [0.0, 0.0], year: [0.0, 0.0]}
+            for m in range(1, 13):
+                old_income, old_expense, _ = rollup.month_totals(previous, m)
+                new_income, new_expense, _ = rollup.month_totals(year, m)
+                totals[previous][0] += old_income
+                totals[previous][1] += old_expense
+                totals[year][0] += new_income
+                totals[year][1] += new_expense
+                rows.append([calendar.month_abbr[m], old_income, new_income,
+                             old_expense, new_expense,
+                             _percent_change(old_expense, new_expense)])
+            
+            if not any(totals[previous]) and not any(totals[year]):
+                return report
+            
+            old_income, old_expense = totals[previous]
+            new_income, new_expense = totals[year]
+            report.summary = [
+                (f'Income {year}', new_income, CURRENCY),
+                (f'Income {previous}', old_income, CURRENCY),
+                ('Income Change', _percent_change(old_income, new_income), PERCENT),
+                None,
+                (f'Expenses {year}', new_expense, CURRENCY),
+                (f'Expenses {previous}', old_expense, CURRENCY),
+                ('Expense Change', _percent_change(old_expense, new_expense), PERCENT),
+                None,
+                (f'Net {year}', new_income - new_expense, CURRENCY),
+                (f'Net {previous}', old_income - old_expense, CURRENCY)
+            ]
+            
+            report.sections.append(ReportSection(
+                'MONTHLY COMPARISON',
+                [('Month', TEXT), (f'Income {previous}', CURRENCY), (f'Income {year}', CURRENCY),
+                 (f'Expenses {previous}', CURRENCY), (f'Expenses {year}', CURRENCY),
+                 ('Expense Change', PERCENT)],
+                rows))
+            
+            old_by_cat = rollup.summarize(months[:12])['expense']
+            new_by_cat = rollup.summarize(months[12:])['expense']
+            category_rows = []
+            for cat in sorted(set(old_by_cat) | set(new_by_cat)):
+                old_total = old_by_cat.get(cat, (0.0, 0))[0]
+                new_total = new_by_cat.get(cat, (0.0, 0))[0]
+                category_rows.append([cat, old_total, new_total,
+                                      _percent_change(old_total, new_total)])
+            category_rows.sort(key=lambda row: row[2], reverse=True)
+            report.sections.append(ReportSection(
+                'EXPENSES BY CATEGORY',
+                [('Category', TEXT), (str(previous), CURRENCY), (str(year), CURRENCY),
+                 ('Change', PERCENT)],
+                category_rows))
+            return report
+        
+        return self._cached(('year_over_year', year), months, build)
+    
+    def build_rolling_report(self, window, end_year, end_month, periods=12):
+        """
+        Rolling N-month totals, e.g. the 3-month total ending in each month
+        
+        A sliding window walks the months once: each step adds the
+        newest month and subtracts the one that dropped out.
+        
+        Args:
+            window (int): Window length in months (e.g. 3, 6 or 12)
+            end_year (int): Year of the last window's final month
+            end_month (int): Month of the last window's final month
+            periods (int): Number of windows to show
+        
+        Returns:
+            Report: One row per window, latest window in the summary
+        """
+        if window < 1 or periods < 1:
+            raise ValueError("Window and periods must be at least 1")
+        
+        first = add_months(end_year, end_month, -(window + periods - 2))
+        months = list(iter_months(first, (end_year, end_month)))
+        rollup = self.transaction_manager.rollup
+        
+        def build():
+            report = Report('rolling', f"ROLLING {window}-MONTH REPORT - "
+                            f"{calendar.month_name[end_month]} {end_year}",
+                            {'window': window, 'end_year': end_year,
+                             'end_month': end_month, 'periods': periods},
+                            empty_message="No transactions in this period.")
+            
+            monthly = []
+            income_sum = 0.0
+            expense_sum = 0.0
+            rows = []
+            for position, (year, month) in enumerate(months):
+                income, expense, _ = rollup.month_totals(year, month)
+                monthly.append((income, expense))
+                income_sum += income
+                expense_sum += expense
+                if position >= window:
+                    old_income, old_expense = monthly[position - window]
+                    income_sum -= old_income
+                    expense_sum -= old_expense
+                if position >= window - 1:
+                    net = income_sum - expense_sum
+                    rows.append([f"{calendar.month_abbr[month]} {year}",
+                                 income_sum, expense_sum, net, net / window])
+            
+            if not any(income or expense for income, expense in monthly):
+                return report
+            
+            _, income_sum, expense_sum, net, average = rows[-1]
+            report.summary = [
+                (f'Income ({window} mo)', income_sum, CURRENCY),
+                (f'Expenses ({window} mo)', expense_sum, CURRENCY),
+                None,
+                (f'Net ({window} mo)', net, CURRENCY),
+                ('Average Net / Month', average, CURRENCY)
+            ]
+            report.sections.append(ReportSection(
+                'WINDOWS',
+                [('Window Ending', TEXT), ('Income', CURRENCY), ('Expenses', CURRENCY),
+                 ('Net', CURRENCY), ('Avg Net / Month', CURRENCY)],
+                rows))
+            return report
+        
+        return self._cached(('rolling', window, end_year, end_month, periods), months, build)
+    
+    def build_history_report(self, start_year=None, end_year=None):
+        """
+        Year-by-year totals over the whole history (or a range of years)
+        
+        Reads each month's pre-aggregated totals once, so ten years of
+        history cost about 120 small lookups.
+        
+        Args:
+            start_year (int): First year (default: first year with data)
+            end_year (int): Last year (default: last year with data)
+        
+        Returns:
+            Report: One row per year
+        """
+        rollup = self.transaction_manager.rollup
+        known_months = rollup.months()
+        if start_year is None:
+            start_year = known_months[0][0] if known_months else datetime.now().year
+        if end_year is None:
+            end_year = known_months[-1][0] if known_months else start_year
+        months = list(iter_months((start_year, 1), (end_year, 12)))
+        
+        def build():
+            report = Report('history', f"HISTORY - {start_year} to {end_year}",
+                            {'start_year': start_year, 'end_year': end_year},
+                            empty_message="No transactions in these years.")
+            
+            per_year = {}
+            for year, month in months:
+                income, expense, count = rollup.month_totals(year, month)
+                totals = per_year.setdefault(year, [0.0, 0.0, 0])
+                totals[0] += income
+                totals[1] += expense
+                totals[2] += count
+            
+            if not any(totals[2] for totals in per_year.values()):
+                return report
+            
+            rows = [[str(year), income, expense, income - expense, count]
+                    for year, (income, expense, count) in sorted(per_year.items())]
+            income_total = sum(row[1] for row in rows)
+            expense_total = sum(row[2] for row in rows)
+            report.summary = [
+                ('Total Income', income_total, CURRENCY),
+                ('Total Expenses', expense_total, CURRENCY),
+                None,
+                ('Net Balance', income_total - expense_total, CURRENCY),
+                ('Average Net / Year', (income_total - expense_total) / len(rows), CURRENCY)
+            ]
+            report.sections.append(ReportSection(
+                'BY YEAR',
+                [('Year', TEXT), ('Income', CURRENCY), ('Expenses', CURRENCY),
+                 ('Net', CURRENCY), ('Transactions', COUNT)],
+                rows))
+            return report
+        
+        return self._cached(('history', start_year, end_year), months, build)
+    
+    def build_distribution_report(self, year, month=None, top=10):
+        """
+        Expense distribution: quantiles per category, size histogram
+        and the largest transactions
+        
+        Everything comes from small per-month summaries (see sketches.py)
+        that are merged for the period; no transaction list is sorted.
+        
+        Args:
+            year (int): Year
+            month (int): Month (1-12), or None for the whole year
+            top (int): Number of largest transactions to list
+        
+        Returns:
+            Report: Distribution report
+        """
+        if month is None:
+            months = [(year, m) for m in range(1, 13)]
+            period_name = str(year)
+        else:
+            months = [(year, month)]
+            period_name = f"{calendar.month_name[month]} {year}"
+        distribution = self.transaction_manager.distribution
+        
+        def build():
+            report = Report('distribution', f"EXPENSE DISTRIBUTION - {period_name}",
+                            {'year': year, 'month': month},
+                            empty_message="No expenses in this period.")
+            
+            # STEP 1: Overall quantiles
+            overall = distribution.sketch(months)
+            if overall.count == 0:
+                return report
+            median, p90, p99 = overall.quantiles([0.5, 0.9, 0.99])
+            report.summary = [
+                ('Expenses', overall.count, COUNT),
+                ('Median', median, CURRENCY),
+                ('90th Percentile', p90, CURRENCY),
+                ('99th Percentile', p99, CURRENCY),
+                ('Largest', overall.max, CURRENCY)
+            ]
+            
+            # STEP 2: Quantiles per category (most transactions first)
+            rows = []
+            for cat, sketch in sorted(distribution.sketches_by_category(months).items(),
+                                      key=lambda x: x[1].count, reverse=True):
+                rows.append([cat, sketch.count] + sketch.quantiles([0.5, 0.9, 0.99])
+                            + [sketch.max])
+            report.sections.append(ReportSection(
+                'QUANTILES BY CATEGORY',
+                [('Category', TEXT), ('Count', COUNT), ('Median', CURRENCY),
+                 ('P90', CURRENCY), ('P99', CURRENCY), ('Max', CURRENCY)],
+                rows))
+            
+            # STEP 3: Size histogram
+            histogram_rows = [[label, count, count / overall.count * 100]
+                              for label, count in distribution.histogram(months).bins()
+                              if count]
+            report.sections.append(ReportSection(
+                'TRANSACTION SIZES',
+                [('Range', TEXT), ('Count', COUNT), ('Share', PERCENT)],
+                histogram_rows))
+            
+            # STEP 4: Largest transactions
+            largest_rows = [[str(t.date), t.category, t.description, t.amount]
+                            for t in distribution.largest(months, top)]
+            report.sections.append(ReportSection(
+                'LARGEST EXPENSES',
+                [('Date', TEXT), ('Category', TEXT), ('Description', TEXT),
+                 ('Amount', CURRENCY)],
+                largest_rows))
+            return report
+        
+        return self._cached(('distribution', year, month, top), months, build)
+    
+    def build_forecast_report(self, horizon=3, method='seasonal', trans_type='expense',
+                              history_months=24):
+        """
+        Forecast of the coming months per category
+        
+        Args:
+            horizon (int): Months to forecast
+            method (str): 'average', 'linear' or 'seasonal' (see forecast.py)
+            trans_type (str): 'income' or 'expense'
+            history_months (int): Complete months used for fitting
+        
+        Returns:
+            Report: One row per category, one column per forecast month
+        """
+        forecaster = Forecaster(self.transaction_manager, history_months)
+        today = datetime.now()
+        end_year, end_month = add_months(today.year, today.month, -1)
+        months = forecaster.history(end_year, end_month)
+        label = 'INCOME' if trans_type == 'income' else 'EXPENSE'
+        
+        def build():
+            result = forecaster.forecast_categories(horizon, method, trans_type,
+                                                    end_year, end_month)
+            report = Report('forecast', f"{label} FORECAST - next {horizon} month(s)",
+                            {'method': method, 'trans_type': trans_type,
+                             'months': [f"{y}-{m:02d}" for y, m in result['months']]},
+                            empty_message="Not enough history to forecast.")
+            if not result['categories']:
+                return report
+            
+            month_labels = [f"{calendar.month_abbr[m]} {y}" for y, m in result['months']]
+            totals = [sum(values[i] for values in result['categories'].values())
+                      for i in range(horizon)]
+            report.summary = [(f"Total {text}", total, CURRENCY)
+                              for text, total in zip(month_labels, totals)]
+            
+            rows = [[cat] + values + [sum(values)]
+                    for cat, values in sorted(result['categories'].items(),
+                                              key=lambda x: sum(x[1]), reverse=True)]
+            report.sections.append(ReportSection(
+                f'BY CATEGORY ({method})',
+                [('Category', TEXT)] + [(text, CURRENCY) for text in month_labels]
+                + [('Total', CURRENCY)],
+                rows))
+            return report
+        
+        return self._cached(('forecast', horizon, method, trans_type, history_months,
+                             end_year, end_month), months, build)
+    
+    def _build_period_report(self, kind, title, period, months, empty_message):
+        """
+        Summary and category breakdown for a set of months
+        
+        STEP 1: Combine the rollup cells of the months
+        STEP 2: Calculate totals
+        STEP 3: Build one breakdown section per transaction type
+        
+        Args:
+            kind (str): Report type
+            title (str): Report heading
+            period (dict): Period description
+            months (list): (year, month) tuples covered by the report
+            empty_message (str): Shown when there is no data
+        
+        Returns:
+            Report: Computed report
+        """
+        rollup = self.transaction_manager.rollup
+        return self._cached((kind, tuple(months)), months, lambda: self._breakdown_report(
+            kind, title, period, rollup.summarize(months), empty_message))
+    
+    def _breakdown_report(self, kind, title, period, summary, empty_message):
+        """
+        Build a summary and breakdown report from combined totals
+        
+        Args:
+            summary (dict): {'income': {category: (total, count)}, 'expense': {...}}
+            (other arguments as in _build_period_report)
+        
+        Returns:
+            Report: Computed report
+        """
+        report = Report(kind, title, period, sections_title="Category Breakdown",
+                        empty_message=empty_message)
+        
+        # STEP 1: Nothing to report?
+        if not summary['income'] and not summary['expense']:
+            return report
+        
+        # STEP 2: Calculate totals
+        income_total = sum(total for total, _ in summary['income'].values())
+        expense_total = sum(total for total, _ in summary['expense'].values())
+        report.summary = [
+            ('Total Income', income_total, CURRENCY),
+            ('Total Expenses', expense_total, CURRENCY),
+            None,
+            ('Net Balance', income_total - expense_total, CURRENCY)
+        ]
+        
+        # STEP 3: Category breakdown (largest first)
+        for trans_type, title_text, type_total in (('income', 'INCOME', income_total),
+                                                   ('expense', 'EXPENSES', expense_total)):
+            if summary[trans_type]:
+                report.sections.append(self._breakdown_section(
+                    title_text, summary[trans_type], type_total))
+        
+        return report
+    
+    def _breakdown_section(self, title, category_totals, type_total):
+        """
+        Build a category breakdown table
+        
+        Args:
+            title (str): Section heading
+            category_totals (dict): {category: (total, count)}
+            type_total (float): Sum of all categories (for percentages)
+        
+        Returns:
+            ReportSection: Rows sorted by amount, largest first
+        """
+        rows = []
+        for cat, (amount, count) in sorted(category_totals.items(),
+                                           key=lambda x: x[1][0], reverse=True):
+            percentage = (amount / type_total * 100) if type_total > 0 else 0
+            rows.append([cat, amount, percentage, count])
+        columns = [('Category', TEXT), ('Amount', CURRENCY),
+                   ('Share', PERCENT), ('Count', COUNT)]
+        return ReportSection(title, columns, rows)
+    
+    # ------------------------------------------------------------------
+    # Terminal output
+    # ------------------------------------------------------------------
+    
+    def print_report(self, report):
+        """Render a report as text and write it in one call"""
+        Screen().block(TextRenderer().render(report)).flush()
     
     def generate_monthly_report(self, month, year):
         """Generate monthly financial report"""
-        print("\n" + "=" * 70)
-        month_name = calendar.month_name[month]
-        print(f"MONTHLY REPORT - {month_name} {year}".center(70))
-        print("=" * 70)
-        
-        # Get transactions for the month
-        transactions = self.transaction_manager.get_monthly_transactions(month, year)
-        
-        if not transactions:
-            print("\nNo transactions for this month.")
-            return
-        
-        # Calculate totals
-        income_total = sum(t.amount for t in transactions if t.type == 'income')
-        expense_total = sum(t.amount for t in transactions if t.type == 'expense')
-        balance = income_total - expense_total
-        
-        # Summary
-        print(f"\n{'Total Income:':<20} ${income_total:>12,.2f}")
-        print(f"{'Total Expenses:':<20} ${expense_total:>12,.2f}")
-        print("-" * 70)
-        print(f"{'Net Balance:':<20} ${balance:>12,.2f}")
-        print("=" * 70)
-        
-        # Category breakdown
-        print("\nCategory Breakdown:")
-        print("-" * 70)
-        
-        # Income categories
-        income_by_cat = defaultdict(float)
-        expense_by_cat = defaultdict(float)
-        
-        for t in transactions:
-            if t.type == 'income':
-                income_by_cat[t.category] += t.amount
-            else:
-                expense_by_cat[t.category] += t.amount
-        
-        if income_by_cat:
-            print("\nINCOME:")
-            for cat, amount in sorted(income_by_cat.items(), key=lambda x: x[1], reverse=True):
-                percentage = (amount / income_total * 100) if income_total > 0 else 0
-                print(f"  {cat:<18} ${amount:>10,.2f}  ({percentage:5.1f}%)")
-        
-        if expense_by_cat:
-            print("\nEXPENSES:")
-            for cat, amount in sorted(expense_by_cat.items(), key=lambda x: x[1], reverse=True):
-                percentage = (amount / expense_total * 100) if expense_total > 0 else 0
-                print(f"  {cat:<18} ${amount:>10,.2f}  ({percentage:5.1f}%)")
-        
-        print("=" * 70)
+        self.print_report(self.build_monthly_report(month, year))
+    
+    def generate_quarterly_report(self, quarter, year):
+        """Generate quarterly financial report (quarter 1-4)"""
+        self.print_report(self.build_quarterly_report(quarter, year))
+    
+    def generate_yearly_report(self, year):
+        """Generate yearly financial report"""
+        self.print_report(self.build_yearly_report(year))
+
+
+def _percent_change(old, new):
+    """
+    Percentage change from old to new
+    
+    Returns:
+        float: Change in percent, or None when old is zero
+    """
+    if not old:
+        return None
+    return (new - old) / old * 100
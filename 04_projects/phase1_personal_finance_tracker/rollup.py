@@ -0,0 +1,157 @@
+"""
+Rollup Module - Pre-aggregated monthly totals
+
+LEARNING OBJECTIVES:
+- Pre-aggregation: computing totals when data changes, not when read
+- Nested dictionaries as a small "data cube"
+- Exact money arithmetic with integer cents
+
+STRUCTURE:
+{
+    (year, month): {
+        (type, category): [total_cents, count],
+        ...
+    },
+    ...
+}
+
+Every add or delete updates exactly one cell (plus one all-time cell
+per (type, category)). A monthly report then reads one month's cells,
+and a yearly report reads twelve, no matter how many transactions the
+ledger holds.
+
+Amounts are kept in whole cents so that adding and removing the same
+transaction always returns a cell to exactly zero.
+"""
+
+
+def to_cents(amount):
+    """Convert an amount to integer cents"""
+    return round(amount * 100)
+
+
+class RollupCube:
+    """
+    (year, month, type, category) -> (sum, count), maintained incrementally
+    """
+
+    def __init__(self):
+        """Initialize an empty cube"""
+        self._months = {}
+        self._totals = {}
+
+    def add(self, transaction):
+        """Add a transaction to its cell"""
+        month_key = (transaction.date.year, transaction.date.month)
+        cells = self._months.get(month_key)
+        if cells is None:
+            cells = self._months[month_key] = {}
+        cell = cells.get((transaction.type, transaction.category))
+        if cell is None:
+            cell = cells[(transaction.type, transaction.category)] = [0, 0]
+        cell[0] += to_cents(transaction.amount)
+        cell[1] += 1
+        total = self._totals.get((transaction.type, transaction.category))
+        if total is None:
+            total = self._totals[(transaction.type, transaction.category)] = [0, 0]
+        total[0] += to_cents(transaction.amount)
+        total[1] += 1
+
+    def remove(self, transaction):
+        """Remove a transaction from its cell"""
+        month_key = (transaction.date.year, transaction.date.month)
+        cells = self._months.get(month_key)
+        if cells is None:
+            return
+        cell_key = (transaction.type, transaction.category)
+        cell = cells.get(cell_key)
+        if cell is None:
+            return
+        cell[0] -= to_cents(transaction.amount)
+        cell[1] -= 1
+        if cell[1] <= 0:
+            del cells[cell_key]
+            if not cells:
+                del self._months[month_key]
+        total = self._totals[cell_key]
+        total[0] -= to_cents(transaction.amount)
+        total[1] -= 1
+        if total[1] <= 0:
+            del self._totals[cell_key]
+
+    def clear(self):
+        """Remove every cell"""
+        self._months = {}
+        self._totals = {}
+
+    def months(self):
+        """
+        Months that have data
+
+        Returns:
+            list: Sorted (year, month) tuples
+        """
+        return sorted(self._months)
+
+    def month_cells(self, year, month):
+        """
+        Raw cells of one month
+
+        Returns:
+            dict: {(type, category): [total_cents, count]} (do not modify)
+        """
+        return self._months.get((year, month), {})
+
+    def month_totals(self, year, month):
+        """
+        Income, expense and transaction count of one month
+
+        Returns:
+            tuple: (income_total, expense_total, count)
+        """
+        income_cents = 0
+        expense_cents = 0
+        count = 0
+        for (trans_type, _), (cents, cell_count) in self.month_cells(year, month).items():
+            if trans_type == 'income':
+                income_cents += cents
+            else:
+                expense_cents += cents
+            count += cell_count
+        return income_cents / 100, expense_cents / 100, count
+
+    def summarize(self, months):
+        """
+        Combine the cells of several months
+
+        Args:
+            months (iterable): (year, month) tuples
+
+        Returns:
+            dict: {
+                'income': {category: (total, count)},
+                'expense': {category: (total, count)}
+            }
+        """
+        combined = {'income': {}, 'expense': {}}
+        for year, month in months:
+            for (trans_type, category), (cents, count) in self.month_cells(year, month).items():
+                group = combined[trans_type]
+                previous = group.get(category, (0, 0))
+                group[category] = (previous[0] + cents, previous[1] + count)
+
+        return {trans_type: {category: (cents / 100, count)
+                             for category, (cents, count) in group.items()}
+                for trans_type, group in combined.items()}
+
+    def all_time(self):
+        """
+        Totals over every month
+
+        Returns:
+            dict: Same shape as summarize()
+        """
+        combined = {'income': {}, 'expense': {}}
+        for (trans_type, category), (cents, count) in self._totals.items():
+            combined[trans_type][category] = (cents / 100, count)
+        return combined
@@ -0,0 +1,186 @@
+"""
+Search Module - Full-text search over transaction descriptions
+
+LEARNING OBJECTIVES:
+- Tokenizing text with regular expressions
+- Inverted indexes (word -> documents), as used by search engines
+- Set intersection and union for AND / OR queries
+- Prefix lookups with a sorted vocabulary and bisect
+
+QUERY SYNTAX:
+    amazon              descriptions containing the word "amazon"
+    amazon prime        both words (AND)
+    uber OR lyft        either word
+    amaz*               any word starting with "amaz"
+    rent OR amazon pr*  "rent", or "amazon" together with a word starting "pr"
+
+Words are matched case-insensitively; punctuation separates words.
+"""
+
+import re
+from bisect import bisect_left
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """
+    Split text into lowercase words
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        list: Words in order of appearance
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def parse_search(text):
+    """
+    Parse a search string into OR-groups of AND-terms
+
+    Args:
+        text (str): Search string (see module docstring)
+
+    Returns:
+        list: [[(word, is_prefix), ...], ...] - one inner list per OR-group
+    """
+    groups = []
+    for part in re.split(r"\s+OR\s+", text.strip()):
+        terms = []
+        for raw in part.split():
+            words = tokenize(raw)
+            # A bare "*" (or "-") has no words and marks nothing
+            if not words:
+                continue
+            terms.extend((word, False) for word in words)
+            # Only the last word of "amazon.co*" is a prefix
+            if raw.endswith('*'):
+                terms[-1] = (terms[-1][0], True)
+        if terms:
+            groups.append(terms)
+    return groups
+
+
+class InvertedIndex:
+    """
+    Maps each description word to the transactions that contain it
+
+    STRUCTURE:
+    - _postings: {word: {transaction_key: None, ...}}
+    - _vocabulary: sorted list of all words (for prefix search)
+
+    The index is updated incrementally: adding or removing a
+    transaction only touches the words of its description.
+    """
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._postings = {}
+        self._vocabulary = []
+
+    def __len__(self):
+        """Number of distinct words"""
+        return len(self._postings)
+
+    def add(self, transaction):
+        """
+        Index the words of a transaction description
+
+        Args:
+            transaction (Transaction): Transaction to index
+        """
+        for word in set(tokenize(transaction.description)):
+            posting = self._postings.get(word)
+            if posting is None:
+                posting = self._postings[word] = {}
+                self._vocabulary.insert(bisect_left(self._vocabulary, word), word)
+            posting[transaction.key] = None
+
+    def remove(self, transaction):
+        """
+        Remove a transaction from the index
+
+        Args:
+            transaction (Transaction): Transaction to remove
+        """
+        for word in set(tokenize(transaction.description)):
+            posting = self._postings.get(word)
+            if posting is None:
+                continue
+            posting.pop(transaction.key, None)
+            if not posting:
+                del self._postings[word]
+                del self._vocabulary[bisect_left(self._vocabulary, word)]
+
+    def rebuild(self, transactions):
+        """
+        Rebuild the index from scratch
+
+        Args:
+            transactions (iterable): All transactions
+        """
+        postings = {}
+        for transaction in transactions:
+            for word in set(tokenize(transaction.description)):
+                posting = postings.get(word)
+                if posting is None:
+                    posting = postings[word] = {}
+                posting[transaction.key] = None
+        self._postings = postings
+        self._vocabulary = sorted(postings)
+
+    def _words_with_prefix(self, prefix):
+        """Yield vocabulary words that start with a prefix"""
+        vocabulary = self._vocabulary
+        for pos in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            word = vocabulary[pos]
+            if not word.startswith(prefix):
+                break
+            yield word
+
+    def _term_keys(self, word, is_prefix):
+        """
+        Transaction keys matching one term
+
+        Returns:
+            dict or set: Keys (a posting dict for exact words)
+        """
+        if not is_prefix:
+            return self._postings.get(word, {})
+        keys = set()
+        for match in self._words_with_prefix(word):
+            keys.update(self._postings[match])
+        return keys
+
+    def search(self, text):
+        """
+        Find transactions matching a search string
+
+        STEP 1: Parse into OR-groups of AND-terms
+        STEP 2: For each group, intersect term matches (smallest first)
+        STEP 3: Union the groups
+
+        Args:
+            text (str): Search string (see module docstring)
+
+        Returns:
+            set: Keys of matching transactions
+        """
+        # STEP 1: Parse
+        results = set()
+        for terms in parse_search(text):
+            # STEP 2: Intersect, starting from the rarest term
+            matches = sorted((self._term_keys(word, is_prefix)
+                              for word, is_prefix in terms), key=len)
+            group = set(matches[0])
+            for other in matches[1:]:
+                if not group:
+                    break
+                group = {key for key in group if key in other}
+
+            # STEP 3: Union
+            results |= group
+        return results
@@ -0,0 +1,470 @@
+"""
+Server Module - Local HTTP/JSON API over the ledger
+
+LEARNING OBJECTIVES:
+- asyncio streams (asyncio.start_server) and a minimal HTTP/1.1 parser
+- Single-writer design: one task owns every change, fed by a queue
+- Group commit: many queued writes, one save
+- Keep-alive connections
+
+HOW IT WORKS:
+- Every connection gets its own coroutine; many clients are served at
+  the same time on one thread.
+- Reads (GET) never wait for a lock. Each one runs to completion in one
+  event-loop step, so it sees one consistent ledger version (returned as
+  "version") even while writes are queued.
+- Writes (POST) are put on a queue. A single writer task takes
+  everything that is waiting, checks it and saves it once (in a worker
+  thread, so reads continue during the file write). Only then is the
+  batch published - added to the ledger the reads use - so a read never
+  sees a transaction that is not saved yet. Each client gets its answer
+  after its transaction has been saved.
+
+ENDPOINTS:
+    GET  /health
+    GET  /balance?as_of=2026-01-31
+    GET  /transactions?type=expense&category=Food,Transport&start=2026-01-01
+                      &end=2026-01-31&min=10&max=500&search=coffee
+                      &sort=amount&desc=1&limit=50
+    POST /transactions   {"type": "expense", "amount": 12.5, "category": "Food",
+                          "description": "Lunch", "date": "2026-02-16"}
+    GET  /categories/summary?start=2026-01-01&end=2026-01-31
+    GET  /reports/2026-02          (any period: 2026-02, 2026-Q1, 2026)
+
+USAGE:
+    python server.py --data-dir data --port 8765
+    curl 'http://127.0.0.1:8765/balance'
+
+The server listens on 127.0.0.1 by default and has no authentication;
+it is meant for local dashboards and scripts.
+"""
+
+import sys
+import json
+import asyncio
+import argparse
+from datetime import datetime
+from urllib.parse import urlsplit, parse_qs
+
+from file_handler import FileHandler
+from transaction import Transaction, TransactionManager
+from duplicates import DuplicateIndex
+from reports import ReportGenerator
+from query import SORT_FIELDS
+from batch import parse_period, build_period_report
+
+
+MAX_BODY = 64 * 1024
+MAX_LIMIT = 1000
+DEFAULT_LIMIT = 100
+
+REASONS = {200: 'OK', 201: 'Created', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 409: 'Conflict', 413: 'Payload Too Large',
+           500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+class ApiError(Exception):
+    """A request failed; sent to the client as {"error": message}"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _param(params, name, convert=str):
+    """
+    One query-string parameter, converted
+
+    Args:
+        params (dict): Parsed query string (parse_qs)
+        name (str): Parameter name
+        convert: Conversion function
+
+    Returns:
+        Converted value, or None when missing
+    """
+    values = params.get(name)
+    if not values or values[-1] == '':
+        return None
+    try:
+        return convert(values[-1])
+    except ValueError:
+        raise ApiError(400, f"Invalid value for '{name}': {values[-1]}") from None
+
+
+def _date(text):
+    """Parse a YYYY-MM-DD date"""
+    return datetime.strptime(text, "%Y-%m-%d").date()
+
+
+def _transaction_from_json(data):
+    """
+    Build a Transaction from a request body
+
+    Raises:
+        ApiError: When a field is missing or invalid
+    """
+    if not isinstance(data, dict):
+        raise ApiError(400, "Body must be a JSON object")
+    try:
+        trans_type = str(data['type']).strip().lower()
+        category = str(data['category']).strip()
+        date = _date(data['date']) if data.get('date') else datetime.now().date()
+        description = (str(data.get('description') or '').strip()
+                       or f"{trans_type.capitalize()} - {category}")
+        return Transaction(trans_type, float(data['amount']), category, description, date)
+    except KeyError as e:
+        raise ApiError(400, f"Missing field {e}") from None
+    except (ValueError, TypeError) as e:
+        raise ApiError(400, str(e)) from None
+
+
+class LedgerServer:
+    """
+    HTTP/JSON API for one ledger
+
+    USAGE:
+        server = LedgerServer(transaction_manager)
+        await server.start('127.0.0.1', 8765)
+        await server.serve_forever()
+    """
+
+    def __init__(self, transaction_manager, max_batch=500):
+        """
+        Initialize server
+
+        Args:
+            transaction_manager (TransactionManager): Loaded ledger
+            max_batch (int): Most writes applied with one save
+        """
+        self.transaction_manager = transaction_manager
+        self.report_generator = ReportGenerator(transaction_manager)
+        self.max_batch = max_batch
+        self._queue = None
+        self._writer_task = None
+        self._server = None
+        self._routes = {
+            ('GET', '/health'): self.health,
+            ('GET', '/balance'): self.balance,
+            ('GET', '/transactions'): self.list_transactions,
+            ('POST', '/transactions'): self.add_transaction,
+            ('GET', '/categories/summary'): self.category_summary,
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self, host='127.0.0.1', port=8765):
+        """
+        Start listening and start the writer task
+
+        Returns:
+            int: Port actually bound (useful with port 0)
+        """
+        self._queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer())
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Serve until cancelled"""
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        """Stop listening, finish queued writes and save"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._writer_task is not None:
+            try:
+                await self._while_writer_runs(self._queue.join())
+            except ApiError:
+                print("Warning: the writer stopped; queued writes were not applied",
+                      file=sys.stderr)
+            self._writer_task.cancel()
+        self.transaction_manager.save_transactions()
+
+    # ------------------------------------------------------------------
+    # Writer
+    # ------------------------------------------------------------------
+
+    async def submit(self, transaction):
+        """
+        Queue a transaction for the writer and wait until it is saved
+
+        Returns:
+            Transaction: The saved transaction
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((transaction, future))
+        return await self._while_writer_runs(future)
+
+    async def _while_writer_runs(self, awaitable):
+        """
+        Wait for work the writer has to finish
+
+        Raises:
+            ApiError: 503 when the writer task has ended instead
+        """
+        waiting = asyncio.ensure_future(awaitable)
+        await asyncio.wait({waiting, self._writer_task}, return_when=asyncio.FIRST_COMPLETED)
+        if not waiting.done():
+            waiting.cancel()
+            raise ApiError(503, "The writer has stopped; the change was not saved")
+        return waiting.result()
+
+    async def _writer(self):
+        """
+        The only code that changes the ledger
+
+        STEP 1: Wait for a write, then take everything else that is queued
+        STEP 2: Check them (duplicates of the ledger or of the batch are rejected)
+        STEP 3: Save once in a worker thread - memory is not touched yet
+        STEP 4: Publish: add the saved batch to memory, answer every client
+
+        Readers only ever see saved transactions: the batch reaches the
+        ledger they read after its save succeeded. When the save fails,
+        nothing was added, every client in the batch gets a 500 (a retry
+        is not mistaken for a duplicate) and the writer keeps running.
+        """
+        manager = self.transaction_manager
+        while True:
+            # STEP 1: Collect
+            pending = [await self._queue.get()]
+            while len(pending) < self.max_batch and not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+
+            try:
+                # STEP 2: Check
+                batch = DuplicateIndex(manager.duplicate_index.fingerprint,
+                                       manager.duplicate_index.date_window)
+                accepted = []
+                results = []
+                for transaction, _ in pending:
+                    duplicates = manager.find_duplicates(transaction) or batch.find(transaction)
+                    if duplicates:
+                        results.append(ApiError(409, f"Looks like an existing transaction: "
+                                                     f"{duplicates[0].id}"))
+                    else:
+                        batch.add(transaction)
+                        accepted.append(transaction)
+                        results.append(transaction)
+
+                # STEP 3: Save
+                if accepted and not await asyncio.to_thread(manager.save_before_adding, accepted):
+                    raise OSError("the ledger file could not be written")
+
+                # STEP 4: Publish
+                manager.apply_external_changes(accepted)
+            except Exception as e:
+                results = [ApiError(500, f"Could not save: {e}")] * len(pending)
+
+            # Answer every client, and mark every item done
+            for (_, future), result in zip(pending, results):
+                if not future.done():
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+                self._queue.task_done()
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    async def _handle_connection(self, reader, writer):
+        """
+        Serve requests on one connection until it closes
+
+        STEP 1: Read the request line, headers and body
+        STEP 2: Dispatch to an endpoint
+        STEP 3: Write the response; keep the connection for the next one
+        """
+        try:
+            while True:
+                # STEP 1: Request
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, http_version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length') or 0)
+                if length > MAX_BODY:
+                    writer.write(_response(413, {'error': "Body too large"}, False))
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                # STEP 2: Dispatch
+                status, payload = await self.dispatch(method, target, body)
+
+                # STEP 3: Response
+                keep_alive = (http_version == 'HTTP/1.1'
+                              and headers.get('connection', '').lower() != 'close')
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, target, body=b''):
+        """
+        Run one request
+
+        Args:
+            method (str): HTTP method
+            target (str): Path with query string
+            body (bytes): Request body
+
+        Returns:
+            tuple: (status, JSON-serializable payload)
+        """
+        url = urlsplit(target)
+        params = parse_qs(url.query)
+        path = url.path.rstrip('/') or '/'
+        try:
+            handler = self._routes.get((method, path))
+            if handler is None and method == 'GET' and path.startswith('/reports/'):
+                return 200, self.report(path[len('/reports/'):])
+            if handler is None:
+                known = any(route_path == path for _, route_path in self._routes)
+                raise ApiError(405 if known else 404, f"No route for {method} {path}")
+            if method == 'POST':
+                try:
+                    data = json.loads(body or b'null')
+                except json.JSONDecodeError as e:
+                    raise ApiError(400, f"Invalid JSON: {e}") from None
+                return 201, await handler(data)
+            return 200, handler(params)
+        except ApiError as e:
+            return e.status, {'error': str(e)}
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        except Exception as e:
+            return 500, {'error': f"{type(e).__name__}: {e}"}
+
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
+
+    def health(self, params):
+        """Server status and ledger size"""
+        manager = self.transaction_manager
+        return {'status': 'ok', 'version': manager.version,
+                'transactions': len(manager.transactions),
+                'queued_writes': self._queue.qsize() if self._queue else 0}
+
+    def balance(self, params):
+        """Income, expenses and balance (optionally as of a date)"""
+        manager = self.transaction_manager
+        as_of = _param(params, 'as_of', _date)
+        if as_of:
+            summary = manager.summarize_range(None, as_of)
+            income = sum(total for total, _ in summary['income'].values())
+            expense = sum(total for total, _ in summary['expense'].values())
+            balance = manager.get_balance_as_of(as_of)
+        else:
+            income, expense = manager.get_totals()
+            balance = manager.get_balance()
+        return {'version': manager.version, 'as_of': str(as_of) if as_of else None,
+                'income': round(income, 2), 'expense': round(expense, 2),
+                'balance': round(balance, 2)}
+
+    def list_transactions(self, params):
+        """Transactions matching the filters (newest first by default)"""
+        manager = self.transaction_manager
+        query = manager.query().of_type(_param(params, 'type'))
+        categories = _param(params, 'category')
+        if categories:
+            query = query.in_categories(*(c.strip() for c in categories.split(',') if c.strip()))
+        query = (query
+                 .between(_param(params, 'start', _date), _param(params, 'end', _date))
+                 .amount_between(_param(params, 'min', float), _param(params, 'max', float))
+                 .search(_param(params, 'search')))
+
+        sort = _param(params, 'sort') or 'date'
+        if sort not in SORT_FIELDS:
+            raise ApiError(400, f"sort must be one of: {', '.join(SORT_FIELDS)}")
+        desc = _param(params, 'desc')
+        reverse = desc not in ('0', 'false') if desc is not None else sort == 'date'
+        limit = _param(params, 'limit', int)
+        limit = min(DEFAULT_LIMIT if limit is None else limit, MAX_LIMIT)
+
+        transactions = query.order_by(sort, reverse=reverse).limit(limit).all()
+        return {'version': manager.version, 'count': len(transactions),
+                'transactions': [t.to_dict() for t in transactions]}
+
+    async def add_transaction(self, data):
+        """Add one transaction through the writer"""
+        transaction = await self.submit(_transaction_from_json(data))
+        return transaction.to_dict()
+
+    def category_summary(self, params):
+        """Category summary report for a date range"""
+        start = _param(params, 'start', _date)
+        end = _param(params, 'end', _date)
+        if not (start and end):
+            raise ApiError(400, "start and end are required")
+        return self.report_generator.build_category_summary(start, end).to_dict()
+
+    def report(self, period_text):
+        """Monthly, quarterly or yearly report"""
+        return build_period_report(self.report_generator, parse_period(period_text)).to_dict()
+
+
+def _response(status, payload, keep_alive):
+    """
+    Encode a complete HTTP response
+
+    Returns:
+        bytes: Status line, headers and JSON body
+    """
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode('latin-1') + body
+
+
+async def serve(data_dir, host, port):
+    """Load a ledger and serve it until interrupted"""
+    transaction_manager = TransactionManager(FileHandler(data_dir))
+    transaction_manager.load_transactions()
+    server = LedgerServer(transaction_manager)
+    bound = await server.start(host, port)
+    print(f"Serving {len(transaction_manager.transactions)} transaction(s) "
+          f"from {data_dir} on http://{host}:{bound}", file=sys.stderr)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.stop()
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Personal Finance Tracker - HTTP/JSON API")
+    parser.add_argument('--data-dir', default='data', help="Ledger directory (default: data)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.data_dir, args.host, args.port))
+    except KeyboardInterrupt:
+        print("Stopped.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,384 @@
+"""
+Sketches Module - Streaming distribution statistics for expenses
+
+LEARNING OBJECTIVES:
+- Quantile sketches: approximate medians without sorting everything
+- Mergeable summaries: combine months instead of re-reading them
+- Keeping the N largest values with a bounded heap (heapq)
+
+WHAT IS KEPT:
+For every (year, month, category) bucket of expense transactions:
+- QuantileSketch: median, p90, p99, ... (KLL-style, see below)
+- SizeHistogram: counts per amount range ($1-$2, $2-$5, ...)
+- Top-K heap: the largest transactions of the bucket
+
+A report for a quarter merges three months of small summaries; the
+full history is never sorted.
+
+KLL-STYLE SKETCH:
+Values enter level 0. When a level is full it is sorted and every
+other value moves up one level, where each value stands for twice as
+many original values. Higher levels get larger capacities, so the
+sketch stays small (a few hundred values) while the rank error stays
+around 1%. Buckets with fewer values than the capacity are exact.
+
+DELETES:
+Histograms support exact removal. Sketches and top-K heaps cannot
+"un-see" a value, so deleting a transaction marks its bucket stale;
+the bucket is rebuilt from its transactions the next time it is read.
+"""
+
+import heapq
+import itertools
+from bisect import bisect_right
+
+from utils import month_bounds
+
+
+class QuantileSketch:
+    """
+    Mergeable approximate quantiles (KLL-style compactors)
+
+    STRUCTURE:
+    - _levels[h]: Values that each stand for 2**h original values
+    - count: Number of values added
+    """
+
+    def __init__(self, k=200):
+        """
+        Initialize an empty sketch
+
+        Args:
+            k (int): Capacity of the top level (higher = more accurate)
+        """
+        if k < 8:
+            raise ValueError("Sketch size k must be at least 8")
+        self.k = k
+        self._levels = [[]]
+        self._size = 0
+        self._flip = False
+        self.count = 0
+        self.min = None
+        self.max = None
+
+    def _capacity(self, level):
+        """Capacity of a level (lower levels are smaller)"""
+        depth = len(self._levels) - level - 1
+        return max(2, int(self.k * (2 / 3) ** depth))
+
+    def _compress(self):
+        """Compact the lowest full level into the one above it"""
+        for level, items in enumerate(self._levels):
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append([])
+                items.sort()
+                # Alternate which half survives so errors cancel out
+                self._flip = not self._flip
+                keep_last = [items.pop()] if len(items) % 2 else []
+                promoted = items[1::2] if self._flip else items[0::2]
+                self._levels[level + 1].extend(promoted)
+                self._levels[level] = keep_last
+                self._size -= len(items) - len(promoted)
+                return
+
+    def _shrink(self):
+        """Compact until the sketch fits its total capacity"""
+        while self._size >= sum(self._capacity(h) for h in range(len(self._levels))):
+            self._compress()
+
+    def add(self, value):
+        """Add one value"""
+        self._levels[0].append(value)
+        self._size += 1
+        self.count += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if len(self._levels[0]) >= self._capacity(0):
+            self._shrink()
+
+    def merge(self, other):
+        """
+        Add all values summarized by another sketch
+
+        Args:
+            other (QuantileSketch): Sketch to merge into this one
+        """
+        if other.count == 0:
+            return
+        while len(self._levels) < len(other._levels):
+            self._levels.append([])
+        for level, items in enumerate(other._levels):
+            self._levels[level].extend(items)
+            self._size += len(items)
+        self.count += other.count
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+        self._shrink()
+
+    def quantiles(self, fractions):
+        """
+        Several quantiles at once (sorts the retained values once)
+
+        Args:
+            fractions (iterable): Values between 0 and 1 (0.5 = median)
+
+        Returns:
+            list: Estimated values (None when the sketch is empty)
+        """
+        fractions = list(fractions)
+        if self.count == 0:
+            return [None] * len(fractions)
+        weighted = sorted((value, 1 << level)
+                          for level, items in enumerate(self._levels)
+                          for value in items)
+        total = sum(weight for _, weight in weighted)
+
+        results = []
+        for fraction in fractions:
+            if fraction <= 0:
+                results.append(self.min)
+                continue
+            if fraction >= 1:
+                results.append(self.max)
+                continue
+            target = fraction * total
+            running = 0
+            for value, weight in weighted:
+                running += weight
+                if running >= target:
+                    results.append(value)
+                    break
+            else:
+                results.append(self.max)
+        return results
+
+    def quantile(self, fraction):
+        """One quantile (0.5 = median, 0.9 = p90)"""
+        return self.quantiles([fraction])[0]
+
+
+# Upper edges of the size ranges ($0-$1, $1-$2, $2-$5, ..., $10,000+)
+HISTOGRAM_EDGES = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class SizeHistogram:
+    """
+    Count of transactions per amount range (exact, supports removal)
+    """
+
+    def __init__(self, edges=HISTOGRAM_EDGES):
+        """
+        Initialize an empty histogram
+
+        Args:
+            edges (tuple): Increasing upper bounds of the ranges
+        """
+        self.edges = edges
+        self.counts = [0] * (len(edges) + 1)
+
+    def add(self, value):
+        """Count one value"""
+        self.counts[bisect_right(self.edges, value)] += 1
+
+    def remove(self, value):
+        """Un-count one value"""
+        self.counts[bisect_right(self.edges, value)] -= 1
+
+    def merge(self, other):
+        """Add the counts of another histogram with the same edges"""
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+
+    def bins(self):
+        """
+        Ranges and their counts
+
+        Returns:
+            list: (label, count) tuples, e.g. ("$10 - $20", 4)
+        """
+        lower = [0] + list(self.edges)
+        labels = [f"${low:,} - ${high:,}" for low, high in zip(lower, self.edges)]
+        labels.append(f"${self.edges[-1]:,}+")
+        return list(zip(labels, self.counts))
+
+
+class _Bucket:
+    """Summaries of one (year, month, category) bucket"""
+
+    def __init__(self, sketch_size):
+        """Initialize empty summaries"""
+        self.sketch = QuantileSketch(sketch_size)
+        self.histogram = SizeHistogram()
+        self.top = []
+        self.stale = False
+
+
+class DistributionIndex:
+    """
+    Per-month, per-category distribution summaries of expenses
+
+    STRUCTURE:
+    {
+        (year, month): {category: _Bucket, ...},
+        ...
+    }
+    """
+
+    def __init__(self, date_index, sketch_size=200, top_size=10):
+        """
+        Initialize an empty distribution index
+
+        Args:
+            date_index (DateIndex): Used to re-read a stale bucket
+            sketch_size (int): Quantile sketch size k
+            top_size (int): Largest transactions kept per bucket
+        """
+        self.date_index = date_index
+        self.sketch_size = sketch_size
+        self.top_size = top_size
+        self._months = {}
+        self._sequence = itertools.count()
+
+    def _add_to_bucket(self, bucket, transaction):
+        """Add one transaction to a bucket's summaries"""
+        bucket.sketch.add(transaction.amount)
+        bucket.histogram.add(transaction.amount)
+        entry = (transaction.amount, next(self._sequence), transaction)
+        if len(bucket.top) < self.top_size:
+            heapq.heappush(bucket.top, entry)
+        elif entry[0] > bucket.top[0][0]:
+            heapq.heapreplace(bucket.top, entry)
+
+    def add(self, transaction):
+        """Add an expense transaction (income is ignored)"""
+        if transaction.type != 'expense':
+            return
+        month_key = (transaction.date.year, transaction.date.month)
+        buckets = self._months.get(month_key)
+        if buckets is None:
+            buckets = self._months[month_key] = {}
+        bucket = buckets.get(transaction.category)
+        if bucket is None:
+            bucket = buckets[transaction.category] = _Bucket(self.sketch_size)
+        self._add_to_bucket(bucket, transaction)
+
+    def remove(self, transaction):
+        """Remove an expense transaction (its bucket becomes stale)"""
+        if transaction.type != 'expense':
+            return
+        month_key = (transaction.date.year, transaction.date.month)
+        bucket = self._months.get(month_key, {}).get(transaction.category)
+        if bucket is None:
+            return
+        bucket.histogram.remove(transaction.amount)
+        bucket.stale = True
+        if not any(bucket.histogram.counts):
+            del self._months[month_key][transaction.category]
+            if not self._months[month_key]:
+                del self._months[month_key]
+
+    def clear(self):
+        """Remove every bucket"""
+        self._months = {}
+
+    def rebuild(self, transactions):
+        """Rebuild every bucket from a transaction list"""
+        self.clear()
+        for transaction in transactions:
+            self.add(transaction)
+
+    def _refresh(self, year, month, category):
+        """
+        Rebuild a stale bucket from its month's transactions
+
+        Returns:
+            _Bucket: Fresh bucket
+        """
+        fresh = _Bucket(self.sketch_size)
+        start_date, end_date = month_bounds(month, year)
+        for transaction in self.date_index.iter_between(start_date, end_date):
+            if transaction.type == 'expense' and transaction.category == category:
+                self._add_to_bucket(fresh, transaction)
+        self._months[(year, month)][category] = fresh
+        return fresh
+
+    def buckets(self, months, category=None):
+        """
+        Fresh buckets of some months
+
+        Args:
+            months (iterable): (year, month) tuples
+            category (str): Only this category (default: all)
+
+        Yields:
+            tuple: (category, _Bucket)
+        """
+        for year, month in months:
+            for cat, bucket in list(self._months.get((year, month), {}).items()):
+                if category is not None and cat != category:
+                    continue
+                if bucket.stale:
+                    bucket = self._refresh(year, month, cat)
+                yield cat, bucket
+
+    def sketch(self, months, category=None):
+        """
+        Merged quantile sketch of some months
+
+        Returns:
+            QuantileSketch: Combined sketch
+        """
+        merged = QuantileSketch(self.sketch_size)
+        for _, bucket in self.buckets(months, category):
+            merged.merge(bucket.sketch)
+        return merged
+
+    def sketches_by_category(self, months):
+        """
+        Merged quantile sketch per category
+
+        Returns:
+            dict: {category: QuantileSketch}
+        """
+        merged = {}
+        for cat, bucket in self.buckets(months):
+            if cat not in merged:
+                merged[cat] = QuantileSketch(self.sketch_size)
+            merged[cat].merge(bucket.sketch)
+        return merged
+
+    def histogram(self, months, category=None):
+        """
+        Merged size histogram of some months
+
+        Returns:
+            SizeHistogram: Combined histogram
+        """
+        merged = SizeHistogram()
+        for year, month in months:
+            for cat, bucket in self._months.get((year, month), {}).items():
+                if category is None or cat == category:
+                    merged.merge(bucket.histogram)
+        return merged
+
+    def largest(self, months, n=10, category=None):
+        """
+        Largest expense transactions of some months
+
+        Args:
+            months (iterable): (year, month) tuples
+            n (int): Number of transactions (at most top_size)
+            category (str): Only this category (default: all)
+
+        Returns:
+            list: Transactions, largest first
+        """
+        entries = itertools.chain.from_iterable(
+            bucket.top for _, bucket in self.buckets(months, category))
+        return [transaction for _, _, transaction in
+                heapq.nlargest(min(n, self.top_size), entries)]
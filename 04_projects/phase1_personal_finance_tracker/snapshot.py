@@ -0,0 +1,74 @@
+"""
+Snapshot Module - Read-only, versioned views of the ledger
+
+LEARNING OBJECTIVES:
+- Immutable data (tuples) as a safe way to share state
+- Version numbers for detecting change
+- Copy-on-write: pay for a copy only after something changed
+
+HOW IT WORKS:
+The TransactionManager bumps its version number on every change.
+When a reader asks for a snapshot, the manager hands back the cached
+snapshot if the version is unchanged; otherwise it builds a new one
+once and caches it. Old snapshots are never modified, so a report or
+export can keep reading one while new transactions are being added.
+"""
+
+
+class LedgerSnapshot:
+    """
+    Immutable view of all transactions at one ledger version
+
+    ATTRIBUTES:
+    - version: Ledger version this snapshot belongs to
+    - transactions: Tuple of transactions in insertion order
+
+    Behaves like a read-only sequence (len, iteration, indexing).
+    """
+
+    __slots__ = ('version', 'transactions', '_by_date')
+
+    def __init__(self, version, transactions, by_date):
+        """
+        Create a snapshot
+
+        Args:
+            version (int): Ledger version
+            transactions (tuple): Transactions in insertion order
+            by_date (tuple): The same transactions sorted by date
+        """
+        self.version = version
+        self.transactions = transactions
+        self._by_date = by_date
+
+    def __len__(self):
+        return len(self.transactions)
+
+    def __iter__(self):
+        return iter(self.transactions)
+
+    def __getitem__(self, position):
+        return self.transactions[position]
+
+    def __bool__(self):
+        return bool(self.transactions)
+
+    def __repr__(self):
+        return f"LedgerSnapshot(version={self.version}, transactions={len(self)})"
+
+    def by_date(self, reverse=False):
+        """
+        Iterate in date order without sorting
+
+        Args:
+            reverse (bool): Newest first
+
+        Returns:
+            iterator: Transactions in date order
+        """
+        return reversed(self._by_date) if reverse else iter(self._by_date)
+
+    @property
+    def sorted_by_date(self):
+        """Transactions in date order as a tuple (supports indexing, e.g. for paging)"""
+        return self._by_date
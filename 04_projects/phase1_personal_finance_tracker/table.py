@@ -0,0 +1,243 @@
+"""
+Table Module - Buffered terminal output
+
+LEARNING OBJECTIVES:
+- Computing a layout once and reusing it for every row
+- Building output in memory and writing it with one call
+- Why many small print() calls are slow (each one is a write)
+
+HOW IT WORKS:
+- Table works out its column widths once per render, builds one
+  format template from them and formats every row with it.
+- Screen collects a whole screen (headers, lines, tables) in a list
+  and writes it to the terminal with a single sys.stdout.write.
+- ASCII mode drops emoji and other non-ASCII characters when the
+  screen is written; this suits plain terminals, logs and pipes.
+  Turn it on with set_ascii(True) or FINANCE_TRACKER_ASCII=1.
+
+USAGE:
+    screen = Screen()
+    screen.header("ALL TRANSACTIONS")
+    table = Table([('Date', TEXT), ('Amount', CURRENCY)])
+    screen.table(table, [[t.date, t.amount] for t in rows])
+    screen.flush()
+"""
+
+import os
+import sys
+
+
+# Column kinds tell tables and renderers how to format a value
+TEXT = 'text'
+CURRENCY = 'currency'
+PERCENT = 'percent'
+COUNT = 'count'
+
+ASCII_ENV = 'FINANCE_TRACKER_ASCII'
+
+_ascii = os.environ.get(ASCII_ENV) == '1'
+
+
+def set_ascii(enabled):
+    """Turn plain-ASCII output on or off"""
+    global _ascii
+    _ascii = bool(enabled)
+
+
+def ascii_mode():
+    """True when output is limited to plain ASCII"""
+    return _ascii
+
+
+def to_ascii(text):
+    """Drop non-ASCII characters (emoji, symbols) and the space after a dropped icon"""
+    if text.isascii():
+        return text
+    kept = []
+    after_icon = False
+    for char in text:
+        if not char.isascii():
+            after_icon = True
+        elif char == ' ' and after_icon:
+            continue
+        else:
+            kept.append(char)
+            after_icon = False
+    return ''.join(kept)
+
+
+def format_value(value, kind):
+    """
+    Format one value for display
+
+    Args:
+        value: Value to format (None is shown as n/a)
+        kind (str): TEXT, CURRENCY, PERCENT or COUNT
+
+    Returns:
+        str: Formatted text
+    """
+    if value is None:
+        return 'n/a'
+    if kind == CURRENCY:
+        return f"${value:,.2f}"
+    if kind == PERCENT:
+        return f"{value:.1f}%"
+    return str(value)
+
+
+class Table:
+    """
+    Fixed-layout text table
+
+    Text columns are left-aligned, numbers right-aligned. A column
+    without a fixed width is as wide as its widest value (up to
+    max_width); longer text is cut off. Numbers are never cut: for a
+    number column the width is a minimum and grows to fit its values.
+    """
+
+    def __init__(self, columns, max_width=30, gap=2):
+        """
+        Initialize table
+
+        Args:
+            columns (list): (name, kind) or (name, kind, width) tuples
+            max_width (int): Widest automatic column
+            gap (int): Spaces between columns
+        """
+        self.columns = [tuple(column) + (None,) * (3 - len(column)) for column in columns]
+        self.max_width = max_width
+        self.gap = gap
+
+    def format_rows(self, rows):
+        """
+        Format every value of every row
+
+        Returns:
+            list: Rows of strings
+        """
+        kinds = [kind for _, kind, _ in self.columns]
+        return [[format_value(value, kind) for value, kind in zip(row, kinds)]
+                for row in rows]
+
+    def layout(self, cell_rows, header=True):
+        """
+        Compute column widths (text columns may cut values, number
+        columns widen to fit them)
+
+        Args:
+            cell_rows (list): Formatted rows (from format_rows)
+            header (bool): Include the header names in the widths
+
+        Returns:
+            list: Width of each column
+        """
+        widths = []
+        for position, (name, kind, width) in enumerate(self.columns):
+            longest = max((len(row[position]) for row in cell_rows), default=0)
+            if kind != TEXT:
+                width = max(width or 0, longest, len(name) if header else 0)
+            elif width is None:
+                width = longest
+                if header:
+                    width = max(width, len(name))
+                width = min(width, self.max_width)
+            widths.append(width)
+        return widths
+
+    def render(self, rows, header=True, indent=''):
+        """
+        Render rows as text
+
+        STEP 1: Format all values
+        STEP 2: Compute the layout once
+        STEP 3: Build one template and apply it to every row
+
+        Args:
+            rows (iterable): Rows of raw values in column order
+            header (bool): Add a header line and a rule under it
+            indent (str): Prefix of every line
+
+        Returns:
+            str: Table text (one line per row, newline-terminated)
+        """
+        # STEP 1 & 2: Format and measure
+        cell_rows = self.format_rows(rows)
+        widths = self.layout(cell_rows, header)
+
+        # STEP 3: Template
+        separator = ' ' * self.gap
+        template = indent + separator.join(
+            f"{{:<{width}.{width}}}" if kind == TEXT else f"{{:>{width}}}"
+            for (_, kind, _), width in zip(self.columns, widths)) + "\n"
+
+        lines = []
+        if header:
+            lines.append(template.format(*(name for name, _, _ in self.columns)))
+            lines.append(indent + '-' * (sum(widths) + self.gap * (len(widths) - 1)) + "\n")
+        lines.extend(template.format(*cells) for cells in cell_rows)
+        return ''.join(lines)
+
+
+class Screen:
+    """
+    Collects a screen of output and writes it in one call
+    """
+
+    def __init__(self, width=60, stream=None):
+        """
+        Initialize an empty screen
+
+        Args:
+            width (int): Width of headers and rules
+            stream: Output stream (default: sys.stdout at flush time)
+        """
+        self.width = width
+        self.stream = stream
+        self._parts = []
+
+    def line(self, text=''):
+        """Add one line"""
+        self._parts.append(text + "\n")
+        return self
+
+    def lines(self, texts):
+        """Add several lines"""
+        self._parts.extend(text + "\n" for text in texts)
+        return self
+
+    def block(self, text):
+        """Add text that already ends with a newline (e.g. a rendered report)"""
+        self._parts.append(text)
+        return self
+
+    def rule(self, char='-'):
+        """Add a horizontal rule"""
+        self._parts.append(char * self.width + "\n")
+        return self
+
+    def header(self, title):
+        """Add a centered title between two double rules"""
+        rule = "=" * self.width
+        self._parts.append(f"{rule}\n{title.center(self.width)}\n{rule}\n")
+        return self
+
+    def table(self, table, rows, header=True, indent=''):
+        """Add a rendered table"""
+        self._parts.append(table.render(rows, header, indent))
+        return self
+
+    def text(self):
+        """Everything collected so far"""
+        text = ''.join(self._parts)
+        return to_ascii(text) if _ascii else text
+
+    def flush(self):
+        """Write the screen with a single call and start a new one"""
+        (self.stream or sys.stdout).write(self.text())
+        self._parts = []
+
+
+def show(text=''):
+    """Write one line (honours ASCII mode)"""
+    Screen().line(text).flush()
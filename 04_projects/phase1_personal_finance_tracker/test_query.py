@@ -0,0 +1,87 @@
+"""
+Tests for query.py - sorting and the planner's access paths
+
+Run with:
+    python -m unittest test_query
+"""
+
+import random
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+from file_handler import FileHandler
+from query import SORT_FIELDS, _sort_key
+from transaction import Transaction, TransactionManager
+
+
+CATEGORIES = ['Food', 'Transport', 'Utilities', 'Entertainment', 'Shopping']
+WORDS = ['coffee', 'lunch', 'bus', 'rent', 'cinema', 'books', 'power', 'taxi']
+
+
+class OrderByTest(unittest.TestCase):
+    """order_by must sort whichever index the planner picks"""
+
+    def setUp(self):
+        self._data_dir = tempfile.TemporaryDirectory()
+        self.manager = TransactionManager(FileHandler(self._data_dir.name))
+        rng = random.Random(7)
+        self.manager.add_transactions([
+            Transaction(rng.choice(['income', 'expense']),
+                        round(rng.uniform(1, 500), 2),
+                        rng.choice(CATEGORIES),
+                        f"{rng.choice(WORDS)} {rng.choice(WORDS)}",
+                        date(2026, 1, 1) + timedelta(days=rng.randrange(365)))
+            for _ in range(500)])
+
+    def tearDown(self):
+        self._data_dir.cleanup()
+
+    def assertSorted(self, query, field, reverse):
+        """Results hold the expected rows, in the order of `field`"""
+        rows = query.all()
+        expected = sorted(query.order_by('date').limit(None), key=_sort_key(field),
+                          reverse=reverse)
+        if query._limit is not None:
+            expected = expected[:query._limit]
+        key = _sort_key(field)
+        self.assertEqual([key(t) for t in rows], [key(t) for t in expected])
+        if query._limit is None:
+            self.assertEqual({t.key for t in rows}, {t.key for t in expected})
+
+    def test_every_field_through_every_index(self):
+        base = self.manager.query()
+        filtered = {
+            'scan': base,
+            'type': base.of_type('income'),
+            'category': base.in_categories('Food', 'Transport'),
+            'date': base.between(date(2026, 3, 1), date(2026, 5, 31)),
+            'amount': base.amount_between(100, 200),
+            'text': base.search('coffee'),
+        }
+        for path, query in filtered.items():
+            for field in SORT_FIELDS:
+                for reverse in (False, True):
+                    for limit in (None, 5):
+                        with self.subTest(path=path, field=field, reverse=reverse,
+                                          limit=limit):
+                            self.assertSorted(query.order_by(field, reverse).limit(limit),
+                                              field, reverse)
+
+    def test_non_indexed_fields_from_unordered_indexes(self):
+        # The category and type indexes are unordered, so their rows
+        # must still be sorted
+        query = self.manager.query().in_categories('Food').order_by('category')
+        self.assertIn('category', query.explain())
+        self.assertSorted(query, 'category', False)
+        query = self.manager.query().of_type('expense').order_by('description', True)
+        self.assertSorted(query, 'description', True)
+
+    def test_amount_order_streams_from_amount_index(self):
+        query = self.manager.query().order_by('amount', reverse=True).limit(10)
+        self.assertIn('amount', query.explain())
+        self.assertSorted(query, 'amount', True)
+
+
+if __name__ == "__main__":
+    unittest.main()
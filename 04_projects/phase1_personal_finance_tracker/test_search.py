@@ -0,0 +1,42 @@
+"""
+Tests for search.py - parsing search strings
+
+Run with:
+    python -m unittest test_search
+"""
+
+import unittest
+from datetime import date
+
+from search import InvertedIndex, parse_search
+from transaction import Transaction
+
+
+class ParseSearchTest(unittest.TestCase):
+    """Tokens without words must not change the query"""
+
+    def setUp(self):
+        self.index = InvertedIndex()
+        self.coffee = Transaction('expense', 4.5, 'Food', 'Coffee shop', date(2026, 1, 5))
+        self.coffeemaker = Transaction('expense', 60, 'Shopping', 'Coffeemaker',
+                                       date(2026, 1, 9))
+        self.index.add(self.coffee)
+        self.index.add(self.coffeemaker)
+
+    def test_bare_star_after_word_is_ignored(self):
+        self.assertEqual(parse_search("coffee *"), [[('coffee', False)]])
+        self.assertEqual(self.index.search("coffee *"), {self.coffee.key})
+
+    def test_bare_star_alone_matches_nothing(self):
+        self.assertEqual(parse_search("*"), [])
+        self.assertEqual(self.index.search("*"), set())
+        self.assertEqual(parse_search("* OR coffee*"), [[('coffee', True)]])
+
+    def test_prefix_marks_last_word_of_token(self):
+        self.assertEqual(parse_search("amazon.co*"), [[('amazon', False), ('co', True)]])
+        self.assertEqual(self.index.search("coffee*"),
+                         {self.coffee.key, self.coffeemaker.key})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,8 +15,20 @@ LEARNING OBJECTIVES:
 - Date/time operations
 """
 
+from contextlib import contextmanager
 from datetime import datetime
-import uuid
+
+from ids import new_transaction_id, format_transaction_id, transaction_key
+from indexes import KeyIndex, DateIndex, AmountIndex
+from query import TransactionQuery
+from search import InvertedIndex
+from fuzzy import TrigramIndex, normalize_description, cluster_descriptions
+from duplicates import DuplicateIndex
+from rollup import RollupCube
+from cashflow import CashFlowSeries
+from sketches import DistributionIndex
+from snapshot import LedgerSnapshot
+from utils import month_bounds, split_date_range
 
 
 class Transaction:
@@ -24,7 +36,8 @@ class Transaction:
     Represents a single financial transaction
     
     ATTRIBUTES:
-    - id: Unique identifier
+    - id: Unique identifier (text form)
+    - key: Compact, time-ordered form of the ID (see ids.py)
     - type: 'income' or 'expense'
     - amount: Transaction amount (positive float)
     - category: Transaction category
@@ -32,6 +45,10 @@ class Transaction:
     - date: Transaction date
     """
     
+    # Fixed attribute set - no per-object __dict__, which saves memory
+    # when millions of transactions are loaded
+    __slots__ = ('key', 'type', 'amount', 'category', 'description', 'date')
+    
     def __init__(self, trans_type, amount, category, description, date=None):
         """
         Initialize a new transaction
@@ -56,8 +73,8 @@ class Transaction:
         if amount <= 0:
             raise ValueError("Amount must be positive")
         
-        # STEP 3: Generate unique ID
-        self.id = str(uuid.uuid4())
+        # STEP 3: Generate unique, time-ordered ID
+        self.key = new_transaction_id()
         
         # STEP 4: Set transaction data
         self.type = trans_type
@@ -66,6 +83,16 @@ class Transaction:
         self.description = description
         self.date = date if date else datetime.now().date()
     
+    @property
+    def id(self):
+        """Text form of the ID (as written to files)"""
+        return format_transaction_id(self.key)
+    
+    @id.setter
+    def id(self, text_id):
+        """Restore an ID read from a file"""
+        self.key = transaction_key(text_id)
+    
     def to_dict(self):
         """
         Convert transaction to dictionary
@@ -82,6 +109,31 @@ class Transaction:
             'date': str(self.date)
         }
     
+    @classmethod
+    def from_dict(cls, trans_dict):
+        """
+        Create transaction from a dictionary (see to_dict)
+        
+        Args:
+            trans_dict (dict): Transaction data with its ID
+            
+        Returns:
+            Transaction: New transaction object with the original ID
+            
+        Raises:
+            ValueError, KeyError: When a field is invalid or missing
+        """
+        date = datetime.strptime(trans_dict['date'], "%Y-%m-%d").date()
+        transaction = cls(
+            trans_dict['type'],
+            trans_dict['amount'],
+            trans_dict['category'],
+            trans_dict['description'],
+            date
+        )
+        transaction.id = trans_dict['id']
+        return transaction
+    
     def to_file_format(self):
         """
         Convert transaction to file storage format
@@ -149,8 +201,55 @@ class TransactionManager:
     - Filter and search transactions
     - Calculate totals and balances
     - Integrate with file handler for persistence
+    
+    INDEXES:
+    - id_index: {key: transaction} for O(1) lookups
+    - type_index / category_index: transactions grouped by key
+    - date_index: transactions sorted by date for range queries
+    - amount_index: transactions sorted by amount (amount-range filters)
+    - text_index: description words -> transactions (full-text search)
+    - description_index / trigram_index: normalized descriptions and
+      their trigrams (fuzzy search, merchant grouping)
+    - duplicate_index: (fingerprint, day) -> transactions (duplicate checks)
+    
+    AGGREGATES:
+    - rollup: (year, month, type, category) -> (sum, count) for reports
+    
+    VERSIONS AND SNAPSHOTS:
+    `version` goes up by one on every change. snapshot() returns a
+    read-only LedgerSnapshot that is rebuilt only after a change.
+    Each month also has its own version (see months_version()), so
+    caches can tell which months were touched.
+    
+    BATCHING:
+    Every change is saved immediately, unless it happens inside
+    a `with manager.batch():` block. Then a single save runs when
+    the outermost block exits.
+    
+    DIRTY TRACKING:
+    `saved_version` is the version last written or loaded. Saving a
+    clean ledger does nothing. Added and deleted records are appended
+    to the journal (see FileHandler); the full file is rewritten only
+    when the journal grows past JOURNAL_LIMIT entries or on compact().
+    
+    LAZY INDEXES:
+    load_transactions(lazy_indexes=True) builds only the ID index, the
+    date index and the rollup cube. Every other index is built from the
+    transaction list the first time it is used, and kept up to date
+    from then on.
     """
     
+    JOURNAL_LIMIT = 1000
+    
+    # Left out by a lazy load and built on first use (see load_transactions)
+    LAZY_INDEXES = ('type_index', 'category_index', 'amount_index', 'text_index',
+                    'description_index', 'trigram_index', 'duplicate_index',
+                    'cash_flow', 'distribution')
+    
+    # Lazy indexes with add(transaction) / remove(transaction)
+    _PER_TRANSACTION = ('type_index', 'category_index', 'amount_index', 'text_index',
+                        'description_index', 'duplicate_index', 'cash_flow', 'distribution')
+    
     def __init__(self, file_handler):
         """
         Initialize transaction manager
@@ -160,6 +259,187 @@ class TransactionManager:
         """
         self.transactions = []
         self.file_handler = file_handler
+        
+        self.id_index = {}
+        self.type_index = KeyIndex(lambda t: t.type)
+        self.category_index = KeyIndex(lambda t: t.category)
+        self.date_index = DateIndex()
+        self.amount_index = AmountIndex()
+        self.text_index = InvertedIndex()
+        self.description_index = KeyIndex(lambda t: normalize_description(t.description))
+        self.trigram_index = TrigramIndex()
+        self._duplicate_config = (None, 0)
+        self.duplicate_index = DuplicateIndex()
+        self.rollup = RollupCube()
+        self.cash_flow = CashFlowSeries()
+        self.distribution = DistributionIndex(self.date_index)
+        
+        self.version = 0
+        self.month_versions = {}
+        self._generation = 0
+        self._snapshot = None
+        
+        self._batch_depth = 0
+        self._pending_save = False
+        
+        self.saved_version = 0
+        self._unsaved = []
+    
+    def _mark_changed(self, transactions=None):
+        """
+        Record that the transaction data changed
+        
+        Args:
+            transactions (iterable): The added/removed transactions, or
+                None when everything may have changed (e.g. after a load)
+        """
+        self.version += 1
+        if transactions is None:
+            self._generation += 1
+            self.month_versions = {}
+            return
+        for transaction in transactions:
+            month_key = (transaction.date.year, transaction.date.month)
+            self.month_versions[month_key] = self.month_versions.get(month_key, 0) + 1
+    
+    def months_version(self, months):
+        """
+        Combined version stamp for a set of months
+        
+        The stamp only changes when a transaction in one of these
+        months is added or deleted (or the ledger is reloaded).
+        
+        Args:
+            months (iterable): (year, month) tuples
+            
+        Returns:
+            tuple: Hashable stamp to compare against a cached one
+        """
+        versions = self.month_versions
+        return (self._generation,) + tuple(versions.get(month, 0) for month in months)
+    
+    def __getattr__(self, name):
+        """Build an index that a lazy load left out, on first use"""
+        if name not in self.LAZY_INDEXES:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        index = self._build_index(name)
+        setattr(self, name, index)
+        return index
+    
+    def _build_index(self, name):
+        """
+        Create one of LAZY_INDEXES, filled from the transaction list
+        
+        Args:
+            name (str): Index attribute name
+            
+        Returns:
+            The new index
+        """
+        transactions = self.transactions
+        
+        # Indexes that fill themselves in one pass
+        if name in ('amount_index', 'text_index', 'cash_flow', 'distribution'):
+            if name == 'amount_index':
+                index = AmountIndex()
+            elif name == 'text_index':
+                index = InvertedIndex()
+            elif name == 'cash_flow':
+                index = CashFlowSeries()
+            else:
+                index = DistributionIndex(self.date_index)
+            index.rebuild(transactions)
+            return index
+        
+        if name == 'trigram_index':
+            index = TrigramIndex()
+            for transaction in transactions:
+                index.add(normalize_description(transaction.description))
+            return index
+        
+        # Indexes filled one transaction at a time
+        if name == 'type_index':
+            index = KeyIndex(lambda t: t.type)
+        elif name == 'category_index':
+            index = KeyIndex(lambda t: t.category)
+        elif name == 'description_index':
+            index = KeyIndex(lambda t: normalize_description(t.description))
+        else:
+            index = DuplicateIndex(*self._duplicate_config)
+        for transaction in transactions:
+            index.add(transaction)
+        return index
+    
+    def _built_indexes(self, names):
+        """The indexes among `names` that exist (all of them unless loaded lazily)"""
+        built = self.__dict__
+        return [built[name] for name in names if name in built]
+    
+    def _index_transaction(self, transaction):
+        """Add one transaction to every index"""
+        self.id_index[transaction.key] = transaction
+        self.date_index.add(transaction)
+        self.rollup.add(transaction)
+        for index in self._built_indexes(self._PER_TRANSACTION):
+            index.add(transaction)
+        if 'trigram_index' in self.__dict__:
+            self.trigram_index.add(normalize_description(transaction.description))
+    
+    def _unindex_transaction(self, transaction):
+        """Remove one transaction from every index"""
+        self.id_index.pop(transaction.key, None)
+        self.date_index.remove(transaction)
+        self.rollup.remove(transaction)
+        for index in self._built_indexes(self._PER_TRANSACTION):
+            index.remove(transaction)
+        if 'trigram_index' in self.__dict__:
+            self.trigram_index.remove(normalize_description(transaction.description))
+    
+    def _index_many(self, transactions):
+        """Add several transactions to every index (sorted indexes merge once)"""
+        indexes = self._built_indexes([name for name in self._PER_TRANSACTION
+                                       if name != 'amount_index'])
+        trigrams = self.__dict__.get('trigram_index')
+        for transaction in transactions:
+            self.id_index[transaction.key] = transaction
+            self.rollup.add(transaction)
+            for index in indexes:
+                index.add(transaction)
+            if trigrams is not None:
+                trigrams.add(normalize_description(transaction.description))
+        self.date_index.add_many(transactions)
+        if 'amount_index' in self.__dict__:
+            self.amount_index.add_many(transactions)
+    
+    def _rebuild_indexes(self, lazy=False):
+        """
+        Rebuild every index from the transaction list
+        
+        Args:
+            lazy (bool): Build only the ID index, date index and rollup
+                cube now; the others are built when first used
+        """
+        self.id_index = {}
+        self.rollup.clear()
+        for transaction in self.transactions:
+            self.id_index[transaction.key] = transaction
+            self.rollup.add(transaction)
+        self.date_index.rebuild(self.transactions)
+        
+        for name in self.LAZY_INDEXES:
+            if lazy:
+                self.__dict__.pop(name, None)
+            else:
+                setattr(self, name, self._build_index(name))
+    
+    def query(self):
+        """
+        Start a lazy, chainable query
+        
+        Returns:
+            TransactionQuery: Query matching every transaction
+        """
+        return TransactionQuery(self)
     
     def add_transaction(self, transaction):
         """
@@ -176,11 +456,87 @@ class TransactionManager:
         if not isinstance(transaction, Transaction):
             raise TypeError("Must be a Transaction object")
         
-        # STEP 2: Add to list
+        # STEP 2: Add to list and indexes
         self.transactions.append(transaction)
+        self._index_transaction(transaction)
+        self._mark_changed([transaction])
+        self._unsaved.append(('add', transaction))
         
-        # STEP 3: Save immediately
-        self.save_transactions()
+        # STEP 3: Save immediately (or at the end of the current batch)
+        self._commit()
+    
+    def add_transactions(self, transactions, skip_duplicates=False):
+        """
+        Add many transactions with a single save
+        
+        STEP 1: Validate every transaction before changing anything
+        STEP 2: Add all of them to the list
+        STEP 3: Update the indexes in one pass
+        STEP 4: Save once
+        
+        Args:
+            transactions (iterable): Transaction objects to add
+            skip_duplicates (bool): Leave out rows that duplicate an
+                existing transaction or an earlier row of this batch
+            
+        Returns:
+            int: Number of transactions added
+        """
+        # STEP 1: Validate (all or nothing)
+        new_transactions = list(transactions)
+        for transaction in new_transactions:
+            if not isinstance(transaction, Transaction):
+                raise TypeError("Must be a Transaction object")
+        
+        if skip_duplicates:
+            new_transactions, _ = self.split_duplicates(new_transactions)
+        
+        if not new_transactions:
+            return 0
+        
+        # STEP 2: Add to list
+        self.transactions.extend(new_transactions)
+        
+        # STEP 3: Update indexes (the date index merges in one pass)
+        self._index_many(new_transactions)
+        self._mark_changed(new_transactions)
+        self._unsaved.extend(('add', transaction) for transaction in new_transactions)
+        
+        # STEP 4: Save once
+        self._commit()
+        return len(new_transactions)
+    
+    @contextmanager
+    def batch(self, save=True):
+        """
+        Defer saving until the block exits
+        
+        USAGE:
+            with manager.batch():
+                manager.add_transaction(t1)
+                manager.delete_transaction(old_id)
+            # Saved once here
+        
+        Blocks can be nested; only the outermost one saves.
+        
+        Args:
+            save (bool): Save when the block exits (False leaves the
+                save to the caller, e.g. to run it in another thread)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending_save and save:
+                self.save_transactions()
+    
+    def _commit(self):
+        """Save now, or remember to save when the current batch ends"""
+        if self._batch_depth:
+            self._pending_save = True
+        else:
+            self.save_transactions()
     
     def delete_transaction(self, transaction_id):
         """
@@ -197,24 +553,158 @@ class TransactionManager:
             bool: True if deleted, False if not found
         """
         # STEP 1: Find transaction
-        for i, trans in enumerate(self.transactions):
-            if trans.id == transaction_id:
-                # STEP 2: Remove
-                self.transactions.pop(i)
-                # STEP 3: Save
-                self.save_transactions()
-                return True
+        trans = self.id_index.get(transaction_key(transaction_id))
+        if trans is None:
+            return False
+        
+        # STEP 2: Remove from list and indexes
+        self.transactions.remove(trans)
+        self._unindex_transaction(trans)
+        self._mark_changed([trans])
+        self._unsaved.append(('delete', trans))
+        
+        # STEP 3: Save
+        self._commit()
+        return True
+    
+    def apply_external_changes(self, added=(), removed_ids=()):
+        """
+        Apply changes that are already on disk
+        
+        They were written by another program, or by this one through
+        save_before_adding().
+        
+        Works like add_transactions/delete_transaction, but nothing is
+        saved and the changes do not count as unsaved: a clean ledger
+        stays clean. Removals run first, then additions.
+        
+        An addition with a known ID replaces that transaction, as a
+        repeated ID does when the journal is loaded - unless the record
+        is the same, then it is skipped. Removals of unknown IDs are
+        skipped too, so replaying the same change twice is harmless.
+        
+        Args:
+            added (iterable): Transaction objects with their original IDs
+            removed_ids (iterable): IDs of deleted transactions
+            
+        Returns:
+            tuple: (number added, number removed) - a replaced
+                transaction counts as both
+        """
+        was_clean = not self.is_dirty
+        
+        # Removals
+        removed = []
+        for trans_id in removed_ids:
+            trans = self.id_index.get(transaction_key(trans_id))
+            if trans is not None:
+                self._unindex_transaction(trans)
+                removed.append(trans)
+        
+        # Additions (a changed record replaces the loaded one)
+        new_transactions = {}
+        for trans in added:
+            current = new_transactions.get(trans.key) or self.id_index.get(trans.key)
+            if current is not None and current.to_dict() == trans.to_dict():
+                continue
+            if current is not None and trans.key not in new_transactions:
+                self._unindex_transaction(current)
+                removed.append(current)
+            new_transactions[trans.key] = trans
+        new_transactions = list(new_transactions.values())
         
-        return False
+        # One pass over the list for every removal
+        if removed:
+            removed_keys = {trans.key for trans in removed}
+            self.transactions = [t for t in self.transactions if t.key not in removed_keys]
+        if new_transactions:
+            self.transactions.extend(new_transactions)
+            self._index_many(new_transactions)
+        
+        if removed or new_transactions:
+            self._mark_changed(removed + new_transactions)
+            if was_clean:
+                self.saved_version = self.version
+        return len(new_transactions), len(removed)
+    
+    def sync_with_records(self, transaction_dicts):
+        """
+        Bring memory in line with the records on disk, changing only what differs
+        
+        STEP 1: Match records to loaded transactions by ID
+        STEP 2: Collect new, missing and changed records
+        STEP 3: Apply them with apply_external_changes
+        
+        Unsaved changes of this program are not on disk yet and are
+        kept: its own new transactions are not removed and its own
+        deletions are not undone.
+        
+        Args:
+            transaction_dicts (list): Every transaction record on disk
+        
+        Returns:
+            tuple: (number added, number removed) - a changed record
+                counts as both
+        """
+        # STEP 1: Records by key
+        on_disk = {}
+        for trans_dict in transaction_dicts:
+            try:
+                on_disk[transaction_key(trans_dict['id'])] = trans_dict
+            except (ValueError, KeyError, TypeError):
+                print(f"Warning: Skipping invalid transaction: {trans_dict}")
+        
+        pending_adds = {trans.key for op, trans in self._unsaved if op == 'add'}
+        pending_deletes = {trans.key for op, trans in self._unsaved if op == 'delete'}
+        
+        # STEP 2: Differences
+        removed_ids = []
+        added = []
+        for trans in self.transactions:
+            record = on_disk.pop(trans.key, None)
+            if record is None:
+                if trans.key not in pending_adds:
+                    removed_ids.append(trans.id)
+            elif record != trans.to_dict():
+                removed_ids.append(trans.id)
+                added.append(record)
+        added.extend(record for key, record in on_disk.items()
+                     if key not in pending_deletes)
+        
+        # STEP 3: Apply
+        new_transactions = []
+        for trans_dict in added:
+            try:
+                new_transactions.append(Transaction.from_dict(trans_dict))
+            except (ValueError, KeyError) as e:
+                print(f"Warning: Skipping invalid transaction: {trans_dict}")
+                print(f"Error: {e}")
+        return self.apply_external_changes(new_transactions, removed_ids)
+    
+    def snapshot(self):
+        """
+        Get a read-only snapshot of the current version
+        
+        STEP 1: Reuse the cached snapshot if nothing changed
+        STEP 2: Otherwise copy the list (and date order) once
+        
+        Returns:
+            LedgerSnapshot: Immutable view tied to `version`
+        """
+        if self._snapshot is None or self._snapshot.version != self.version:
+            self._snapshot = LedgerSnapshot(self.version,
+                                            tuple(self.transactions),
+                                            tuple(self.date_index))
+        return self._snapshot
     
     def get_all_transactions(self):
         """
         Get all transactions
         
         Returns:
-            list: List of all transactions
+            LedgerSnapshot: Read-only sequence of all transactions
         """
-        return self.transactions.copy()
+        return self.snapshot()
     
     def get_transactions_by_type(self, trans_type):
         """
@@ -226,7 +716,7 @@ class TransactionManager:
         Returns:
             list: Filtered transactions
         """
-        return [t for t in self.transactions if t.type == trans_type]
+        return list(self.type_index.get(trans_type))
     
     def get_transactions_by_date_range(self, start_date, end_date):
         """
@@ -239,8 +729,7 @@ class TransactionManager:
         Returns:
             list: Transactions within date range
         """
-        return [t for t in self.transactions 
-                if start_date <= t.date <= end_date]
+        return list(self.date_index.iter_between(start_date, end_date))
     
     def get_transactions_by_category(self, category):
         """
@@ -252,21 +741,150 @@ class TransactionManager:
         Returns:
             list: Transactions in category
         """
-        return [t for t in self.transactions if t.category == category]
+        return list(self.category_index.get(category))
+    
+    def search_transactions(self, text, start_date=None, end_date=None,
+                            categories=None, trans_type=None):
+        """
+        Full-text search combined with the usual filters
+        
+        Args:
+            text (str): Search string, e.g. "amazon OR uber*" (see search.py)
+            start_date (datetime.date): First date, or None
+            end_date (datetime.date): Last date, or None
+            categories (list): Category names, or None for all
+            trans_type (str): 'income', 'expense' or None for both
+            
+        Returns:
+            list: Matching transactions, newest first
+        """
+        query = (self.query()
+                 .search(text)
+                 .between(start_date, end_date)
+                 .of_type(trans_type)
+                 .order_by('date', reverse=True))
+        if categories:
+            query = query.in_categories(*categories)
+        return query.all()
+    
+    def configure_duplicate_detection(self, fingerprint=None, date_window=0):
+        """
+        Change how duplicates are recognized (rebuilds the duplicate index)
+        
+        Args:
+            fingerprint: Function returning a hashable fingerprint
+                (default: type, amount in cents, normalized description)
+            date_window (int): Also match this many days before/after
+        """
+        self._duplicate_config = (fingerprint, date_window)
+        self.duplicate_index = self._build_index('duplicate_index')
+    
+    def find_duplicates(self, transaction):
+        """
+        Find existing transactions that look like duplicates
+        
+        Args:
+            transaction (Transaction): New (or existing) transaction
+            
+        Returns:
+            list: Possible duplicates (empty when unique)
+        """
+        return self.duplicate_index.find(transaction)
+    
+    def split_duplicates(self, transactions):
+        """
+        Separate a batch into unique rows and duplicates
+        
+        A row counts as a duplicate if it matches an existing
+        transaction or an earlier row of the same batch.
+        
+        Args:
+            transactions (iterable): Transactions to check
+            
+        Returns:
+            tuple: (unique_list, duplicate_list)
+        """
+        seen = DuplicateIndex(self.duplicate_index.fingerprint,
+                              self.duplicate_index.date_window)
+        unique = []
+        duplicates = []
+        for transaction in transactions:
+            if self.duplicate_index.find(transaction) or seen.find(transaction):
+                duplicates.append(transaction)
+            else:
+                unique.append(transaction)
+                seen.add(transaction)
+        return unique, duplicates
+    
+    def fuzzy_search(self, text, limit=10, threshold=0.3):
+        """
+        Find transactions with descriptions similar to the text
+        
+        Tolerates typos and noise, e.g. "amazn mktplace" finds
+        "AMAZON MKTPLACE*2X4Y".
+        
+        Args:
+            text (str): Description to look for
+            limit (int): Maximum number of distinct descriptions
+            threshold (float): Minimum trigram similarity (0.0 - 1.0)
+            
+        Returns:
+            list: [(similarity, transaction), ...] best first
+        """
+        results = []
+        matches = self.trigram_index.lookup(normalize_description(text), limit, threshold)
+        for score, description in matches:
+            for trans in self.description_index.get(description):
+                results.append((score, trans))
+        return results
+    
+    def group_by_merchant(self, normalizer=None, threshold=0.5):
+        """
+        Group transactions by merchant
+        
+        STEP 1: Use the merchant table for descriptions it knows
+        STEP 2: Cluster the remaining distinct descriptions by similarity
+        STEP 3: Collect the transactions of each merchant
+        
+        Args:
+            normalizer (MerchantNormalizer): Optional merchant table
+            threshold (float): Minimum similarity for clustering
+            
+        Returns:
+            dict: {merchant: [transactions]}
+        """
+        # STEP 1: Known merchants
+        merchant_of = {}
+        unknown = {}
+        for description in self.description_index.keys():
+            merchant = normalizer.normalize(description) if normalizer else None
+            if merchant is None:
+                unknown[description] = self.description_index.count(description)
+            else:
+                merchant_of[description] = merchant
+        
+        # STEP 2: Similarity clusters (named after their most common description)
+        merchant_of.update(cluster_descriptions(unknown, threshold))
+        
+        # STEP 3: Group
+        groups = {}
+        for description, merchant in merchant_of.items():
+            groups.setdefault(merchant, []).extend(self.description_index.get(description))
+        return groups
     
     def get_totals(self):
         """
         Calculate total income and expenses
         
-        STEP 1: Sum all income transactions
-        STEP 2: Sum all expense transactions
-        STEP 3: Return both totals
+        Read from the all-time totals of the rollup cube (one entry per
+        type and category), so this does not scan the transactions.
         
         Returns:
             tuple: (total_income, total_expense)
         """
-        income_total = sum(t.amount for t in self.transactions if t.type == 'income')
-        expense_total = sum(t.amount for t in self.transactions if t.type == 'expense')
+        totals = self.rollup.all_time()
+        income_total = sum(total for total, _ in totals['income'].values())
+        expense_total = sum(total for total, _ in totals['expense'].values())
         
         return income_total, expense_total
     
@@ -277,46 +895,164 @@ class TransactionManager:
         Returns:
             float: Balance (income - expenses)
         """
-        income, expense = self.get_totals()
-        return income - expense
+        return self.cash_flow.total
     
-    def save_transactions(self):
+    def get_balance_as_of(self, day):
         """
-        Save all transactions to JSON file
+        Balance at the end of a given day
         
-        STEP 1: Pass transaction list to file handler
-        STEP 2: File handler converts to JSON format
+        Args:
+            day (datetime.date): Day (inclusive)
+            
+        Returns:
+            float: Income minus expenses up to and including that day
         """
-        self.file_handler.save_transactions(self.transactions)
+        return self.cash_flow.balance_as_of(day)
     
-    def load_transactions(self):
+    def get_net_between(self, start_date, end_date):
+        """
+        Net cash flow over a date range (both days inclusive)
+        
+        Returns:
+            float: Income minus expenses in the range
+        """
+        return self.cash_flow.net_between(start_date, end_date)
+    
+    def get_cash_flow_series(self, start_date, end_date, step_days=1):
+        """
+        Running balance series, e.g. for a daily or weekly chart
+        
+        Args:
+            start_date (datetime.date): First day
+            end_date (datetime.date): Last day
+            step_days (int): Days per point (1 = daily, 7 = weekly)
+            
+        Returns:
+            list: (day, net flow, balance) tuples
+        """
+        return list(self.cash_flow.running_balance(start_date, end_date, step_days))
+    
+    @property
+    def is_dirty(self):
+        """True when there are changes that have not been saved"""
+        return self.version != self.saved_version
+    
+    def save_transactions(self, full=False):
+        """
+        Save changes to the JSON file
+        
+        STEP 1: Nothing changed since the last save or load - no I/O
+        STEP 2: Record changes while the journal is short - append them
+        STEP 3: Otherwise rewrite the whole file (folds the journal in)
+        
+        Args:
+            full (bool): Rewrite the whole file even if it is clean
+            
+        Returns:
+            bool: True if anything was written; False when clean or when
+                the write failed (the changes then stay unsaved)
+        """
+        self._pending_save = False
+        
+        # STEP 1: Clean
+        if not self.is_dirty and not full:
+            return False
+        
+        # STEP 2: Journal
+        handler = self.file_handler
+        if not full and self._unsaved \
+                and handler.journal_entries + len(self._unsaved) <= self.JOURNAL_LIMIT:
+            written = handler.append_journal([
+                {'op': 'add', 'transaction': trans.to_dict()} if op == 'add'
+                else {'op': 'delete', 'id': trans.id}
+                for op, trans in self._unsaved])
+        
+        # STEP 3: Full rewrite
+        else:
+            written = handler.save_transactions(self.transactions)
+        
+        if not written:
+            return False
+        self._unsaved = []
+        self.saved_version = self.version
+        return True
+    
+    def compact(self):
+        """
+        Rewrite the file in date order and fold in the journal
+        
+        Returns:
+            bool: True if the file was written
+        """
+        self.transactions = list(self.date_index)
+        return self.save_transactions(full=True)
+    
+    def save_before_adding(self, transactions):
+        """
+        Write new transactions to disk before they are added to memory
+        
+        For writers whose readers must never see unsaved rows (see
+        server.py): write first, then add them with
+        apply_external_changes() once this returned True. Memory is
+        only read here, so it may run in another thread while readers
+        use the ledger.
+        
+        STEP 1: Unsaved changes would be skipped - refuse
+        STEP 2: Append the new records while the journal is short
+        STEP 3: Otherwise rewrite the whole file with them included
+        
+        Args:
+            transactions (list): New Transaction objects
+        
+        Returns:
+            bool: True if they were written
+        """
+        # STEP 1: Only a clean ledger is on disk exactly as in memory
+        if self.is_dirty:
+            print("Warning: Save the ledger before writing new transactions ahead")
+            return False
+        
+        # STEP 2: Journal
+        handler = self.file_handler
+        if handler.journal_entries + len(transactions) <= self.JOURNAL_LIMIT:
+            return handler.append_journal([{'op': 'add', 'transaction': trans.to_dict()}
+                                           for trans in transactions])
+        
+        # STEP 3: Full rewrite
+        return handler.save_transactions(self.transactions + list(transactions))
+
+    def load_transactions(self, lazy_indexes=False):
         """
         Load transactions from JSON file
         
-        STEP 1: Load transaction dictionaries from file
+        STEP 1: Load transaction dictionaries from file (journal applied)
         STEP 2: Convert each dictionary to Transaction object
         STEP 3: Add to transactions list
+        STEP 4: Rebuild indexes once
+        
+        Args:
+            lazy_indexes (bool): Build only the ID index, date index and
+                rollup cube now; every other index (LAZY_INDEXES) is built
+                the first time it is used. Suits short runs that read a
+                few things, like the command line.
         """
         transaction_dicts = self.file_handler.load_transactions()
         self.transactions = []
         
         for trans_dict in transaction_dicts:
             try:
-                # Create transaction from dictionary
-                date = datetime.strptime(trans_dict['date'], "%Y-%m-%d").date()
-                transaction = Transaction(
-                    trans_dict['type'],
-                    trans_dict['amount'],
-                    trans_dict['category'],
-                    trans_dict['description'],
-                    date
-                )
-                # Restore the original ID
-                transaction.id = trans_dict['id']
-                self.transactions.append(transaction)
+                # Create transaction from dictionary (keeps the original ID)
+                self.transactions.append(Transaction.from_dict(trans_dict))
             except (ValueError, KeyError) as e:
                 print(f"Warning: Skipping invalid transaction: {trans_dict}")
                 print(f"Error: {e}")
+        
+        self._rebuild_indexes(lazy_indexes)
+        self._mark_changed()
+        
+        # What was just loaded is what is on disk
+        self._unsaved = []
+        self.saved_version = self.version
     
     def get_monthly_transactions(self, month, year):
         """
@@ -329,27 +1065,78 @@ class TransactionManager:
         Returns:
             list: Transactions for that month
         """
-        return [t for t in self.transactions 
-                if t.date.month == month and t.date.year == year]
+        start_date, end_date = month_bounds(month, year)
+        return list(self.date_index.iter_between(start_date, end_date))
     
-    def get_category_totals(self, trans_type=None):
+    def summarize_range(self, start_date=None, end_date=None):
+        """
+        Totals and counts per category for a date range
+        
+        STEP 1: No range - read the all-time totals of the rollup cube
+        STEP 2: Whole months inside the range come from the cube
+        STEP 3: Only the partial months at either end are read
+                transaction by transaction (via the date index)
+        
+        Args:
+            start_date (datetime.date): First day (default: no limit)
+            end_date (datetime.date): Last day (default: no limit)
+            
+        Returns:
+            dict: {'income': {category: (total, count)}, 'expense': {...}}
+        """
+        # STEP 1: Everything
+        if start_date is None and end_date is None:
+            return self.rollup.all_time()
+        
+        if start_date is not None and end_date is not None and start_date > end_date:
+            raise ValueError("Start date must not be after end date")
+        
+        # An open end stops at the first/last month with data; a range
+        # that ends before the data starts (or starts after it) is empty
+        known_months = self.rollup.months()
+        if not known_months:
+            return {'income': {}, 'expense': {}}
+        if start_date is None:
+            start_date = month_bounds(known_months[0][1], known_months[0][0])[0]
+        if end_date is None:
+            end_date = month_bounds(known_months[-1][1], known_months[-1][0])[1]
+        if start_date > end_date:
+            return {'income': {}, 'expense': {}}
+        
+        # STEP 2: Whole months
+        whole_months, partial_ranges = split_date_range(start_date, end_date)
+        summary = self.rollup.summarize(whole_months)
+        
+        # STEP 3: Partial months
+        for piece_start, piece_end in partial_ranges:
+            for trans in self.date_index.iter_between(piece_start, piece_end):
+                group = summary[trans.type]
+                total, count = group.get(trans.category, (0.0, 0))
+                group[trans.category] = (total + trans.amount, count + 1)
+        return summary
+    
+    def get_category_totals(self, trans_type=None, start_date=None, end_date=None):
         """
         Get totals grouped by category
         
+        Read from the incrementally maintained rollup cube, so this does
+        not scan the transactions.
+        
         Args:
             trans_type (str): Filter by type ('income'/'expense'), or None for all
+            start_date (datetime.date): First day (default: no limit)
+            end_date (datetime.date): Last day (default: no limit)
             
         Returns:
             dict: {category: total_amount}
         """
+        summary = self.summarize_range(start_date, end_date)
         category_totals = {}
         
-        transactions = self.transactions if trans_type is None else self.get_transactions_by_type(trans_type)
-        
-        for trans in transactions:
-            if trans.category in category_totals:
-                category_totals[trans.category] += trans.amount
-            else:
-                category_totals[trans.category] = trans.amount
+        for group_type in ('income', 'expense'):
+            if trans_type is not None and group_type != trans_type:
+                continue
+            for category, (total, _) in summary[group_type].items():
+                category_totals[category] = category_totals.get(category, 0) + total
         
         return category_totals
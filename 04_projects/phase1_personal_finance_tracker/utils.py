@@ -3,6 +3,10 @@ Utility Functions - Helper functions for the application
 """
 
 import os
+import calendar
+from datetime import date
+
+from table import Screen
 
 
 def clear_screen():
@@ -11,11 +15,8 @@ def clear_screen():
 
 
 def print_header(title):
-    """Print formatted header"""
-    width = 60
-    print("=" * width)
-    print(title.center(width))
-    print("=" * width)
+    """Print formatted header (one write)"""
+    Screen(60).header(title).flush()
 
 
 def format_currency(amount):
@@ -23,6 +24,79 @@ def format_currency(amount):
     return f"${amount:,.2f}"
 
 
+def month_bounds(month, year):
+    """
+    First and last day of a month
+
+    Args:
+        month (int): Month (1-12)
+        year (int): Year
+
+    Returns:
+        tuple: (first_date, last_date) as datetime.date objects
+    """
+    last_day = calendar.monthrange(year, month)[1]
+    return date(year, month, 1), date(year, month, last_day)
+
+
+def add_months(year, month, count):
+    """
+    Move (year, month) by a number of months (negative goes back)
+
+    Returns:
+        tuple: (year, month)
+    """
+    index = year * 12 + (month - 1) + count
+    return index // 12, index % 12 + 1
+
+
+def iter_months(first, last):
+    """
+    Iterate over months from first to last (inclusive)
+
+    Args:
+        first (tuple): (year, month) to start from
+        last (tuple): (year, month) to stop at
+
+    Yields:
+        tuple: (year, month)
+    """
+    year, month = first
+    while (year, month) <= last:
+        yield year, month
+        year, month = add_months(year, month, 1)
+
+
+def split_date_range(start_date, end_date):
+    """
+    Split a date range into whole months and partial-month pieces
+
+    EXAMPLE:
+        2026-01-15 .. 2026-04-10 ->
+        whole months:  [(2026, 2), (2026, 3)]
+        partial:       [(2026-01-15, 2026-01-31), (2026-04-01, 2026-04-10)]
+
+    Args:
+        start_date (datetime.date): First day (inclusive)
+        end_date (datetime.date): Last day (inclusive)
+
+    Returns:
+        tuple: (whole_months, partial_ranges)
+    """
+    whole_months = []
+    partial_ranges = []
+    for year, month in iter_months((start_date.year, start_date.month),
+                                   (end_date.year, end_date.month)):
+        first_day, last_day = month_bounds(month, year)
+        piece_start = max(first_day, start_date)
+        piece_end = min(last_day, end_date)
+        if piece_start == first_day and piece_end == last_day:
+            whole_months.append((year, month))
+        elif piece_start <= piece_end:
+            partial_ranges.append((piece_start, piece_end))
+    return whole_months, partial_ranges
+
+
 def get_valid_input(prompt, input_type=str, validator=None):
     """
     Get validated input from user
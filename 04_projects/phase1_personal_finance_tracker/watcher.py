@@ -0,0 +1,172 @@
+"""
+Watcher Module - Notice changes other programs make to the ledger files
+
+LEARNING OBJECTIVES:
+- Polling file metadata (size, modification time) instead of re-reading
+- Incremental updates: apply only what changed
+- Telling your own writes apart from someone else's
+
+HOW IT WORKS:
+poll() takes two os.stat calls - transactions.json and the journal -
+and compares them with what it saw last time. Nothing is read when
+nothing changed.
+
+- The journal grew: only the new lines are read (from the byte offset
+  where the last poll stopped) and applied. An add of a known ID
+  replaces that transaction, as it does when the journal is loaded.
+  Adds of records already in memory and deletes of unknown IDs change
+  nothing, so the entries this program appended itself are harmless.
+- transactions.json was rewritten by another program, or the journal
+  shrank: the file is loaded and compared with memory by transaction
+  ID. Only new, missing and changed records are applied.
+- A full save by this program is recognised by the size and time
+  FileHandler noted when it wrote the file, and ignored.
+
+Changes go through TransactionManager.apply_external_changes, which
+updates every index and aggregate record by record and saves nothing.
+Unsaved local changes are kept.
+
+Plain polling needs no extra packages and works on every platform;
+call poll() regularly, e.g. once per menu command.
+
+USAGE:
+    transaction_manager.load_transactions()
+    watcher = LedgerWatcher(transaction_manager)
+    ...
+    added, removed = watcher.poll()
+"""
+
+import os
+
+from ids import transaction_key
+from transaction import Transaction
+
+
+def file_signature(filepath):
+    """
+    Modification time and size of a file
+
+    Args:
+        filepath (str): Path to the file
+
+    Returns:
+        tuple or None: (st_mtime_ns, st_size), None if the file is missing
+    """
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class LedgerWatcher:
+    """
+    Applies changes made to a ledger's files by other programs
+    """
+
+    def __init__(self, transaction_manager):
+        """
+        Start watching (the ledger must already be loaded)
+
+        Args:
+            transaction_manager (TransactionManager): Loaded ledger
+        """
+        self.transaction_manager = transaction_manager
+        self.file_handler = transaction_manager.file_handler
+        self._remember_files()
+
+    def _remember_files(self):
+        """Take the current state of both files as seen"""
+        handler = self.file_handler
+        self._main = file_signature(handler.transactions_file)
+        self._journal = file_signature(handler.journal_file)
+        self._offset = self._journal[1] if self._journal else 0
+
+    def poll(self):
+        """
+        Check the files once and apply outside changes
+
+        STEP 1: Compare file signatures (no change - done)
+        STEP 2: transactions.json rewritten elsewhere - resync by ID
+        STEP 3: Journal shrank elsewhere - resync by ID
+        STEP 4: Journal grew - apply the new entries
+
+        Returns:
+            tuple: (number added, number removed), (0, 0) if unchanged
+        """
+        handler = self.file_handler
+
+        # STEP 1: Signatures
+        main = file_signature(handler.transactions_file)
+        journal = file_signature(handler.journal_file)
+        if main == self._main and journal == self._journal:
+            return 0, 0
+        if main is None:
+            # Missing for a moment (being replaced) - look again later
+            return 0, 0
+
+        # STEP 2: Full rewrite
+        if main != self._main:
+            if main != handler.last_write.get(handler.transactions_file):
+                return self.resync()
+            # Our own full save; the journal was folded into it
+            self._main = main
+            self._offset = 0
+
+        # STEP 3: Journal truncated or replaced
+        self._journal = journal
+        size = journal[1] if journal else 0
+        if size < self._offset:
+            return self.resync()
+
+        # STEP 4: New journal entries
+        if size == self._offset:
+            return 0, 0
+        entries, self._offset = handler.read_journal(self._offset)
+        return self._apply_entries(entries)
+
+    def _apply_entries(self, entries):
+        """
+        Apply journal entries in order
+
+        Args:
+            entries (list): Journal entries (see FileHandler.append_journal)
+
+        Returns:
+            tuple: (number added, number removed)
+        """
+        # Net changes first: deletes are applied before adds, so a
+        # delete cancels an earlier add of the same ID in this read
+        # (and still removes the version already in memory), while a
+        # later add wins
+        added = {}
+        removed = []
+        for entry in entries:
+            if entry.get('op') == 'add':
+                try:
+                    trans = Transaction.from_dict(entry['transaction'])
+                except (ValueError, KeyError, TypeError) as e:
+                    print(f"Warning: Skipping invalid journal entry: {entry} ({e})")
+                    continue
+                added[trans.key] = trans
+            elif entry.get('op') == 'delete':
+                if not isinstance(entry.get('id'), str):
+                    print(f"Warning: Skipping invalid journal entry: {entry}")
+                    continue
+                added.pop(transaction_key(entry['id']), None)
+                removed.append(entry['id'])
+        counts = self.transaction_manager.apply_external_changes(list(added.values()), removed)
+        # Entries this program wrote itself were counted when appended
+        self.file_handler.journal_entries += sum(counts)
+        return counts
+
+    def resync(self):
+        """
+        Compare the whole ledger on disk with memory and apply differences
+
+        Returns:
+            tuple: (number added, number removed)
+        """
+        records = self.file_handler.load_transactions()
+        self._remember_files()
+        return self.transaction_manager.sync_with_records(records)